@@ -0,0 +1,300 @@
+import sys
+import os
+import argparse
+import json
+import platform
+import time
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Game import BOARD_BACKENDS  # Import the board implementations
+from Code.MyBot import MyBot  # Import MyBot class (AI Player)
+
+# (rows, cols, k) configurations measured by default
+DEFAULT_CONFIGS = [(3, 3, 3), (5, 5, 4), (7, 7, 5), (10, 10, 5)]
+
+# Metric name suffixes and whether a larger value is better
+METRIC_DIRECTIONS = {"_per_sec": True, "_seconds": False}
+
+# Smallest time step the benchmark clock can measure
+TIMER_RESOLUTION = time.get_clock_info("perf_counter").resolution
+
+
+def seeded_positions(rows, cols, k, count, seed, backend="numpy"):
+    """
+    Builds reproducible mid-game positions by random play from an empty board.
+    Games stop after about a third of the board is filled, before anyone wins.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param count: Number of positions.
+    :param seed: Seed of the random generator.
+    :param backend: Board implementation, a key of Game.BOARD_BACKENDS.
+    :return: List of (board, player to move) tuples.
+    """
+    rng = np.random.default_rng(seed)
+    positions = []
+    for _ in range(count):
+        board = BOARD_BACKENDS[backend](rows, cols, k)
+        player = 1
+        for cell in rng.permutation(rows * cols)[: rows * cols // 3]:
+            row, col = divmod(int(cell), cols)
+            board.make_move(row, col, player)
+            if board.has_won_at(row, col, player):
+                board.undo_move(row, col)  # Keep the position undecided
+                break
+            player = 2 if player == 1 else 1
+        positions.append((board, player))
+    return positions
+
+
+def per_second(count, seconds):
+    """
+    :param count: Number of calls or nodes.
+    :param seconds: Time they took.
+    :return: Count per second. The time is clamped to the timer resolution,
+             since a run too quick for the clock measures 0 seconds.
+    """
+    return count / max(seconds, TIMER_RESOLUTION)
+
+
+def rate(operation, calls_per_run, min_time):
+    """
+    Measures how many calls per second an operation achieves.
+
+    :param operation: Function without arguments that performs calls_per_run calls.
+    :param calls_per_run: Number of measured calls one operation() performs.
+    :param min_time: Seconds to keep repeating the operation for.
+    :return: Calls per second.
+    """
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        operation()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return per_second(runs * calls_per_run, elapsed)
+
+
+def benchmark_config(rows, cols, k, positions, seed, depth, min_time, backend):
+    """
+    Measures the board operations and both bot modes on one configuration.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param positions: Number of seeded positions.
+    :param seed: Seed of the positions.
+    :param depth: Fixed search depth of the mode 3 moves.
+    :param min_time: Seconds each throughput measurement runs for.
+    :param backend: Board implementation, a key of Game.BOARD_BACKENDS.
+    :return: Dict mapping metric names to values.
+    """
+    boards = seeded_positions(rows, cols, k, positions, seed, backend)
+    results = {}
+
+    def has_won():
+        for board, _ in boards:
+            board.has_won(1)
+            board.has_won(2)
+
+    results["has_won_per_sec"] = rate(has_won, 2 * len(boards), min_time)
+
+    moves = [(board, player, board.available_moves()) for board, player in boards]
+
+    def make_move():
+        for board, player, available in moves:
+            for row, col in available:
+                board.make_move(row, col, player)
+                board.undo_move(row, col)
+
+    calls = sum(len(available) for _, _, available in moves)
+    results["make_move_per_sec"] = rate(make_move, calls, min_time)
+
+    bot = MyBot("Benchmark", 1, 3)
+
+    def evaluate_board():
+        for board, player in boards:
+            bot.evaluate_board(board, player)
+
+    results["evaluate_board_per_sec"] = rate(evaluate_board, len(boards), min_time)
+
+    grids = np.array([board.grid for board, _ in boards])
+    players = np.array([player for _, player in boards])
+    results["evaluate_boards_per_sec"] = rate(
+        lambda: bot.evaluate_boards(grids, k, players), len(boards), min_time
+    )
+
+    # Moves of a whole bot, timed once per position with a fresh bot so that
+    # no transposition table entries carry over
+    for mode in (2, 3):
+        seconds = nodes = 0
+        for board, player in boards:
+            bot = MyBot(
+                "Benchmark",
+                player,
+                mode,
+                time_limit=None,
+                max_depth=depth,
+                threat_nodes=0,
+            )
+            start = time.perf_counter()
+            bot.make_move(player, board, mode)
+            seconds += time.perf_counter() - start
+            nodes += bot.nodes
+        results[f"mode{mode}_move_seconds"] = seconds / len(boards)
+        if mode == 3:
+            results["mode3_nodes_per_sec"] = per_second(nodes, seconds)
+    return results
+
+
+def run_benchmarks(
+    configs=DEFAULT_CONFIGS,
+    positions=10,
+    seed=0,
+    depth=3,
+    min_time=0.2,
+    backend="numpy",
+):
+    """
+    Runs the benchmark matrix.
+
+    :param configs: List of (rows, cols, k) configurations.
+    :param positions: Number of seeded positions per configuration.
+    :param seed: Seed of the positions.
+    :param depth: Fixed search depth of the mode 3 moves.
+    :param min_time: Seconds each throughput measurement runs for.
+    :param backend: Board implementation, a key of Game.BOARD_BACKENDS.
+    :return: Dict with the settings, the machine and the results, keyed by
+             "RxCxK" and then by metric name.
+    """
+    report = {
+        "settings": {
+            "positions": positions,
+            "seed": seed,
+            "depth": depth,
+            "min_time": min_time,
+            "backend": backend,
+        },
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": {},
+    }
+    for rows, cols, k in configs:
+        report["results"][f"{rows}x{cols}x{k}"] = benchmark_config(
+            rows, cols, k, positions, seed, depth, min_time, backend
+        )
+    return report
+
+
+def higher_is_better(metric):
+    """
+    :param metric: A metric name.
+    :return: True if a larger value of the metric is an improvement.
+    """
+    for suffix, larger_is_better in METRIC_DIRECTIONS.items():
+        if metric.endswith(suffix):
+            return larger_is_better
+    raise ValueError(f"Unknown metric {metric}")
+
+
+def compare(baseline, current, tolerance=0.1):
+    """
+    Compares two benchmark reports metric by metric.
+
+    :param baseline: Report of the reference run, as returned by run_benchmarks.
+    :param current: Report of the run to check.
+    :param tolerance: Relative slowdown that still counts as noise, e.g. 0.1
+                      for 10%.
+    :return: A tuple (rows, regressions). rows holds a (config, metric,
+             baseline value, current value, change) tuple for every metric in
+             both reports, where change is the relative change in the "better"
+             direction (negative is slower); regressions holds the rows whose
+             change is below -tolerance.
+    """
+    rows = []
+    for config, metrics in baseline["results"].items():
+        for metric, base_value in metrics.items():
+            value = current["results"].get(config, {}).get(metric)
+            if value is None or not base_value:
+                continue
+            change = value / base_value - 1
+            if not higher_is_better(metric):
+                change = base_value / value - 1 if value else np.inf
+            rows.append((config, metric, base_value, value, change))
+    regressions = [row for row in rows if row[4] < -tolerance]
+    return rows, regressions
+
+
+def main():
+    """
+    Command-line entry point: runs the benchmarks or compares two reports.
+    Comparing exits with status 1 if there are regressions.
+    """
+    parser = argparse.ArgumentParser(description="MNK engine benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and write JSON")
+    run.add_argument(
+        "--configs",
+        nargs="+",
+        default=[f"{r}x{c}x{k}" for r, c, k in DEFAULT_CONFIGS],
+        help="Configurations as RxCxK",
+    )
+    run.add_argument("--positions", type=int, default=10)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--depth", type=int, default=3, help="Mode 3 search depth")
+    run.add_argument("--min-time", type=float, default=0.2)
+    run.add_argument("--backend", choices=sorted(BOARD_BACKENDS), default="numpy")
+    run.add_argument("--output", default="benchmark.json", help="JSON file to write")
+
+    check = commands.add_parser("compare", help="Flag regressions against a baseline")
+    check.add_argument("baseline", help="JSON report of the reference run")
+    check.add_argument("current", help="JSON report of the run to check")
+    check.add_argument(
+        "--tolerance", type=float, default=0.1, help="Allowed relative slowdown"
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        configs = [
+            tuple(int(part) for part in text.split("x")) for text in args.configs
+        ]
+        report = run_benchmarks(
+            configs, args.positions, args.seed, args.depth, args.min_time, args.backend
+        )
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        for config, metrics in report["results"].items():
+            for metric, value in metrics.items():
+                print(f"{config:>9} {metric:<24} {value:14.6g}")
+        print(f"Wrote {args.output}")
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    if baseline["settings"] != current["settings"]:
+        print("Warning: the reports were made with different settings")
+    rows, regressions = compare(baseline, current, args.tolerance)
+    for config, metric, base_value, value, change in rows:
+        flag = " REGRESSION" if change < -args.tolerance else ""
+        print(
+            f"{config:>9} {metric:<24} {base_value:12.6g} -> {value:12.6g} "
+            f"{change:+7.1%}{flag}"
+        )
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import sys
+import os
+import functools
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board, winning_lines  # Import the NumPy board
+
+
+@functools.lru_cache(maxsize=None)
+def line_masks(rows, cols, k):
+    """
+    Precomputes the bitmask of every winning line for a board configuration.
+
+    Cells are mapped to bits as row * (cols + 1) + col. The extra, always empty
+    column at the end of each row keeps neighbouring rows apart in the bitmask.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: A tuple (all_masks, masks_by_cell) where masks_by_cell maps each
+             (row, col) to the masks of the lines running through it.
+    """
+    all_masks = []
+    masks_by_cell = {(row, col): [] for row in range(rows) for col in range(cols)}
+    for line in winning_lines(rows, cols, k):
+        mask = 0
+        for row, col in line:
+            mask |= 1 << (row * (cols + 1) + col)
+        all_masks.append(mask)
+        for cell in line:
+            masks_by_cell[cell].append(mask)
+    return tuple(all_masks), {
+        cell: tuple(masks) for cell, masks in masks_by_cell.items()
+    }
+
+
+class BitBoard(Board):
+    """
+    Drop-in replacement for Board that stores each player's marks as a Python
+    int bitmask instead of a NumPy grid.
+
+    Reading and writing a cell is a single bit operation and a win test is a
+    handful of AND/compare operations against precomputed line masks, which
+    makes it much cheaper than the NumPy board inside the search.
+    """
+
+    def __init__(self, rows, cols, k):
+        """
+        Initializes the bitboard.
+
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        """
+        self.stride = cols + 1  # Bits per row, including the padding column
+        self.board_mask = sum(
+            ((1 << cols) - 1) << (row * self.stride) for row in range(rows)
+        )  # Every cell's bit, without the padding column
+        self.masks, self.masks_by_cell = line_masks(rows, cols, k)
+        super().__init__(rows, cols, k)  # Sets up an empty grid
+
+    @property
+    def grid(self):
+        """
+        Read-only NumPy snapshot of the board, for display and compatibility.
+        Use make_move and undo_move to change the board.
+        """
+        if self._grid_cache is None:
+            size = self.rows * self.stride
+            grid = np.zeros(size, dtype=int)
+            for player_number in (1, 2):
+                data = self.stones[player_number].to_bytes((size + 7) // 8, "little")
+                bits = np.unpackbits(np.frombuffer(data, np.uint8), bitorder="little")
+                grid[bits[:size] == 1] = player_number
+            grid = grid.reshape(self.rows, self.stride)[:, : self.cols].copy()
+            grid.flags.writeable = False  # Writes would not reach the bitmasks
+            self._grid_cache = grid
+        return self._grid_cache
+
+    @grid.setter
+    def grid(self, grid):
+        """
+        Loads the bitmasks from a (rows, cols) array of 0, 1 and 2.
+        """
+        self.stones = {1: 0, 2: 0}  # Bitmask of each player's marks
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if grid[row, col] in (1, 2):
+                    self.stones[int(grid[row, col])] |= 1 << (row * self.stride + col)
+        self._grid_cache = None
+        self.hash = self.compute_hash()
+        self.symmetric_hashes = self.compute_symmetric_hashes(grid)
+        self.reset_empty_cells(grid)
+
+    def nearby_moves(self, moves, distance):
+        """
+        Keeps only the moves within `distance` rows and columns of a mark that
+        is already on the board. On an empty board all moves are kept.
+
+        The marks are dilated one step at a time by shifting their bitmask
+        sideways and then up and down; clearing the padding column after each
+        sideways step stops marks from spilling into the next row.
+
+        :param moves: List of (row, col) tuples of empty cells.
+        :param distance: Largest row and column distance to a mark.
+        :return: The filtered list of moves.
+        """
+        near = self.stones[1] | self.stones[2]
+        if not near:
+            return moves
+        board_mask, stride = self.board_mask, self.stride
+        for _ in range(distance):
+            near = (near | near << 1 | near >> 1) & board_mask
+        for _ in range(distance):
+            near |= near << stride | near >> stride
+        near &= board_mask
+        return [(row, col) for row, col in moves if near >> (row * stride + col) & 1]
+
+    def is_valid_move(self, row, col):
+        """
+        Checks whether a move is within the bounds of the board and on an empty cell.
+
+        :param row: Row index of the move.
+        :param col: Column index of the move.
+        :return: True if the move is valid, False otherwise.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        bit = 1 << (row * self.stride + col)
+        return not (self.stones[1] | self.stones[2]) & bit
+
+    def make_move(self, row, col, player_number):
+        """
+        Places a move on the board if the move is valid.
+
+        :param row: Row index where the move is placed.
+        :param col: Column index where the move is placed.
+        :param player_number: Player's number (1 or 2) to place on the board.
+        :return: True if the move was successful, False otherwise.
+        """
+        if self.is_valid_move(row, col):
+            self.stones[player_number] |= 1 << (row * self.stride + col)
+            self.toggle_hashes(player_number, row * self.cols + col)
+            self.occupy_cell(row * self.cols + col)
+            self._grid_cache = None
+            return True
+        return False  # Move is invalid
+
+    def undo_move(self, row, col):
+        """
+        Removes the mark on the given cell, e.g. to take back a simulated move.
+
+        :param row: Row index of the mark to remove.
+        :param col: Column index of the mark to remove.
+        """
+        bit = 1 << (row * self.stride + col)
+        for player_number in (1, 2):
+            if self.stones[player_number] & bit:
+                self.stones[player_number] ^= bit
+                self.toggle_hashes(player_number, row * self.cols + col)
+                self.vacate_cell(row * self.cols + col)
+        self._grid_cache = None
+
+    def has_won(self, player_number):
+        """
+        Checks whether the specified player has a winning line anywhere on the board.
+
+        :param player_number: The player's number to check for a win.
+        :return: True if the player has won, False otherwise.
+        """
+        bits = self.stones[player_number]
+        return any(bits & mask == mask for mask in self.masks)
+
+    def would_win(self, row, col, player_number):
+        """
+        Checks whether placing the player's mark on the empty cell (row, col)
+        would complete a line, without making the move.
+
+        :param row: Row index of an empty cell.
+        :param col: Column index of an empty cell.
+        :param player_number: The player's number to check for a win.
+        :return: True if the move would win, False otherwise.
+        """
+        bits = self.stones[player_number] | 1 << (row * self.stride + col)
+        return any(bits & mask == mask for mask in self.masks_by_cell[row, col])
+
+    def has_won_at(self, row, col, player_number):
+        """
+        Checks whether the mark at (row, col) is part of a winning line, using
+        only the precomputed masks of the lines through that cell.
+
+        :param row: Row index of the last placed mark.
+        :param col: Column index of the last placed mark.
+        :param player_number: The player's number to check for a win.
+        :return: True if the player has won through this cell, False otherwise.
+        """
+        bits = self.stones[player_number]
+        return any(bits & mask == mask for mask in self.masks_by_cell[row, col])
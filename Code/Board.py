@@ -1,5 +1,174 @@
+import functools
 import numpy as np
 
+# Directions of the four lines through a cell: horizontal, vertical,
+# main diagonal and anti-diagonal
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@functools.lru_cache(maxsize=None)
+def winning_lines(rows, cols, k):
+    """
+    Lists every k-length line of cells on a board of the given size.
+
+    The result only depends on (rows, cols, k), so it is computed once and
+    cached for all boards of the same configuration.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: A tuple of lines, each a tuple of k (row, col) cells.
+    """
+    lines = []
+    for d_row, d_col in DIRECTIONS:
+        for row in range(rows):
+            for col in range(cols):
+                end_row = row + (k - 1) * d_row
+                end_col = col + (k - 1) * d_col
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    lines.append(
+                        tuple((row + i * d_row, col + i * d_col) for i in range(k))
+                    )
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def zobrist_keys(rows, cols):
+    """
+    Generates the Zobrist keys for a board of the given size.
+
+    Every (player, cell) pair gets a random 64-bit key; the hash of a position
+    is the XOR of the keys of all marks on the board. The generator is seeded,
+    so hashes are identical across boards, runs and processes.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :return: A dict mapping each player number to its list of keys, indexed
+             by row * cols + col.
+    """
+    rng = np.random.default_rng(rows * 1000 + cols)
+    keys = rng.integers(0, 2**63, size=(2, rows * cols), dtype=np.int64)
+    return {1: [int(key) for key in keys[0]], 2: [int(key) for key in keys[1]]}
+
+
+@functools.lru_cache(maxsize=None)
+def symmetries(rows, cols):
+    """
+    Lists the symmetries of a board as permutations of the flat cell indices.
+
+    Every board can be mirrored left-right and top-bottom and rotated by 180
+    degrees; square boards can also be transposed and rotated by 90 degrees,
+    which gives 8 symmetries instead of 4. The identity always comes first.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :return: A tuple (permutations, inverses): for every symmetry the tuple
+             mapping each cell index (row * cols + col) to the index of its
+             image, and the tuple mapping each image back.
+    """
+    last_row, last_col = rows - 1, cols - 1
+    transforms = [
+        lambda row, col: (row, col),  # Identity
+        lambda row, col: (row, last_col - col),  # Left-right mirror
+        lambda row, col: (last_row - row, col),  # Top-bottom mirror
+        lambda row, col: (last_row - row, last_col - col),  # Rotation by 180
+    ]
+    if rows == cols:
+        transforms += [
+            lambda row, col: (col, row),  # Transpose
+            lambda row, col: (last_col - col, last_row - row),  # Anti-transpose
+            lambda row, col: (col, last_row - row),  # Rotation by 90
+            lambda row, col: (last_col - col, row),  # Rotation by 270
+        ]
+
+    permutations = []
+    inverses = []
+    for transform in transforms:
+        permutation = [0] * (rows * cols)
+        inverse = [0] * (rows * cols)
+        for row in range(rows):
+            for col in range(cols):
+                image_row, image_col = transform(row, col)
+                permutation[row * cols + col] = image_row * cols + image_col
+                inverse[image_row * cols + image_col] = row * cols + col
+        permutations.append(tuple(permutation))
+        inverses.append(tuple(inverse))
+    return tuple(permutations), tuple(inverses)
+
+
+@functools.lru_cache(maxsize=None)
+def symmetry_keys(rows, cols):
+    """
+    Collects, for every mark, the Zobrist keys of its images under all
+    symmetries, so the hashes of all symmetric images of a position can be
+    updated together on each move.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :return: A dict mapping each player number to a list indexed by cell of
+             tuples with one key per symmetry, in the order of symmetries().
+    """
+    keys = zobrist_keys(rows, cols)
+    permutations, _ = symmetries(rows, cols)
+    return {
+        player_number: [
+            tuple(
+                keys[player_number][permutation[cell]] for permutation in permutations
+            )
+            for cell in range(rows * cols)
+        ]
+        for player_number in (1, 2)
+    }
+
+
+def batch_has_won(grids, player_number, k):
+    """
+    Checks many boards for a win of one player in a single vectorized pass.
+
+    For every direction the k shifted copies of the player's marks are ANDed
+    together, so a True cell remains exactly where a line of k marks starts.
+    The result agrees with Board.has_won on every board.
+
+    :param grids: Array of shape (N, rows, cols) holding 0, 1 and 2.
+    :param player_number: The player's number to check for a win.
+    :param k: Number of consecutive marks needed to win.
+    :return: Boolean array of shape (N,), True where the player has won.
+    """
+    marks = np.asarray(grids) == player_number
+    count, rows, cols = marks.shape
+    won = np.zeros(count, dtype=bool)
+    for d_row, d_col in DIRECTIONS:
+        span_row = (k - 1) * d_row  # Extent of a line along the rows
+        span_col = (k - 1) * abs(d_col)  # Extent of a line along the columns
+        if span_row >= rows or span_col >= cols:
+            continue  # No line of this direction fits on the board
+        height, width = rows - span_row, cols - span_col
+        run = np.ones((count, height, width), dtype=bool)
+        for i in range(k):
+            row_start = i * d_row
+            # Anti-diagonal lines run leftwards, so their columns count down
+            col_start = i * d_col if d_col >= 0 else span_col - i
+            run &= marks[
+                :, row_start : row_start + height, col_start : col_start + width
+            ]
+        won |= run.any(axis=(1, 2))
+    return won
+
+
+def batch_winner(grids, k):
+    """
+    Determines the winner of many boards at once, see batch_has_won.
+
+    :param grids: Array of shape (N, rows, cols) holding 0, 1 and 2.
+    :param k: Number of consecutive marks needed to win.
+    :return: Array of shape (N,) with 0 for no winner, 1 or 2 for the winning
+             player and 3 if both players have a line (impossible in real games).
+    """
+    winners = np.zeros(len(grids), dtype=np.int8)
+    winners[batch_has_won(grids, 1, k)] += 1
+    winners[batch_has_won(grids, 2, k)] += 2
+    return winners
+
 
 class Board:
     """
@@ -19,10 +188,176 @@ class Board:
         self.rows = rows  # Number of rows
         self.cols = cols  # Number of columns
         self.k = k  # Winning condition (k in a row)
+        self.zobrist = zobrist_keys(rows, cols)  # Keys for the position hash
+        self.symmetry_keys = symmetry_keys(rows, cols)  # Keys of the images
+        self.permutations, self.inverse_permutations = symmetries(rows, cols)
+        self.cells = [
+            (row, col) for row in range(rows) for col in range(cols)
+        ]  # (row, col) of every flat cell index
         self.grid = np.zeros(
             (rows, cols), dtype=int
         )  # Create an empty board with zeros
 
+    @property
+    def grid(self):
+        """
+        The (rows, cols) NumPy array holding 0 for empty cells, else 1 or 2.
+        It is a read-only view: marks are placed with make_move or push, which
+        also keep the hashes and the empty-cell index up to date.
+        """
+        return self._grid_view
+
+    @grid.setter
+    def grid(self, grid):
+        """
+        Replaces the whole grid with a copy of the given one, recomputes the
+        position hashes and rebuilds the empty-cell index. The move stack is
+        cleared.
+        """
+        self._grid = np.array(grid, dtype=int)  # Later writes go through moves
+        self._grid_view = self._grid.view()
+        self._grid_view.flags.writeable = False
+        grid = self._grid
+        self.hash = self.compute_hash()
+        self.symmetric_hashes = self.compute_symmetric_hashes(grid)
+        self.reset_empty_cells(grid)
+
+    def reset_empty_cells(self, grid):
+        """
+        Rebuilds the empty-cell index from a (rows, cols) grid and clears the
+        move stack.
+
+        The index is an unordered list of the flat indices of all empty cells
+        plus each cell's position in that list, so a cell is removed (by
+        swapping the last entry into its place) or added back in O(1).
+
+        :param grid: The board's grid.
+        """
+        self.empty_cells = [
+            int(cell) for cell in np.flatnonzero(np.asarray(grid).ravel() == 0)
+        ]
+        self.empty_position = [-1] * (self.rows * self.cols)
+        for position, cell in enumerate(self.empty_cells):
+            self.empty_position[cell] = position
+        self.move_stack = []  # (row, col, player number) of every pushed move
+
+    def occupy_cell(self, cell):
+        """
+        Removes a cell from the empty-cell index.
+
+        :param cell: Flat index (row * cols + col) of the cell.
+        """
+        position = self.empty_position[cell]
+        last = self.empty_cells.pop()
+        if last != cell:
+            self.empty_cells[position] = last  # Fill the gap with the last entry
+            self.empty_position[last] = position
+        self.empty_position[cell] = -1
+
+    def vacate_cell(self, cell):
+        """
+        Adds a cell back to the empty-cell index.
+
+        :param cell: Flat index (row * cols + col) of the cell.
+        """
+        self.empty_position[cell] = len(self.empty_cells)
+        self.empty_cells.append(cell)
+
+    @property
+    def move_count(self):
+        """Number of marks on the board."""
+        return self.rows * self.cols - len(self.empty_cells)
+
+    def compute_hash(self):
+        """
+        Computes the Zobrist hash of the current position from scratch.
+        make_move and undo_move keep `self.hash` up to date incrementally.
+
+        :return: The 64-bit position hash as an int.
+        """
+        grid = self.grid
+        position_hash = 0
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if grid[row, col] in (1, 2):
+                    position_hash ^= self.zobrist[int(grid[row, col])][
+                        row * self.cols + col
+                    ]
+        return position_hash
+
+    def compute_symmetric_hashes(self, grid):
+        """
+        Computes the Zobrist hash of every symmetric image of a grid from
+        scratch, in the order of symmetries(). The first one equals the hash.
+
+        :param grid: A (rows, cols) array of 0, 1 and 2.
+        :return: A list of 64-bit hashes.
+        """
+        hashes = [0] * len(self.permutations)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if grid[row, col] in (1, 2):
+                    keys = self.symmetry_keys[int(grid[row, col])][
+                        row * self.cols + col
+                    ]
+                    hashes = [value ^ key for value, key in zip(hashes, keys)]
+        return hashes
+
+    def toggle_hashes(self, player_number, cell):
+        """
+        Adds or removes a mark in the position hash and all symmetric hashes.
+
+        :param player_number: The player's number of the mark.
+        :param cell: Flat index (row * cols + col) of the mark.
+        """
+        self.hash ^= self.zobrist[player_number][cell]
+        self.symmetric_hashes = [
+            value ^ key
+            for value, key in zip(
+                self.symmetric_hashes, self.symmetry_keys[player_number][cell]
+            )
+        ]
+
+    def canonical_hash(self, transforms=None):
+        """
+        Finds the smallest hash among the symmetric images of the position, a
+        key shared by all positions that are rotations or reflections of each
+        other.
+
+        :param transforms: Indices into symmetries() to consider, or None for all.
+        :return: A tuple (hash, transform) where transform is the index of the
+                 symmetry that maps the position onto its canonical image.
+        """
+        hashes = self.symmetric_hashes
+        if transforms is None:
+            transforms = range(len(hashes))
+        transform = min(transforms, key=hashes.__getitem__)
+        return hashes[transform], transform
+
+    def to_canonical(self, move, transform):
+        """
+        Maps a move into the orientation of the canonical image.
+
+        :param move: A tuple (row, col) on this board.
+        :param transform: The symmetry index from canonical_hash.
+        :return: The (row, col) of the move's image.
+        """
+        row, col = move
+        return divmod(self.permutations[transform][row * self.cols + col], self.cols)
+
+    def from_canonical(self, move, transform):
+        """
+        Maps a move of the canonical image back to this board's orientation.
+
+        :param move: A tuple (row, col) on the canonical image.
+        :param transform: The symmetry index from canonical_hash.
+        :return: The (row, col) of the move on this board.
+        """
+        row, col = move
+        return divmod(
+            self.inverse_permutations[transform][row * self.cols + col], self.cols
+        )
+
     def display(self):
         """
         Displays the current state of the board in a readable format.
@@ -60,10 +395,79 @@ class Board:
         :return: True if the move was successful, False otherwise.
         """
         if self.is_valid_move(row, col):
-            self.grid[row, col] = player_number  # Place the player's mark on the board
+            self._grid[row, col] = player_number  # Place the player's mark on the board
+            self.toggle_hashes(player_number, row * self.cols + col)
+            self.occupy_cell(row * self.cols + col)
             return True
         return False  # Move is invalid
 
+    def undo_move(self, row, col):
+        """
+        Removes the mark on the given cell, e.g. to take back a simulated move.
+
+        :param row: Row index of the mark to remove.
+        :param col: Column index of the mark to remove.
+        """
+        player_number = int(self._grid[row, col])
+        if player_number:
+            self.toggle_hashes(player_number, row * self.cols + col)
+            self._grid[row, col] = 0  # Reset the cell to empty
+            self.vacate_cell(row * self.cols + col)
+
+    def push(self, row, col, player_number):
+        """
+        Places a move and records it on the move stack, so it can be taken
+        back with pop.
+
+        :param row: Row index where the move is placed.
+        :param col: Column index where the move is placed.
+        :param player_number: Player's number (1 or 2) to place on the board.
+        :raises ValueError: If the cell is outside the board or occupied.
+        """
+        if not self.make_move(row, col, player_number):
+            raise ValueError(f"Invalid move ({row}, {col})")
+        self.move_stack.append((row, col, player_number))
+
+    def pop(self):
+        """
+        Takes back the last move placed with push.
+
+        :return: The move as a tuple (row, col, player number).
+        :raises IndexError: If no pushed move is left.
+        """
+        row, col, player_number = self.move_stack.pop()
+        self.undo_move(row, col)
+        return row, col, player_number
+
+    def available_moves(self):
+        """
+        Lists all empty cells of the board in row-major order, from the
+        empty-cell index instead of a scan of the grid.
+
+        :return: A list of (row, col) tuples.
+        """
+        cells = self.cells
+        return [cells[cell] for cell in sorted(self.empty_cells)]
+
+    def nearby_moves(self, moves, distance):
+        """
+        Keeps only the moves within `distance` rows and columns of a mark that
+        is already on the board. On an empty board all moves are kept.
+
+        :param moves: List of (row, col) tuples of empty cells.
+        :param distance: Largest row and column distance to a mark.
+        :return: The filtered list of moves.
+        """
+        if len(self.empty_cells) == self.rows * self.cols:
+            return moves
+        occupied = self._grid != 0
+        padded = np.pad(occupied, distance)
+        near = np.zeros_like(occupied)
+        for d_row in range(2 * distance + 1):
+            for d_col in range(2 * distance + 1):
+                near |= padded[d_row : d_row + self.rows, d_col : d_col + self.cols]
+        return [(row, col) for row, col in moves if near[row, col]]
+
     def has_won(self, player_number):
         """
         Checks whether the specified player has won the game.
@@ -115,3 +519,63 @@ class Board:
                 return True
 
         return False  # No win detected
+
+    def would_win(self, row, col, player_number):
+        """
+        Checks whether placing the player's mark on the empty cell (row, col)
+        would complete a line, without making the move.
+
+        :param row: Row index of an empty cell.
+        :param col: Column index of an empty cell.
+        :param player_number: The player's number to check for a win.
+        :return: True if the move would win, False otherwise.
+        """
+        self._grid[row, col] = player_number  # Only has_won_at reads the grid
+        won = self.has_won_at(row, col, player_number)
+        self._grid[row, col] = 0
+        return won
+
+    def has_won_at(self, row, col, player_number):
+        """
+        Checks whether the mark at (row, col) is part of a winning line.
+
+        Only the four lines running through the given cell are walked, so the
+        check costs O(k) instead of the O(rows * cols) scan done by `has_won`.
+        It is meant to be called right after a move was placed on (row, col);
+        `has_won` stays available for validating arbitrary positions.
+
+        :param row: Row index of the last placed mark.
+        :param col: Column index of the last placed mark.
+        :param player_number: The player's number to check for a win.
+        :return: True if the player has won through this cell, False otherwise.
+        """
+        if self.grid[row, col] != player_number:
+            return False  # The cell does not hold the player's mark
+
+        for d_row, d_col in DIRECTIONS:
+            count = 1  # The mark on (row, col) itself
+
+            # Walk forward along the direction
+            r, c = row + d_row, col + d_col
+            while (
+                0 <= r < self.rows
+                and 0 <= c < self.cols
+                and self.grid[r, c] == player_number
+            ):
+                count += 1
+                r, c = r + d_row, c + d_col
+
+            # Walk backward along the direction
+            r, c = row - d_row, col - d_col
+            while (
+                0 <= r < self.rows
+                and 0 <= c < self.cols
+                and self.grid[r, c] == player_number
+            ):
+                count += 1
+                r, c = r - d_row, c - d_col
+
+            if count >= self.k:  # k or more consecutive marks through the cell
+                return True
+
+        return False  # No line through the cell is long enough
@@ -0,0 +1,308 @@
+import sys
+import os
+import argparse
+import json
+import numpy as np
+from tqdm import tqdm
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.Game import Game  # Import the Game class
+from Code.GameRecords import GameRecords  # Import the game record reader
+from Code.MyBot import MyBot  # Import MyBot class (AI Player)
+
+# Mixed into the position hash when player 2 is to move, since games recorded
+# with player 2 moving first can reach the same marks with the other side to move
+SIDE_TO_MOVE_KEY = 0x9E3779B97F4A7C15
+
+# Arrays of a dataset directory: name -> (dtype, shape after the first axis)
+ARRAYS = {
+    "positions": ("i1", "board"),  # Marks 0, 1 and 2, shape (N, rows, cols)
+    "to_move": ("i1", ()),  # Player number to move
+    "results": ("i1", ()),  # Game result for the side to move: 1, 0 or -1
+    "scores": ("f4", ()),  # Search score for the side to move, NaN if none
+    "plies": ("i2", ()),  # Number of marks on the board
+}
+
+
+def search_score(bot, board, player, depth):
+    """
+    Scores a position with a fixed-depth Minimax search of the bot.
+
+    :param bot: A MyBot, whose evaluation weights are used.
+    :param board: The game board.
+    :param player: The player number to move.
+    :param depth: Search depth.
+    :return: The score for the player to move.
+    """
+    bot.prepare_search(board)
+    bot.completed_depth = 0  # A first iteration is never interrupted
+    bot.search_depth = depth
+    value, _ = bot.minimax(board, player, True, -np.inf, np.inf, depth)
+    return float(value)
+
+
+class PositionDataset:
+    """
+    Streams labelled positions out of played games into preallocated
+    memory-mapped NumPy arrays (.npy files in one directory).
+
+    Every position before a move of a game becomes one row: the grid, the
+    player to move, the game's result from that player's point of view and,
+    if a scoring depth is set, a Minimax score. Rows are buffered and written
+    to the arrays in chunks.
+
+    Positions are deduplicated by their canonical hash, so rotations and
+    reflections count as the same position, in a fixed-size table of hashes:
+    a slot holds the last hash that mapped to it. The table never grows, so
+    memory stays bounded for any number of games; in exchange, a position
+    whose slot was taken over in between is stored again.
+    """
+
+    def __init__(
+        self,
+        directory,
+        rows,
+        cols,
+        k,
+        capacity,
+        chunk_size=4096,
+        dedupe_size=1 << 22,
+        score_depth=None,
+        bot_options=None,
+    ):
+        """
+        Creates the arrays of a new dataset.
+
+        :param directory: Directory for the .npy files (created if needed).
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        :param capacity: Maximum number of positions; the arrays are allocated
+                         at this size and later positions are dropped.
+        :param chunk_size: Positions buffered in memory between writes.
+        :param dedupe_size: Slots of the deduplication table (8 bytes each),
+                            or 0 to keep duplicates.
+        :param score_depth: Depth of the Minimax score of each position, or
+                            None to leave the scores at NaN.
+        :param bot_options: MyBot keyword arguments of the scoring bot.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        self.count = 0  # Positions written to the arrays
+        self.duplicates = 0  # Positions skipped as already seen
+        self.dropped = 0  # Positions skipped because the arrays were full
+        self.games = 0
+        self.arrays = {}
+        for name, (dtype, shape) in ARRAYS.items():
+            shape = (rows, cols) if shape == "board" else shape
+            self.arrays[name] = np.lib.format.open_memmap(
+                os.path.join(directory, f"{name}.npy"),
+                mode="w+",
+                dtype=dtype,
+                shape=(capacity, *shape),
+            )
+        self.buffer = {name: [] for name in ARRAYS}
+        self.seen = np.zeros(dedupe_size, dtype=np.uint64)  # 0 marks an empty slot
+        self.score_depth = score_depth
+        self.bot = None
+        if score_depth is not None:
+            self.bot = MyBot("Scorer", 1, 3, **(bot_options or {}))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def full(self):
+        """
+        Whether no further positions fit into the arrays.
+        """
+        return self.count + len(self.buffer["plies"]) >= self.capacity
+
+    def is_new(self, key):
+        """
+        Checks a position hash against the deduplication table and enters it.
+
+        :param key: The canonical position hash, combined with the side to move.
+        :return: True if the position was not seen (as far as the table knows).
+        """
+        if not len(self.seen):
+            return True
+        key = np.uint64(key or 1)  # 0 is reserved for empty slots
+        slot = int(key) % len(self.seen)
+        if self.seen[slot] == key:
+            return False
+        self.seen[slot] = key
+        return True
+
+    def add_game(self, moves, result):
+        """
+        Adds the positions of one game.
+
+        :param moves: List of (row, col, player number) of the game's moves.
+        :param result: The winner's player number, 0 for a draw.
+        """
+        self.games += 1
+        board = Board(self.rows, self.cols, self.k)
+        for row, col, player in moves:
+            if self.full:
+                self.dropped += 1
+            elif self.is_new(
+                board.canonical_hash()[0] ^ (SIDE_TO_MOVE_KEY if player == 2 else 0)
+            ):
+                self.add_position(board, player, result)
+            else:
+                self.duplicates += 1
+            board.push(row, col, player)
+        if len(self.buffer["plies"]) >= self.chunk_size:
+            self.flush()
+
+    def add_position(self, board, player, result):
+        """
+        Buffers one labelled position.
+
+        :param board: The game board.
+        :param player: The player number to move.
+        :param result: The winner's player number, 0 for a draw.
+        """
+        buffer = self.buffer
+        buffer["positions"].append(board.grid.copy())
+        buffer["to_move"].append(player)
+        buffer["results"].append(0 if result == 0 else (1 if result == player else -1))
+        score = np.nan
+        if self.bot is not None and board.available_moves():
+            score = search_score(self.bot, board, player, self.score_depth)
+        buffer["scores"].append(score)
+        buffer["plies"].append(board.move_count)
+
+    def append_result(self, game, result):
+        """
+        Adds a finished Game, so the dataset can be passed to Game.play as
+        its recorder.
+
+        :param game: The Game that was played.
+        :param result: Its GameResult.
+        """
+        self.add_game(result.moves, result.winner_number)
+
+    def add_records(self, records):
+        """
+        Adds every game of a record file.
+
+        :param records: A GameRecords reader.
+        """
+        for record in records:
+            if self.full:
+                break
+            if (record.rows, record.cols, record.k) == (self.rows, self.cols, self.k):
+                self.add_game(record.moves(), record.result)
+
+    def flush(self):
+        """
+        Writes the buffered positions to the arrays.
+        """
+        size = len(self.buffer["plies"])
+        if not size:
+            return
+        for name, values in self.buffer.items():
+            self.arrays[name][self.count : self.count + size] = np.array(values)
+            values.clear()
+        self.count += size
+
+    def close(self):
+        """
+        Writes the remaining positions, flushes the arrays to disk and stores
+        the number of valid rows and the counters in meta.json.
+        """
+        self.flush()
+        for array in self.arrays.values():
+            array.flush()
+        meta = {
+            "rows": self.rows,
+            "cols": self.cols,
+            "k": self.k,
+            "count": self.count,
+            "games": self.games,
+            "duplicates": self.duplicates,
+            "dropped": self.dropped,
+            "score_depth": self.score_depth,
+        }
+        with open(os.path.join(self.directory, "meta.json"), "w") as file:
+            json.dump(meta, file, indent=2)
+
+
+def load_dataset(directory):
+    """
+    Opens a dataset written by PositionDataset, read-only and memory-mapped.
+
+    :param directory: The dataset directory.
+    :return: A tuple (meta, arrays) where arrays maps each array name to its
+             valid rows.
+    """
+    with open(os.path.join(directory, "meta.json")) as file:
+        meta = json.load(file)
+    arrays = {
+        name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")[
+            : meta["count"]
+        ]
+        for name in ARRAYS
+    }
+    return meta, arrays
+
+
+def main():
+    """
+    Command-line entry point: exports positions from a game record file, or
+    plays bot games and exports their positions as they finish.
+    """
+    parser = argparse.ArgumentParser(description="Export MNK training positions")
+    parser.add_argument("--rows", type=int, default=7)
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--records", default=None, help="Game record file to export")
+    parser.add_argument("--games", type=int, default=1000, help="Games to play")
+    parser.add_argument("--modes", type=int, nargs=2, default=[2, 2])
+    parser.add_argument("--capacity", type=int, default=100000)
+    parser.add_argument("--score-depth", type=int, default=None)
+    parser.add_argument("--output", required=True, help="Dataset directory")
+    args = parser.parse_args()
+
+    with PositionDataset(
+        args.output,
+        args.rows,
+        args.cols,
+        args.k,
+        args.capacity,
+        score_depth=args.score_depth,
+    ) as dataset:
+        if args.records is not None:
+            dataset.add_records(GameRecords(args.records))
+        else:
+            bots = [
+                MyBot(f"Bot {number}", number, mode, time_limit=0.05)
+                for number, mode in zip((1, 2), args.modes)
+            ]
+            for _ in tqdm(range(args.games), desc="Games"):
+                if dataset.full:
+                    break
+                game = Game(args.rows, args.cols, args.k, *bots)
+                game.play(recorder=dataset)
+    print(
+        f"Wrote {dataset.count} positions from {dataset.games} games "
+        f"({dataset.duplicates} duplicates, {dataset.dropped} dropped) "
+        f"to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import sys
+import os
+import functools
+import json
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import winning_lines  # Import the line enumeration
+
+WIN_SCORE = 10000  # Score of a won position, above any heuristic evaluation
+CENTER_BONUS = 50  # Reward for holding the center cell
+WINNING_POTENTIAL = 50  # Reward for a window that is one mark short of a win
+
+
+def default_weights(k):
+    """
+    Builds the default evaluation weights for a win condition.
+
+    The weights are a tuple (center_bonus, w_1, ..., w_{k-1}) where w_c is the
+    reward for a k-window holding c of a player's marks and none of the
+    opponent's. A window one mark short of a win is worth WINNING_POTENTIAL and
+    every missing mark below that divides the reward by ten.
+
+    :param k: Number of consecutive marks needed to win.
+    :return: The weights tuple.
+    """
+    return (CENTER_BONUS,) + tuple(
+        WINNING_POTENTIAL * 10.0 ** (count - (k - 1)) for count in range(1, k)
+    )
+
+
+def default_profile_directory():
+    """
+    :return: The directory of the tuned weight profiles inside the repository,
+             which bots load by default.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Weights")
+
+
+def default_profile_path(rows, cols, k):
+    """
+    Location of the tuned weight profile of a configuration inside the
+    repository.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: The file path.
+    """
+    return os.path.join(default_profile_directory(), f"weights_{rows}x{cols}x{k}.json")
+
+
+def save_weight_profile(path, rows, cols, k, weights, **info):
+    """
+    Writes the evaluation weights of one configuration as a JSON profile.
+
+    :param path: Path of the file to write.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param weights: Evaluation weights, see default_weights.
+    :param info: Further fields to store, e.g. how the weights were fitted.
+    """
+    if len(weights) != k:
+        raise ValueError(f"Expected {k} weights, got {len(weights)}")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    profile = {"rows": rows, "cols": cols, "k": k, "weights": list(map(float, weights))}
+    profile.update(info)
+    with open(path, "w") as file:
+        json.dump(profile, file, indent=2)
+
+
+def load_weight_profiles(directory):
+    """
+    Reads every weight profile (*.json, see save_weight_profile) in a directory.
+
+    :param directory: The profile directory; a missing directory holds none.
+    :return: Dict mapping (rows, cols, k) to the weights tuple.
+    """
+    profiles = {}
+    if not os.path.isdir(directory):
+        return profiles
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(directory, name)) as file:
+            profile = json.load(file)
+        weights = tuple(profile["weights"])
+        if len(weights) != profile["k"]:
+            raise ValueError(f"{name} does not hold {profile['k']} weights")
+        profiles[profile["rows"], profile["cols"], profile["k"]] = weights
+    return profiles
+
+
+def window_score(count1, count2, k, weights):
+    """
+    Scores a window from player 1's point of view by its mark counts.
+
+    :param count1: Number of player 1's marks in the window.
+    :param count2: Number of player 2's marks in the window.
+    :param k: Number of consecutive marks needed to win (the window length).
+    :param weights: Evaluation weights, see default_weights.
+    :return: The window's score.
+    """
+    if count1 and count2:
+        return 0  # Blocked, neither player can win here
+    count, sign = (count1, 1) if count1 else (count2, -1)
+    if count == 0:
+        return 0
+    if count == k:
+        return sign * WIN_SCORE
+    return sign * weights[count]
+
+
+@functools.lru_cache(maxsize=None)
+def pattern_table(k, weights):
+    """
+    Precomputes the score of every possible window content.
+
+    A window's content is encoded as the base-3 number sum(mark_j * 3**j) over
+    its cells j, with mark 0 for empty cells, so there are 3**k patterns. The
+    table is cached per (k, weights) and shared by all evaluators and games.
+
+    :param k: Number of consecutive marks needed to win (the window length).
+    :param weights: Evaluation weights as a tuple, see default_weights.
+    :return: A list mapping each pattern index to its score for player 1.
+    """
+    table = []
+    for pattern in range(3**k):
+        counts = [0, 0, 0]  # Empty cells, player 1 marks, player 2 marks
+        for _ in range(k):
+            pattern, mark = divmod(pattern, 3)
+            counts[mark] += 1
+        table.append(window_score(counts[1], counts[2], k, weights))
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def window_layout(rows, cols, k):
+    """
+    Lists the k-windows of a board configuration by flat cell index.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: A tuple (windows, windows_by_cell): every window as a tuple of
+             cell indices (row * cols + col), and for every cell the pairs
+             (window index, 3**position of the cell in the window).
+    """
+    windows = tuple(
+        tuple(row * cols + col for row, col in line)
+        for line in winning_lines(rows, cols, k)
+    )
+    windows_by_cell = [[] for _ in range(rows * cols)]
+    for index, window in enumerate(windows):
+        for position, cell in enumerate(window):
+            windows_by_cell[cell].append((index, 3**position))
+    return windows, tuple(tuple(pairs) for pairs in windows_by_cell)
+
+
+@functools.lru_cache(maxsize=None)
+def window_matrix(rows, cols, k):
+    """
+    Builds the matrix that turns flat grids into window pattern indices.
+
+    Entry [cell, window] is 3**position of the cell in the window, or 0 if the
+    cell is not part of it, so (N, rows * cols) grids @ matrix gives the
+    (N, windows) pattern indices of pattern_table in one product.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: Read-only float32 array of shape (rows * cols, windows); pattern
+             indices stay below 2**24 for k <= 15, so float32 products are exact.
+    """
+    windows, _ = window_layout(rows, cols, k)
+    matrix = np.zeros((rows * cols, len(windows)), dtype=np.float32)
+    for index, window in enumerate(windows):
+        for position, cell in enumerate(window):
+            matrix[cell, index] = 3**position
+    matrix.flags.writeable = False  # Shared through the cache
+    return matrix
+
+
+def evaluate_batch(grids, k, player, weights=None, chunk_size=16384):
+    """
+    Evaluates many positions at once with the heuristic of WindowEvaluator.
+
+    The window patterns of all positions come from one matrix product with
+    window_matrix and are scored by indexing the pattern table, so the cost
+    per position is a few vectorized operations instead of Python loops.
+    Large batches are processed in chunks to bound the temporary arrays.
+
+    :param grids: Array of shape (N, rows, cols) holding 0, 1 and 2.
+    :param k: Number of consecutive marks needed to win.
+    :param player: The player number to score for, or an array of shape (N,)
+                   with one player number per position.
+    :param weights: Evaluation weights, see default_weights.
+    :param chunk_size: Positions evaluated per product.
+    :return: Float array of shape (N,), equal (up to rounding) to
+             WindowEvaluator(...).load(grid).score(player) for every grid.
+    """
+    grids = np.asarray(grids)
+    count, rows, cols = grids.shape
+    weights = default_weights(k) if weights is None else tuple(weights)
+    matrix = window_matrix(rows, cols, k)
+    table = np.array(pattern_table(k, weights), dtype=float)
+    center = (rows // 2) * cols + cols // 2
+
+    flat = grids.reshape(count, rows * cols)
+    scores = np.empty(count)
+    for start in range(0, count, chunk_size):
+        chunk = flat[start : start + chunk_size].astype(np.float32)
+        patterns = (chunk @ matrix).astype(np.intp)
+        scores[start : start + chunk_size] = table[patterns].sum(axis=1)
+    center_marks = flat[:, center]
+    scores += weights[0] * ((center_marks == 1).astype(float) - (center_marks == 2))
+    return np.where(np.asarray(player) == 1, scores, -scores)
+
+
+@functools.lru_cache(maxsize=None)
+def pattern_features(k):
+    """
+    Precomputes the feature vector of every window content (see window_features).
+
+    :param k: Number of consecutive marks needed to win.
+    :return: Read-only int32 array of shape (3**k, k + 1): row p has +1 (or -1)
+             in column c if pattern p holds c marks of player 1 (or player 2)
+             and none of the other player's, and zeros otherwise.
+    """
+    features = np.zeros((3**k, k + 1), dtype=np.int32)
+    for pattern in range(3**k):
+        counts = [0, 0, 0]  # Empty cells, player 1 marks, player 2 marks
+        code = pattern
+        for _ in range(k):
+            code, mark = divmod(code, 3)
+            counts[mark] += 1
+        if counts[1] and not counts[2]:
+            features[pattern, counts[1]] = 1
+        elif counts[2] and not counts[1]:
+            features[pattern, counts[2]] = -1
+    features.flags.writeable = False  # Shared through the cache
+    return features
+
+
+def window_features(grids, k, chunk_size=4096):
+    """
+    Counts the terms of the evaluation for many positions, from player 1's
+    point of view.
+
+    The evaluation is linear in its weights: for every position it equals
+    features[:, :k] @ weights + WIN_SCORE * features[:, k], where column 0 is
+    the center cell (+1 for player 1, -1 for player 2), column c < k the
+    number of windows with c marks of player 1 only minus those with c marks
+    of player 2 only, and column k the same for full windows. This lets a
+    tuner compute the features once and evaluate any weights with one product.
+
+    :param grids: Array of shape (N, rows, cols) holding 0, 1 and 2.
+    :param k: Number of consecutive marks needed to win.
+    :param chunk_size: Positions processed per product.
+    :return: Float array of shape (N, k + 1).
+    """
+    grids = np.asarray(grids)
+    count, rows, cols = grids.shape
+    matrix = window_matrix(rows, cols, k)
+    table = pattern_features(k)
+    center = (rows // 2) * cols + cols // 2
+
+    flat = grids.reshape(count, rows * cols)
+    features = np.empty((count, k + 1))
+    for start in range(0, count, chunk_size):
+        chunk = flat[start : start + chunk_size].astype(np.float32)
+        patterns = (chunk @ matrix).astype(np.intp)
+        features[start : start + chunk_size] = table[patterns].sum(axis=1)
+    center_marks = flat[:, center]
+    features[:, 0] = (center_marks == 1).astype(float) - (center_marks == 2)
+    return features
+
+
+class WindowEvaluator:
+    """
+    Incrementally maintained board evaluation for the Minimax search.
+
+    Every k-window of the board (rows, columns and both diagonals) is kept as
+    a pattern index encoding its content, see pattern_table. Placing or
+    removing a mark adjusts the index of the at most 4 * k windows through that
+    cell and a running total by table lookups, so evaluating a position is O(1).
+
+    A window with marks of only one player scores the weight of its mark count
+    for that player (WIN_SCORE when it is full); mixed windows are blocked and
+    score nothing. The center cell adds the center bonus.
+    """
+
+    def __init__(self, rows, cols, k, weights=None):
+        """
+        Initializes the evaluator for an empty board.
+
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        :param weights: Evaluation weights, see default_weights.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.weights = default_weights(k) if weights is None else tuple(weights)
+        self.windows, self.windows_by_cell = window_layout(rows, cols, k)
+        self.center = (rows // 2) * cols + cols // 2  # Flat index of the center
+        self.table = pattern_table(k, self.weights)  # Score by window pattern
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the evaluator back to an empty board.
+        """
+        self.patterns = [0] * len(self.windows)  # Pattern index of every window
+        self.center_mark = 0  # Mark on the center cell
+        self.total = self.table[0] * len(self.windows)  # Sum of all window scores
+
+    def load(self, grid):
+        """
+        Rebuilds the patterns from a (rows, cols) grid of 0, 1 and 2.
+
+        :param grid: The board's grid.
+        :return: The evaluator itself, for chaining.
+        """
+        self.reset()
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if grid[row, col] in (1, 2):
+                    self.place(row, col, int(grid[row, col]))
+        return self
+
+    def place(self, row, col, mark):
+        """
+        Updates the evaluation for a mark placed on (row, col).
+
+        :param row: Row index of the mark.
+        :param col: Column index of the mark.
+        :param mark: The player number of the mark.
+        """
+        cell = row * self.cols + col
+        patterns = self.patterns
+        table = self.table
+        total = self.total
+        for window, power in self.windows_by_cell[cell]:
+            pattern = patterns[window]
+            patterns[window] = pattern + mark * power
+            total += table[pattern + mark * power] - table[pattern]
+        self.total = total
+        if cell == self.center:
+            self.center_mark = mark
+
+    def remove(self, row, col, mark):
+        """
+        Updates the evaluation for a mark taken back from (row, col).
+
+        :param row: Row index of the mark.
+        :param col: Column index of the mark.
+        :param mark: The player number of the mark.
+        """
+        cell = row * self.cols + col
+        patterns = self.patterns
+        table = self.table
+        total = self.total
+        for window, power in self.windows_by_cell[cell]:
+            pattern = patterns[window]
+            patterns[window] = pattern - mark * power
+            total += table[pattern - mark * power] - table[pattern]
+        self.total = total
+        if cell == self.center:
+            self.center_mark = 0
+
+    def score(self, player):
+        """
+        Evaluates the current position for the given player.
+
+        :param player: The player's number.
+        :return: The evaluation score, positive if the player stands better.
+        """
+        score = self.total
+        if self.center_mark:
+            score += self.weights[0] if self.center_mark == 1 else -self.weights[0]
+        return score if player == 1 else -score
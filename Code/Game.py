@@ -1,12 +1,69 @@
 import sys
 import os
+import time
+import numpy as np
 
 # Add the parent directory to the system path to allow module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 from Code.Player import Player  # Import Player class
 from Code.Board import Board  # Import Board class
+from Code.BitBoard import BitBoard  # Import BitBoard class (bitmask backend)
 from Code.MyBot import MyBot  # Import MyBot class (AI Player)
+from Code.SearchStats import aggregate  # Import the statistics aggregation
+
+# Available board implementations, selectable by name
+BOARD_BACKENDS = {"numpy": Board, "bitboard": BitBoard}
+
+
+class GameResult:
+    """
+    Outcome of a finished game.
+
+    Attributes:
+        winner (Player): The winning player, or None for a draw.
+        moves (list): (row, col, player number) of every move in order.
+        think_times (list): Seconds each move took to choose.
+        grid (np.ndarray): The final board.
+        stats (list): Per move, the bot's SearchStats as a dict, or None for
+                      moves by humans.
+    """
+
+    def __init__(self, winner, moves, think_times, grid, stats=None):
+        """
+        Stores the result.
+
+        :param winner: The winning player, or None for a draw.
+        :param moves: List of (row, col, player number).
+        :param think_times: List of seconds per move.
+        :param grid: The final board's grid.
+        :param stats: List of per-move statistics dicts (or None per move).
+        """
+        self.winner = winner
+        self.moves = moves
+        self.think_times = think_times
+        self.grid = grid
+        self.stats = [None] * len(moves) if stats is None else stats
+
+    @property
+    def winner_number(self):
+        """
+        The winner's player number, 0 for a draw.
+        """
+        return 0 if self.winner is None else self.winner.number
+
+    def profile(self, player_number=None):
+        """
+        Sums the search statistics over the game, see SearchStats.aggregate.
+
+        :param player_number: Only count this player's moves, or None for both.
+        :return: The aggregated statistics dict.
+        """
+        return aggregate(
+            record
+            for (_, _, number), record in zip(self.moves, self.stats)
+            if player_number is None or number == player_number
+        )
 
 
 class Game:
@@ -15,7 +72,7 @@ class Game:
     This class initializes the board and manages the turns between players.
     """
 
-    def __init__(self, rows, cols, k, player1, player2):
+    def __init__(self, rows, cols, k, player1, player2, backend="numpy"):
         """
         Initializes the game with a board and two players.
 
@@ -24,54 +81,101 @@ class Game:
         :param k: Number of consecutive marks needed to win.
         :param player1: First player (can be human or bot).
         :param player2: Second player (can be human or bot).
+        :param backend: Board implementation, a key of BOARD_BACKENDS
+                        ("numpy" or "bitboard").
         """
-        self.board = Board(rows, cols, k)  # Create the board
+        self.board = BOARD_BACKENDS[backend](rows, cols, k)  # Create the board
         self.player1 = player1  # Assign player 1
         self.player2 = player2  # Assign player 2
 
-    def game_loop(self):
+    def choose_move(self, player):
+        """
+        Asks a player for its next move.
+
+        :param player: The player to move (human or bot).
+        :return: A tuple (row, col) representing the chosen move.
         """
-        Runs the main game loop.
-        Alternates between players until there is a winner or the game ends in a draw.
+        # Determine move based on player type (human or bot)
+        if isinstance(player, MyBot):
+            return player.make_move(
+                player.number, self.board, player.mode
+            )  # AI move based on difficulty mode
+        return player.make_move(player.number, self.board)  # Human move
+
+    def play(self, before_move=None, recorder=None):
+        """
+        Plays the game to the end without any output of its own.
+        Alternates between players until there is a winner or the board is full.
+
+        :param before_move: Optional callback(board, player) run before each
+                            move, e.g. to display the board.
+        :param recorder: Optional GameRecords.GameRecordWriter that the
+                         finished game is appended to.
+        :return: A GameResult.
         """
         current_player = self.player1  # Start with player 1
-        move_count = 0  # Track the number of moves made
+        winner = None
+        moves = []  # (row, col, player number) of every move
+        think_times = []  # Seconds each move took to choose
+        stats = []  # Search statistics of each bot move
         total_moves = (
             self.board.rows * self.board.cols
         )  # Maximum possible moves before a draw
 
-        while move_count < total_moves:
-            self.board.display()  # Display the current board state
-
-            # Determine move based on player type (human or bot)
-            if isinstance(current_player, MyBot):
-                row, col = current_player.make_move(
-                    current_player.number, self.board, current_player.mode
-                )  # AI move based on difficulty mode
-            else:
-                row, col = current_player.make_move(
-                    current_player.number, self.board
-                )  # Human move
-
-            self.board.grid[row, col] = (
-                current_player.number
+        while len(moves) < total_moves:
+            if before_move is not None:
+                before_move(self.board, current_player)
+
+            start = time.perf_counter()
+            row, col = self.choose_move(current_player)
+            think_times.append(time.perf_counter() - start)
+            stats.append(
+                current_player.stats.as_dict()
+                if isinstance(current_player, MyBot)
+                else None
+            )
+
+            self.board.push(
+                row, col, current_player.number
             )  # Place the player's mark on the board
+            moves.append((row, col, current_player.number))
 
-            # Check if the current player has won
-            if self.board.has_won(current_player.number):
-                self.board.display()  # Display final board state
-                print(f"{current_player.name} wins!")  # Announce the winner
-                return
+            # Check if the current player has won with the last move
+            if self.board.has_won_at(row, col, current_player.number):
+                winner = current_player
+                break
 
             # Switch to the next player
             current_player = (
                 self.player2 if current_player == self.player1 else self.player1
             )
-            move_count += 1  # Increment move counter
 
-        # If all moves are used and no winner, it's a draw
-        self.board.display()
-        print("Game ended in a draw.")
+        # Without a winner once all moves are used, it's a draw
+        result = GameResult(
+            winner, moves, think_times, np.array(self.board.grid), stats
+        )
+        if recorder is not None:
+            recorder.append_result(self, result)
+        return result
+
+    def game_loop(self, recorder=None):
+        """
+        Runs the interactive game loop on top of play: shows the board before
+        every move and announces the result.
+
+        :param recorder: Optional GameRecords.GameRecordWriter that the
+                         finished game is appended to.
+        :return: The GameResult, with the search statistics of every bot turn.
+        """
+        result = self.play(
+            before_move=lambda board, player: board.display(), recorder=recorder
+        )
+        self.board.display()  # Display final board state
+        if result.winner is not None:
+            print(f"{result.winner.name} wins!")  # Announce the winner
+        else:
+            print("Game ended in a draw.")
+        return result
 
     def start(self):
         """Starts the game by entering the game loop."""
@@ -111,17 +215,17 @@ def welcome_screen():
         # Human vs Bot mode
         player1 = Player(input("Player name: "), 1, 0)
         bot_level = int(
-            input("Bot difficulty (1 - Easy, 2 - Medium, 3 - Hard): ")
+            input("Bot difficulty (1 - Easy, 2 - Medium, 3 - Hard, 4 - MCTS): ")
         )  # Choose bot difficulty
         player2 = MyBot(f"Bot Level {bot_level}", 2, bot_level)
 
     elif game_mode == "3":
         # Bot vs Bot mode
         bot1_level = int(
-            input("First bot difficulty (1 - Easy, 2 - Medium, 3 - Hard): ")
+            input("First bot difficulty (1 - Easy, 2 - Medium, 3 - Hard, 4 - MCTS): ")
         )
         bot2_level = int(
-            input("Second bot difficulty (1 - Easy, 2 - Medium, 3 - Hard): ")
+            input("Second bot difficulty (1 - Easy, 2 - Medium, 3 - Hard, 4 - MCTS): ")
         )
         player1 = MyBot(f"Bot Level {bot1_level}", 1, bot1_level)
         player2 = MyBot(f"Bot Level {bot2_level}", 2, bot2_level)
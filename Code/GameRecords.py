@@ -0,0 +1,422 @@
+import sys
+import os
+import json
+import struct
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+MAGIC = b"MNKREC01"  # First bytes of every record file
+CONFIG_RECORD = 0  # Kind byte of a player configuration record
+GAME_RECORD = 1  # Kind byte of a game record
+CONFIG_FLAG = np.uint64(1 << 63)  # Marks index entries of configuration records
+
+# Header of a game record: kind, rows, cols, k, player number of the first
+# move, winner's player number (0 for a draw), configuration ids of player 1
+# and player 2 and the number of moves, followed by one little-endian uint16
+# cell index per move. struct is used since records are packed one at a time.
+GAME_HEADER = struct.Struct("<6B3H")
+# Header of a configuration record: kind and length, followed by the
+# configuration as UTF-8 JSON
+CONFIG_HEADER = struct.Struct("<BH")
+
+
+def index_path(path):
+    """
+    :param path: Path of a record file.
+    :return: Path of its index file.
+    """
+    return path + ".idx"
+
+
+def player_config(player):
+    """
+    Describes a player for the record file.
+
+    :param player: A Player or MyBot.
+    :return: JSON-serializable dict with the player's type, name and mode.
+    """
+    return {"type": type(player).__name__, "name": player.name, "mode": player.mode}
+
+
+def check_field(name, value, limit):
+    """
+    Checks that a value fits its field of the record format.
+
+    :param name: Name of the value for the error message.
+    :param value: The value.
+    :param limit: Largest value the field holds.
+    :raises ValueError: If the value is negative or above the limit.
+    """
+    if not 0 <= value <= limit:
+        raise ValueError(
+            f"{name} must be between 0 and {limit} to be recorded, got {value}"
+        )
+
+
+def scan_offsets(data, offset=len(MAGIC)):
+    """
+    Walks the records of a file one by one and lists where each starts. The
+    walk stops at the last complete record, so the tail a writer has not
+    finished (or left behind when interrupted) is ignored.
+
+    :param data: The file's bytes (e.g. a memmap), starting with MAGIC.
+    :param offset: Offset of the first record to walk from.
+    :return: uint64 array of record offsets, with CONFIG_FLAG set on
+             configuration records.
+    """
+    offsets = []
+    while offset < len(data):
+        end = record_end(data, offset)
+        if end > len(data):
+            break
+        if data[offset] == CONFIG_RECORD:
+            offsets.append(offset | 1 << 63)
+        else:
+            offsets.append(offset)
+        offset = end
+    return np.array(offsets, dtype="<u8")
+
+
+def record_end(data, offset):
+    """
+    :param data: The file's bytes.
+    :param offset: Offset of a record.
+    :return: Offset just past the record, past the end of data if the record
+             is cut short.
+    """
+    if data[offset] == CONFIG_RECORD:
+        if offset + CONFIG_HEADER.size > len(data):
+            return offset + CONFIG_HEADER.size
+        _, length = CONFIG_HEADER.unpack_from(data, offset)
+        return offset + CONFIG_HEADER.size + length
+    if offset + GAME_HEADER.size > len(data):
+        return offset + GAME_HEADER.size
+    count = GAME_HEADER.unpack_from(data, offset)[-1]
+    return offset + GAME_HEADER.size + 2 * count
+
+
+def rebuild_index(path):
+    """
+    Rewrites the index file of a record file from its complete records, e.g.
+    after the index was lost. Readers never write the index, they rebuild it
+    in memory.
+
+    :param path: Path of the record file.
+    :return: The offsets written to the index.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a game record file")
+    offsets = scan_offsets(data)
+    offsets.tofile(index_path(path))
+    return offsets
+
+
+class GameRecord:
+    """
+    One recorded game.
+
+    Attributes:
+        rows (int): Number of rows in the board.
+        cols (int): Number of columns in the board.
+        k (int): Number of consecutive marks needed to win.
+        first (int): Player number of the first move; turns alternate.
+        result (int): Winner's player number, 0 for a draw.
+        players (tuple): Configuration dicts of player 1 and player 2.
+        cells (np.ndarray): Flat cell index (row * cols + col) of every move.
+    """
+
+    def __init__(self, rows, cols, k, first, result, players, cells):
+        """
+        Stores the record.
+
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        :param first: Player number of the first move.
+        :param result: Winner's player number, 0 for a draw.
+        :param players: Configuration dicts of player 1 and player 2.
+        :param cells: Array of flat cell indices.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.first = first
+        self.result = result
+        self.players = players
+        self.cells = cells
+
+    def __len__(self):
+        """
+        :return: The number of moves.
+        """
+        return len(self.cells)
+
+    def moves(self):
+        """
+        :return: List of (row, col, player number) of every move, as in GameResult.
+        """
+        rows, cols = np.divmod(self.cells, self.cols)
+        players = [self.first, 1 if self.first == 2 else 2] * (len(self.cells) // 2 + 1)
+        return list(zip(rows.tolist(), cols.tolist(), players))
+
+
+class GameRecordWriter:
+    """
+    Appends games to a record file.
+
+    The file starts with MAGIC and then holds records back to back: game
+    records (a 12-byte header and 2 bytes per move) and, the first time a
+    player configuration is used, a configuration record with its JSON. Games
+    refer to configurations by id, so a farm playing the same bots millions
+    of times stores their description once. Next to the file an index of
+    record offsets is kept, which lets the reader open it without scanning.
+
+    Writes are buffered; use the writer as a context manager or call close().
+    """
+
+    def __init__(self, path):
+        """
+        Opens a record file for appending, creating it if needed.
+
+        :param path: Path of the record file.
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.configs = {}  # JSON text -> configuration id
+        self.last_players = None  # Configurations of the previous game
+        self.last_ids = None  # and their ids
+        if os.path.exists(path) and os.path.getsize(path):
+            reader = GameRecords(path)  # Checks the file and finds its records
+            for config_id, config in enumerate(reader.configs):
+                self.configs[json.dumps(config, sort_keys=True)] = config_id
+            self.offset, index = reader.end, reader.index
+            del reader
+            if self.offset < os.path.getsize(path):
+                os.truncate(path, self.offset)  # Drop a record cut short
+            if not os.path.exists(index_path(path)) or os.path.getsize(
+                index_path(path)
+            ) != 8 * len(index):
+                index.tofile(index_path(path))
+        else:
+            with open(path, "wb") as file:
+                file.write(MAGIC)
+            open(index_path(path), "wb").close()
+            self.offset = len(MAGIC)
+        self.file = open(path, "ab")
+        self.index = open(index_path(path), "ab")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def config_id(self, config):
+        """
+        Finds the id of a player configuration, writing it on first use.
+
+        :param config: JSON-serializable dict, or None.
+        :return: The configuration id.
+        """
+        text = json.dumps(config, sort_keys=True)
+        config_id = self.configs.get(text)
+        if config_id is None:
+            config_id = len(self.configs)
+            payload = text.encode("utf-8")
+            check_field("Configuration id", config_id, 0xFFFF)
+            check_field("Configuration length", len(payload), 0xFFFF)
+            self.configs[text] = config_id
+            header = CONFIG_HEADER.pack(CONFIG_RECORD, len(payload))
+            self.write(header + payload, self.offset | 1 << 63)
+        return config_id
+
+    def write(self, record, index_entry):
+        """
+        Appends raw record bytes and their index entry.
+
+        :param record: The record's bytes.
+        :param index_entry: The record's offset, with CONFIG_FLAG if needed.
+        """
+        self.file.write(record)
+        self.index.write(index_entry.to_bytes(8, "little"))
+        self.offset += len(record)
+
+    def append(self, rows, cols, k, moves, result, players=(None, None)):
+        """
+        Appends one game.
+
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        :param moves: List of (row, col, player number), as in GameResult.moves.
+        :param result: Winner's player number, 0 for a draw.
+        :param players: Configuration dicts of player 1 and player 2.
+        :raises ValueError: If a value does not fit the record format: rows,
+                            cols and k up to 255, up to 65535 moves and
+                            configurations.
+        """
+        for name, value in (("rows", rows), ("cols", cols), ("k", k)):
+            check_field(name, value, 0xFF)
+        check_field("Number of moves", len(moves), 0xFFFF)
+        if players != self.last_players:
+            # Farms record the same players over and over, so only new
+            # configurations need to be serialized
+            self.last_ids = self.config_id(players[0]), self.config_id(players[1])
+            self.last_players = tuple(
+                None if config is None else dict(config) for config in players
+            )  # Copies, in case the caller changes its dicts later
+        config1, config2 = self.last_ids
+        first = moves[0][2] if moves else 1
+        header = GAME_HEADER.pack(
+            GAME_RECORD, rows, cols, k, first, result, config1, config2, len(moves)
+        )
+        cells = struct.pack(
+            f"<{len(moves)}H", *[row * cols + col for row, col, _ in moves]
+        )
+        self.write(header + cells, self.offset)
+
+    def append_result(self, game, result):
+        """
+        Appends a finished Game.
+
+        :param game: The Game that was played.
+        :param result: The GameResult returned by its play or game_loop.
+        """
+        board = game.board
+        self.append(
+            board.rows,
+            board.cols,
+            board.k,
+            result.moves,
+            result.winner_number,
+            (player_config(game.player1), player_config(game.player2)),
+        )
+
+    def flush(self):
+        """
+        Writes buffered records to disk, so readers see them.
+        """
+        self.file.flush()
+        self.index.flush()
+
+    def close(self):
+        """
+        Flushes and closes the files.
+        """
+        self.file.close()
+        self.index.close()
+
+
+class GameRecords:
+    """
+    Read-only view of a record file backed by a memory map.
+
+    Games are found through the index file, so opening costs one read of the
+    index (8 bytes per record) and a game is only touched when it is accessed.
+    """
+
+    def __init__(self, path):
+        """
+        Maps a record file and loads its index. Records the index misses are
+        found by walking the file from the last indexed one; the files are
+        not changed, since a writer may be appending to them. A record the
+        writer has not finished is left out.
+
+        :param path: Path of a file written by GameRecordWriter.
+        :raises ValueError: If the file is not a game record file.
+        """
+        self.path = path
+        self.data = np.memmap(path, dtype="u1", mode="r")
+        if bytes(self.data[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a game record file")
+        offsets = np.zeros(0, dtype="<u8")
+        if os.path.exists(index_path(path)):
+            offsets = self.complete_prefix(np.fromfile(index_path(path), dtype="<u8"))
+        self.end = len(MAGIC)  # Offset just past the last complete record
+        if len(offsets):
+            self.end = record_end(self.data, int(offsets[-1] & ~CONFIG_FLAG))
+        offsets = np.concatenate([offsets, scan_offsets(self.data, self.end)])
+        if len(offsets):
+            self.end = record_end(self.data, int(offsets[-1] & ~CONFIG_FLAG))
+        self.index = offsets  # Offsets of every record, as in the index file
+        is_config = (offsets & CONFIG_FLAG) != 0
+        self.offsets = offsets[~is_config].astype(np.int64)
+        self.configs = [
+            self.read_config(int(offset & ~CONFIG_FLAG))
+            for offset in offsets[is_config]
+        ]
+
+    def complete_prefix(self, offsets):
+        """
+        Drops index entries of records that are not (yet) complete in the
+        file, e.g. when the index was flushed before the records.
+
+        :param offsets: The offsets read from the index file.
+        :return: The entries up to the last complete record.
+        """
+        count = int(np.searchsorted(offsets & ~CONFIG_FLAG, len(self.data)))
+        while count and (
+            record_end(self.data, int(offsets[count - 1] & ~CONFIG_FLAG))
+            > len(self.data)
+        ):
+            count -= 1
+        return offsets[:count]
+
+    def read_config(self, offset):
+        """
+        :param offset: Offset of a configuration record.
+        :return: The decoded configuration.
+        """
+        _, length = CONFIG_HEADER.unpack_from(self.data, offset)
+        start = offset + CONFIG_HEADER.size
+        return json.loads(bytes(self.data[start : start + length]))
+
+    def __len__(self):
+        """
+        :return: The number of games in the file.
+        """
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """
+        :param index: Position of the game in the file (negative counts from the end).
+        :return: A GameRecord whose cells are a read-only view into the file.
+        """
+        offset = int(self.offsets[index])
+        _, rows, cols, k, first, result, config1, config2, count = (
+            GAME_HEADER.unpack_from(self.data, offset)
+        )
+        cells = np.frombuffer(self.data, "<u2", count, offset + GAME_HEADER.size)
+        return GameRecord(
+            rows,
+            cols,
+            k,
+            first,
+            result,
+            (self.configs[config1], self.configs[config2]),
+            cells,
+        )
+
+    def __iter__(self):
+        """
+        Iterates over the games in file order.
+        """
+        for index in range(len(self.offsets)):
+            yield self[index]
+
+    def cells(self, index):
+        """
+        Reads only the moves of a game, without building a GameRecord.
+
+        :param index: Position of the game in the file.
+        :return: Read-only uint16 array of flat cell indices.
+        """
+        offset = int(self.offsets[index])
+        count = GAME_HEADER.unpack_from(self.data, offset)[-1]
+        return np.frombuffer(self.data, "<u2", count, offset + GAME_HEADER.size)
@@ -0,0 +1,222 @@
+import sys
+import os
+import math
+import time
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.SelfPlay import play_out  # Import the vectorized playouts
+
+
+class Node:
+    """
+    A node of the Monte Carlo search tree.
+
+    Attributes:
+        move (tuple): The move (row, col) that leads to this node, None for the root.
+        mark (int): The player number that made the move.
+        parent (Node): The parent node, None for the root.
+        children (dict): Expanded children by move.
+        untried (list): Moves not expanded yet.
+        visits (int): Number of playouts through this node.
+        wins (float): Playouts won by `mark` through this node, draws count half.
+        terminal (int): None while the game goes on, else the winner (0 for a draw).
+    """
+
+    def __init__(self, move, mark, parent, untried, terminal=None):
+        """
+        Creates an unvisited node.
+
+        :param move: The move leading to this node.
+        :param mark: The player number that made the move.
+        :param parent: The parent node.
+        :param untried: The moves available in this node's position.
+        :param terminal: The winner if the position is final, else None.
+        """
+        self.move = move
+        self.mark = mark
+        self.parent = parent
+        self.children = {}
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal = terminal
+
+    def select_child(self, exploration):
+        """
+        Picks the child with the highest UCT score.
+
+        :param exploration: The UCT exploration constant.
+        :return: The selected child node.
+        """
+        log_visits = math.log(self.visits)
+        return max(
+            self.children.values(),
+            key=lambda child: child.wins / child.visits
+            + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+
+class MCTS:
+    """
+    Monte Carlo Tree Search with UCT selection.
+
+    Every expanded leaf is evaluated by a batch of random playouts that run
+    vectorized in NumPy (see SelfPlay.play_out). The tree is kept between
+    moves: on the next search the subtree of the position actually reached
+    becomes the new root.
+    """
+
+    def __init__(self, exploration=1.4, rollout_batch=32, seed=None):
+        """
+        Initializes the search.
+
+        :param exploration: The UCT exploration constant.
+        :param rollout_batch: Playouts run at once from every new leaf.
+        :param seed: Seed for the playouts' random number generator.
+        """
+        self.exploration = exploration
+        self.rollout_batch = rollout_batch
+        self.rng = np.random.default_rng(seed)
+        self.root = None  # Root of the kept tree
+        self.root_grid = None  # Position of the root, to find it again
+        self.iterations = 0  # Iterations of the last search
+
+    def find_root(self, board, player):
+        """
+        Reuses the subtree of the kept tree that matches the board, if any.
+
+        :param board: The game board.
+        :param player: The player number to move.
+        :return: The root node for the search.
+        """
+        grid = np.array(board.grid)
+        node = self.root
+        if node is not None and self.root_grid.shape == grid.shape:
+            if np.all((self.root_grid == 0) | (self.root_grid == grid)):
+                # Follow the marks added since the last search through the tree
+                added = {
+                    (int(row), int(col))
+                    for row, col in zip(*np.nonzero(grid != self.root_grid))
+                }
+                while node is not None and added:
+                    node = next(
+                        (
+                            child
+                            for move, child in node.children.items()
+                            if move in added and grid[move] == child.mark
+                        ),
+                        None,
+                    )
+                    if node is not None:
+                        added.discard(node.move)
+                if node is not None and node.mark != player:
+                    node.parent = None  # Detach, the old tree can be freed
+                    self.root_grid = grid
+                    self.root = node
+                    return node
+
+        self.root_grid = grid
+        self.root = Node(
+            None, 1 if player == 2 else 2, None, list(board.available_moves())
+        )
+        return self.root
+
+    def search(self, board, player, iterations=None, time_limit=None):
+        """
+        Runs the search from the board's position and picks the most visited move.
+
+        :param board: The game board; it is restored before returning.
+        :param player: The player number to move.
+        :param iterations: Maximum number of iterations, or None.
+        :param time_limit: Maximum number of seconds, or None.
+        :return: A tuple (row, col) representing the chosen move.
+        """
+        if iterations is None and time_limit is None:
+            iterations = 1000  # Some cap is needed
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        root = self.find_root(board, player)
+
+        self.iterations = 0
+        while True:
+            self.iterate(board, root)  # At least one iteration, to have a move
+            self.iterations += 1
+            if iterations is not None and self.iterations >= iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return max(root.children.values(), key=lambda child: child.visits).move
+
+    def iterate(self, board, root):
+        """
+        One MCTS iteration: selection, expansion, batched playouts, backpropagation.
+
+        :param board: The game board at the root position.
+        :param root: The root node.
+        """
+        node = root
+        path = []  # Moves pushed on the board, popped at the end
+        try:
+            # Selection: descend through fully expanded nodes
+            while node.terminal is None and not node.untried and node.children:
+                node = node.select_child(self.exploration)
+                board.push(*node.move, node.mark)
+                path.append(node.move)
+
+            # Expansion: add one untried child
+            if node.terminal is None and node.untried:
+                move = node.untried.pop(int(self.rng.integers(len(node.untried))))
+                mark = 1 if node.mark == 2 else 2
+                board.push(*move, mark)
+                path.append(move)
+                remaining = [cell for cell in node.untried if cell != move]
+                remaining += [
+                    cell for cell in node.children if cell != move
+                ]  # All empty cells of the new position
+                terminal = None
+                if board.has_won_at(*move, mark):
+                    terminal = mark
+                elif not remaining:
+                    terminal = 0
+                child = Node(move, mark, node, remaining, terminal)
+                node.children[move] = child
+                node = child
+
+            # Simulation: a batch of vectorized random playouts
+            count = self.rollout_batch
+            if node.terminal is not None:
+                wins = {1: 0.0, 2: 0.0}
+                if node.terminal == 0:
+                    wins = {1: count / 2, 2: count / 2}
+                else:
+                    wins[node.terminal] = float(count)
+            else:
+                grids = np.repeat(
+                    np.array(board.grid, dtype=np.int8).reshape(1, -1), count, axis=0
+                )
+                winners, _ = play_out(
+                    grids,
+                    board.rows,
+                    board.cols,
+                    board.k,
+                    1 if node.mark == 2 else 2,
+                    {1: 1, 2: 1},
+                    self.rng,
+                )
+                draws = np.count_nonzero(winners == 0) / 2
+                wins = {
+                    1: np.count_nonzero(winners == 1) + draws,
+                    2: np.count_nonzero(winners == 2) + draws,
+                }
+
+            # Backpropagation
+            while node is not None:
+                node.visits += count
+                node.wins += wins[node.mark]
+                node = node.parent
+        finally:
+            for _ in path:
+                board.pop()
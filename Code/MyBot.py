@@ -1,12 +1,45 @@
 import sys
 import os
 import random
+import time
 import numpy as np
 
 # Add parent directory to system path to allow module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 from Code.Player import Player  # Import Player class
+from Code.Evaluator import (
+    WindowEvaluator,
+    WIN_SCORE,
+    default_profile_directory,
+    evaluate_batch,
+    load_weight_profiles,
+)  # Import the evaluation
+from Code.MCTS import MCTS  # Import the Monte Carlo Tree Search
+from Code.SearchStats import SearchStats, TraceWriter  # Import the instrumentation
+from Code.Tablebase import load_tablebase  # Import the solved positions
+from Code.ThreatSearch import ThreatSearch  # Import the forcing-move search
+from Code.TranspositionTable import (
+    TranspositionTable,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+)  # Import the search cache
+
+# Keys mixed into the board hash for the search context: the same stones are
+# scored differently depending on the bot's player number and the side to move
+_context_rng = random.Random(2024)
+CONTEXT_KEYS = {
+    (player, maximizing): _context_rng.getrandbits(63)
+    for player in (1, 2)
+    for maximizing in (True, False)
+}
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time or node budget of a move is used up.
+    """
 
 
 class MyBot(Player):
@@ -17,113 +50,625 @@ class MyBot(Player):
         - Mode 1: Random moves.
         - Mode 2: Tries to win immediately or block the opponent.
         - Mode 3: Advanced Minimax AI with board evaluation.
+        - Mode 4: Monte Carlo Tree Search with batched random playouts.
     """
 
+    def __init__(
+        self,
+        name,
+        number,
+        mode,
+        tt_size=1 << 18,
+        time_limit=1.0,
+        node_limit=None,
+        max_depth=None,
+        move_ordering=True,
+        neighbourhood=None,
+        weights=None,
+        weight_profiles=None,
+        symmetry=True,
+        opening_book=None,
+        tablebase=None,
+        threat_nodes=20000,
+        workers=1,
+        mcts_iterations=None,
+        rollout_batch=32,
+        trace=None,
+    ):
+        """
+        Initializes the bot.
+
+        :param name: The bot's name.
+        :param number: The bot's player number (1 or 2).
+        :param mode: Difficulty mode (1 = Random, 2 = Smart blocking, 3 = Minimax AI,
+                     4 = MCTS).
+        :param tt_size: Maximum number of positions kept in the transposition table.
+        :param time_limit: Seconds a mode 3 move may take, or None for no limit.
+        :param node_limit: Search nodes a mode 3 move may visit, or None for no limit.
+        :param max_depth: Deepest iteration of a mode 3 search, or None to allow
+                          searching until the board is full.
+        :param move_ordering: Whether to order moves by killer moves and history
+                              (the transposition table move always goes first).
+        :param neighbourhood: If set, the search only considers empty cells within
+                              this many rows/columns of an existing mark.
+        :param weights: Evaluation weights (center_bonus, w_1, ..., w_{k-1}),
+                        or None for the board's tuned profile, if any, or
+                        else Evaluator.default_weights(k).
+        :param weight_profiles: Directory of tuned weight profiles (see Tuning),
+                                loaded now; the profile matching the board's
+                                (rows, cols, k) is used when weights is None.
+                                None for the repository's Weights directory,
+                                False to use no profiles. A missing directory
+                                or profile leaves the default weights.
+        :param symmetry: Whether positions that are rotations or reflections of
+                         each other share transposition table entries.
+        :param opening_book: Path of an opening book file (see OpeningBook) that
+                             mode 3 plays from before searching, or None.
+        :param tablebase: Path of a tablebase file (see Tablebase) that mode 3
+                          plays perfectly from when the position is stored, or None.
+        :param threat_nodes: Node budget of the threat-space search that mode 3
+                             runs before the main search on boards with k >= 4,
+                             or 0 to skip it. It also gets at most a quarter
+                             of the time limit.
+        :param workers: Number of processes for the mode 3 search; more than one
+                        splits the root moves over a pool, see ParallelSearch.
+        :param mcts_iterations: Iterations a mode 4 move may run, or None to
+                                only use the time limit.
+        :param rollout_batch: Random playouts per new mode 4 tree node.
+        :param trace: Path of a JSON-lines file that the statistics of every
+                      move are appended to (see SearchStats), or None.
+        """
+        super().__init__(name, number, mode)
+        self.transposition_table = TranspositionTable(
+            tt_size
+        )  # Search results, kept across moves
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.max_depth = max_depth
+        self.nodes = 0  # Nodes visited by the current search
+        self.deadline = None  # time.monotonic() value at which the search stops
+        self.shared_alpha = None  # Alpha shared by parallel workers, see ParallelSearch
+        self.completed_depth = 0  # Deepest fully searched iteration of this move
+        self.search_depth = 0  # Depth of the running iteration, to compute plies
+        self.move_ordering = move_ordering
+        self.neighbourhood = neighbourhood
+        self.killers = {}  # Ply -> up to two recent moves that caused a cutoff
+        self.history = {}  # (mark, move) -> how often and deep it caused cutoffs
+        self.weights = weights
+        if weight_profiles is None:
+            weight_profiles = default_profile_directory()
+        self.weight_profiles = (
+            load_weight_profiles(weight_profiles) if weight_profiles else {}
+        )
+        self.symmetry = symmetry
+        self.symmetries = (0,)  # Symmetries of the searched board, see prepare_search
+        self.evaluator = None  # Incremental evaluation of the searched board
+        self.opening_book = opening_book
+        self.tablebase = tablebase
+        self.threat_nodes = threat_nodes
+        self.workers = workers
+        self.parallel_searcher = None  # Worker pool, started on first use
+        self.mcts_iterations = mcts_iterations
+        self.mcts = MCTS(rollout_batch=rollout_batch)  # Tree kept across moves
+        self.stats = SearchStats()  # Statistics of the last move
+        self.trace = trace
+        self.trace_writer = None  # Opened on the first traced move
+        # Options the worker processes build their own bots with
+        self.search_options = {
+            "tt_size": tt_size,
+            "node_limit": node_limit,
+            "move_ordering": move_ordering,
+            "neighbourhood": neighbourhood,
+            "weights": weights,
+            "weight_profiles": weight_profiles,
+            "symmetry": symmetry,
+        }
+
     def make_move(self, current_player, board, mode):
         """
-        Determines the bot's next move based on the selected mode.
+        Determines the bot's next move based on the selected mode and records
+        the statistics of the decision in `self.stats`.
 
         :param current_player: The bot's player number (1 or 2).
         :param board: The game board.
-        :param mode: Difficulty mode (1 = Random, 2 = Smart blocking, 3 = Minimax AI).
+        :param mode: Difficulty mode (1 = Random, 2 = Smart blocking, 3 = Minimax AI,
+                     4 = MCTS).
         :return: A tuple (row, col) representing the chosen move.
         """
+        stats = self.stats = SearchStats(current_player, mode)
+        lookups = self.transposition_table.hits + self.transposition_table.misses
+        hits = self.transposition_table.hits
+        start = time.perf_counter()
+
+        move = self.select_move(current_player, board, mode)
+
+        stats.elapsed = time.perf_counter() - start
+        stats.move = move
+        stats.tt_hits = self.transposition_table.hits - hits
+        stats.tt_lookups = (
+            self.transposition_table.hits + self.transposition_table.misses - lookups
+        )
+        if self.trace is not None:
+            if self.trace_writer is None:
+                self.trace_writer = TraceWriter(self.trace)
+            self.trace_writer.write(stats, name=self.name)
+        return move
+
+    def select_move(self, current_player, board, mode):
+        """
+        Chooses the move for make_move and notes in `self.stats` where it
+        came from.
+
+        :param current_player: The bot's player number (1 or 2).
+        :param board: The game board.
+        :param mode: Difficulty mode.
+        :return: A tuple (row, col), or None if the board is full.
+        """
+        stats = self.stats
         # Get all available (empty) positions on the board
-        available_moves = [
-            (row, col)
-            for row in range(board.rows)
-            for col in range(board.cols)
-            if board.grid[row, col] == 0
-        ]
+        available_moves = board.available_moves()
 
         if not available_moves:
             return None  # No available moves
 
         if mode == 1:
+            stats.source = "random"
             return random.choice(available_moves)  # Random move
 
         # Mode 2: Check for an immediate win or block opponent's win
+        stats.source = "rule"
         for row, col in available_moves:
-            board.grid[row, col] = current_player
-            if board.has_won(current_player):  # Check if the move results in a win
-                board.grid[row, col] = 0  # Undo move
+            board.push(row, col, current_player)
+            stats.win_checks += 1
+            if board.has_won_at(
+                row, col, current_player
+            ):  # Check if the move results in a win
+                board.pop()  # Undo move
                 return row, col
-            board.grid[row, col] = 0  # Undo move
+            board.pop()  # Undo move
 
         # Block opponent's immediate win
         opponent = 1 if current_player == 2 else 2
         for row, col in available_moves:
-            board.grid[row, col] = opponent
-            if board.has_won(opponent):  # If opponent is about to win, block them
-                board.grid[row, col] = 0  # Undo move
+            board.push(row, col, opponent)
+            stats.win_checks += 1
+            if board.has_won_at(
+                row, col, opponent
+            ):  # If opponent is about to win, block them
+                board.pop()  # Undo move
                 return row, col
-            board.grid[row, col] = 0  # Undo move
+            board.pop()  # Undo move
 
         # Mode 3: Use Minimax AI with Alpha-Beta Pruning
         if mode == 3:
-            empty_spaces = sum(sum(board.grid == 0))
-            depth = self.get_dynamic_depth(empty_spaces)  # Adjust depth dynamically
-            _, best_move = self.minimax(
-                board, current_player, True, -np.inf, np.inf, depth
+            # One deadline for the whole move, shared by the threat search
+            # and the main search
+            deadline = None
+            if self.time_limit is not None:
+                deadline = time.monotonic() + self.time_limit
+            for source, lookup in (
+                ("tablebase", self.tablebase_move),
+                ("book", self.book_move),
+            ):
+                move = lookup(board, current_player)
+                if move is not None:
+                    stats.source = source
+                    return move  # Known position, no search needed
+            move, proven = self.threat_move(board, current_player, deadline)
+            if proven:
+                stats.source = "threat"
+                return move  # A VCF wins against every defence
+            # A VCT ignores quiet defences, so its move is only tried first
+            stats.source = "search"
+            move = self.iterative_deepening(
+                board, current_player, available_moves, deadline, first_move=move
+            )
+            stats.nodes = self.nodes
+            stats.depth = self.completed_depth
+            return move
+
+        # Mode 4: Use Monte Carlo Tree Search
+        if mode == 4:
+            stats.source = "mcts"
+            return self.mcts.search(
+                board, current_player, self.mcts_iterations, self.time_limit
             )
-            return best_move
 
+        stats.source = "random"
         return random.choice(
             available_moves
         )  # Fallback to random if no better move is found
 
-    def get_dynamic_depth(self, empty_spaces):
+    def iterative_deepening(
+        self, board, player, available_moves, deadline=None, first_move=None
+    ):
         """
-        Adjusts search depth dynamically based on remaining empty spaces.
+        Searches with Minimax at depth 1, 2, 3, ... until the time or node
+        budget runs out, the board is full or a forced result is found.
 
-        :param empty_spaces: Number of empty spaces on the board.
-        :return: The appropriate depth level for the Minimax search.
+        An interrupted iteration is discarded, so the move always comes from
+        the last completed depth. The best move of each iteration is stored in
+        the transposition table and searched first by the next iteration.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :param available_moves: The empty cells of the board.
+        :param deadline: time.monotonic() value at which the search stops, or
+                         None to allow `self.time_limit` from now.
+        :param first_move: Root move to search first in the first iteration,
+                           e.g. an unproven threat-search win, or None.
+        :return: A tuple (row, col) representing the chosen move.
         """
-        if empty_spaces > 12:
-            return 4  # Early game: Shallow search
-        elif empty_spaces > 6:
-            return 6  # Mid-game: Medium depth
-        else:
-            return 8  # Endgame: Deep search
+        if deadline is None and self.time_limit is not None:
+            deadline = time.monotonic() + self.time_limit
+        if self.workers > 1:
+            if first_move in available_moves:
+                available_moves = [first_move] + [
+                    move for move in available_moves if move != first_move
+                ]
+            return self.parallel_search(board, player, available_moves, deadline)
+
+        self.prepare_search(board)
+        self.begin_search()
+        self.nodes = 0
+        self.completed_depth = 0
+        self.deadline = deadline
+        max_depth = len(available_moves)
+        if self.max_depth is not None:
+            max_depth = min(max_depth, self.max_depth)
+
+        if first_move is not None:
+            # A depth-0 entry for the root is never used as a result, only its
+            # move is searched first, until the first iteration replaces it
+            position_hash, transform = board.canonical_hash(self.symmetries)
+            self.transposition_table.store(
+                position_hash ^ CONTEXT_KEYS[player, True],
+                0,
+                UPPER_BOUND,
+                -np.inf,
+                board.to_canonical(first_move, transform),
+            )
+
+        best_move = available_moves[0]
+        for depth in range(1, max_depth + 1):
+            self.search_depth = depth
+            try:
+                value, move = self.minimax(board, player, True, -np.inf, np.inf, depth)
+            except SearchTimeout:
+                break  # Keep the move of the last completed depth
+            best_move = move
+            self.completed_depth = depth
+            if abs(value) >= WIN_SCORE:
+                break  # Forced win or loss, deeper searches cannot change it
+        return best_move
+
+    def begin_search(self):
+        """
+        Prepares the search state kept across moves for the search of a new
+        root position.
+        """
+        self.transposition_table.new_search()  # Age entries of earlier moves
+        self.killers = {}  # Plies have shifted since the last move
+        self.history = {
+            key: score // 2 for key, score in self.history.items()
+        }  # Age the history, recent cutoffs matter most
+
+    def threat_move(self, board, player, deadline=None):
+        """
+        Looks for a forced win made only of threats (see ThreatSearch): first
+        by fours alone, then also with threes. Alpha-beta would need a far
+        deeper search to see these wins on large boards.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :param deadline: time.monotonic() value at which the whole move must be
+                         done, or None to allow `self.time_limit` from now.
+                         The threat search gets at most a quarter of the
+                         time left, the rest is kept for the main search.
+        :return: A tuple (move, proven): the first move of the win found, or
+                 None, and whether it is a proven win. Only a VCF is: a VCT
+                 leaves quiet defences to its threes out.
+        """
+        if not self.threat_nodes or board.k < 4:
+            return None, False  # Short lines are covered by the main search
+        now = time.monotonic()
+        if deadline is None and self.time_limit is not None:
+            deadline = now + self.time_limit
+        if deadline is not None:
+            deadline = now + max(deadline - now, 0) / 4
+        threat_search = ThreatSearch(board, self.threat_nodes, deadline)
+        move = threat_search.find_win(player, vct=False)
+        if move is not None:
+            return move, True
+        return threat_search.find_win(player, vct=True), False
+
+    def tablebase_move(self, board, player):
+        """
+        Looks the position up in the tablebase, if the bot has one.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :return: A perfect move (row, col), or None if the position is not stored.
+        """
+        if self.tablebase is None:
+            return None
+        return load_tablebase(self.tablebase).best_move(board, player)
+
+    def book_move(self, board, player):
+        """
+        Looks the position up in the opening book, if the bot has one.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :return: A tuple (row, col), or None if the position is not in the book.
+        """
+        if self.opening_book is None:
+            return None
+        # Imported here, OpeningBook itself builds on MyBot
+        from Code.OpeningBook import load_book, side_to_move
+
+        if side_to_move(board) != player:
+            return None  # The book assumes player 1 moved first
+        return load_book(self.opening_book).lookup(board)
+
+    def parallel_search(self, board, player, available_moves, deadline=None):
+        """
+        Runs the iterative deepening on a pool of `self.workers` processes,
+        which is started on first use and kept for later moves.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :param available_moves: The empty cells of the board.
+        :param deadline: time.monotonic() value at which the search stops, or
+                         None for no time limit.
+        :return: A tuple (row, col) representing the chosen move.
+        """
+        # Imported here, ParallelSearch itself builds on MyBot
+        from Code.ParallelSearch import ParallelSearcher
+
+        if self.parallel_searcher is None:
+            self.parallel_searcher = ParallelSearcher(self.workers, self.search_options)
+        root_moves = available_moves
+        if self.neighbourhood is not None:
+            root_moves = self.nearby_moves(board, available_moves)
+        time_limit = None
+        if deadline is not None:
+            time_limit = max(deadline - time.monotonic(), 0)  # What is left
+        move = self.parallel_searcher.search(
+            board, player, root_moves, time_limit, self.max_depth
+        )
+        self.nodes = self.parallel_searcher.nodes
+        self.completed_depth = self.parallel_searcher.completed_depth
+        return move
+
+    def close(self):
+        """
+        Stops the worker processes of the parallel search, if any were started,
+        and closes the trace file.
+        """
+        if self.parallel_searcher is not None:
+            self.parallel_searcher.close()
+            self.parallel_searcher = None
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+            self.trace_writer = None
+
+    def prepare_search(self, board):
+        """
+        Synchronizes the incremental evaluator with the board before a search.
+        minimax relies on it for its leaf evaluations.
+
+        :param board: The game board about to be searched.
+        """
+        evaluator = self.evaluator
+        if evaluator is None or (evaluator.rows, evaluator.cols, evaluator.k) != (
+            board.rows,
+            board.cols,
+            board.k,
+        ):
+            evaluator = WindowEvaluator(
+                board.rows,
+                board.cols,
+                board.k,
+                self.board_weights(board.rows, board.cols, board.k),
+            )
+            self.evaluator = evaluator
+        evaluator.load(board.grid)
+
+        # Only symmetries that keep the center cell in place leave the
+        # evaluation unchanged; on boards with an even side that rules out some
+        self.symmetries = (0,)
+        if self.symmetry:
+            center = (board.rows // 2) * board.cols + board.cols // 2
+            self.symmetries = tuple(
+                transform
+                for transform, permutation in enumerate(board.permutations)
+                if permutation[center] == center
+            )
+
+    def check_budget(self):
+        """
+        Counts a search node and stops the search once the budget is used up.
+        The first iteration always completes, so there is a move to return.
+
+        :raises SearchTimeout: If the time or node budget is exhausted.
+        """
+        self.nodes += 1
+        if self.completed_depth == 0:
+            return
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            raise SearchTimeout()
+        if (
+            self.deadline is not None
+            and self.nodes % 256 == 0  # Reading the clock is comparatively slow
+            and time.monotonic() >= self.deadline
+        ):
+            raise SearchTimeout()
 
     def minimax(self, board, player, maximizing, alpha, beta, depth):
         """
         Implements the Minimax algorithm with Alpha-Beta Pruning.
 
+        Leaves are scored in O(1) by the incremental evaluator, which must have
+        been synchronized with the board through prepare_search.
+        Results are cached in the transposition table under the board's
+        canonical Zobrist hash (the smallest hash of its symmetric images),
+        together with their depth, bound type and best move, so positions
+        reached through different move orders, or rotated and mirrored copies
+        of them, are only searched once. Stored moves are kept in the canonical
+        orientation and mapped back on lookup.
+
         :param board: The game board.
-        :param player: The current player.
-        :param maximizing: True if maximizing, False if minimizing.
+        :param player: The bot's player number; scores are from its point of view.
+        :param maximizing: True if maximizing (player to move), False if minimizing.
         :param alpha: Alpha value for pruning.
         :param beta: Beta value for pruning.
         :param depth: Search depth.
         :return: Best score and best move (row, col).
         """
-        opponent = 1 if player == 2 else 2
-        available_moves = [
-            (row, col)
-            for row in range(board.rows)
-            for col in range(board.cols)
-            if board.grid[row, col] == 0
-        ]
+        self.check_budget()
+        available_moves = board.available_moves()
 
         if depth == 0 or not available_moves:
-            return self.evaluate_board(board, player), None  # Return board score
+            self.stats.evaluations += 1
+            return self.evaluator.score(player), None  # Return board score
+
+        # Reuse a stored result if it was searched at least as deep
+        position_hash, transform = board.canonical_hash(self.symmetries)
+        key = position_hash ^ CONTEXT_KEYS[player, maximizing]
+        entry = self.transposition_table.lookup(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, bound, value, move = entry
+            if move is not None:
+                move = board.from_canonical(move, transform)
+            tt_move = move
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return value, move
+                elif bound == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    return value, move
+        alpha_start, beta_start = alpha, beta  # Window for the bound type
+
+        if self.neighbourhood is not None:
+            available_moves = self.nearby_moves(board, available_moves)
+        mark = player if maximizing else (1 if player == 2 else 2)
+        available_moves = self.order_moves(available_moves, mark, depth, tt_move)
+
+        value, move = self.search_moves(
+            board, player, maximizing, alpha, beta, depth, available_moves
+        )
+
+        if self.shared_alpha is not None and depth == self.search_depth - 1:
+            # search_moves may have raised alpha from the other workers' results
+            alpha_start = max(alpha_start, self.shared_alpha.value)
+        if value <= alpha_start:
+            bound = UPPER_BOUND  # Failed low, the real value may be lower
+        elif value >= beta_start:
+            bound = LOWER_BOUND  # Failed high, the real value may be higher
+        else:
+            bound = EXACT
+        stored_move = None if move is None else board.to_canonical(move, transform)
+        self.transposition_table.store(key, depth, bound, value, stored_move)
+        return value, move
+
+    def order_moves(self, available_moves, mark, depth, tt_move):
+        """
+        Sorts moves so that those most likely to cause a cutoff come first:
+        the transposition table move (e.g. the previous iteration's best move),
+        then the killer moves of this ply, then by history score.
+
+        :param available_moves: The moves to order.
+        :param mark: The player number that makes the moves.
+        :param depth: Remaining search depth of the node.
+        :param tt_move: Best move stored in the transposition table, or None.
+        :return: The ordered list of moves.
+        """
+        if not self.move_ordering:
+            if tt_move in available_moves:
+                available_moves.remove(tt_move)
+                available_moves.insert(0, tt_move)
+            return available_moves
+
+        killers = self.killers.get(self.search_depth - depth, ())
+        history = self.history
+
+        def priority(move):
+            if move == tt_move:
+                return np.inf
+            if move in killers:
+                return 1e12 - killers.index(move)  # Above any history score
+            return history.get((mark, move), 0)
+
+        return sorted(available_moves, key=priority, reverse=True)
+
+    def record_cutoff(self, move, mark, depth):
+        """
+        Remembers a move that caused an alpha-beta cutoff, as a killer move for
+        its ply and in the history table.
+
+        :param move: The move that caused the cutoff.
+        :param mark: The player number that made the move.
+        :param depth: Remaining search depth of the node.
+        """
+        ply = self.search_depth - depth
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]  # Keep the two most recent killers
+        self.history[mark, move] = self.history.get((mark, move), 0) + depth * depth
+
+    def nearby_moves(self, board, available_moves):
+        """
+        Keeps only the moves within `self.neighbourhood` rows and columns of a
+        mark that is already on the board. On an empty board all moves are kept.
+
+        :param board: The game board.
+        :param available_moves: The empty cells of the board.
+        :return: The filtered list of moves.
+        """
+        return board.nearby_moves(available_moves, self.neighbourhood)
+
+    def search_moves(
+        self, board, player, maximizing, alpha, beta, depth, available_moves
+    ):
+        """
+        Searches the given moves of a Minimax node, see minimax.
+
+        :return: Best score and best move (row, col).
+        """
+        opponent = 1 if player == 2 else 2
+        evaluator = self.evaluator
+        stats = self.stats
 
         if maximizing:
             best_value = -np.inf
             best_move = None
-            for row, col in available_moves:
-                board.grid[row, col] = player
-                if board.has_won(player):  # Winning move
-                    board.grid[row, col] = 0
-                    return 10000, (row, col)
-                value, _ = self.minimax(board, opponent, False, alpha, beta, depth - 1)
-                board.grid[row, col] = 0  # Undo move
+            for index, (row, col) in enumerate(available_moves):
+                board.push(row, col, player)
+                stats.win_checks += 1
+                if board.has_won_at(row, col, player):  # Winning move
+                    board.pop()
+                    return WIN_SCORE, (row, col)
+                evaluator.place(row, col, player)
+                try:
+                    value, _ = self.minimax(
+                        board, player, False, alpha, beta, depth - 1
+                    )
+                finally:
+                    board.pop()  # Undo move, also on a timeout
+                    evaluator.remove(row, col, player)
 
                 if value > best_value:
                     best_value, best_move = value, (row, col)
                 alpha = max(alpha, best_value)
                 if beta <= alpha:
+                    self.record_cutoff((row, col), player, depth)
+                    stats.record_cutoff(index)
                     break  # Pruning
 
             return best_value, best_move
@@ -131,91 +676,78 @@ class MyBot(Player):
         else:  # Minimizing opponent's moves
             best_value = np.inf
             best_move = None
-            for row, col in available_moves:
-                board.grid[row, col] = opponent
-                if board.has_won(opponent):  # Losing move
-                    board.grid[row, col] = 0
-                    return -10000, (row, col)
-                value, _ = self.minimax(board, player, True, alpha, beta, depth - 1)
-                board.grid[row, col] = 0  # Undo move
+            # The replies to a root move of a parallel search pick up the best
+            # root score the other workers have found in the meantime
+            shared_alpha = None
+            if self.shared_alpha is not None and depth == self.search_depth - 1:
+                shared_alpha = self.shared_alpha
+            for index, (row, col) in enumerate(available_moves):
+                if shared_alpha is not None and index:
+                    alpha = max(alpha, shared_alpha.value)
+                    if beta <= alpha:
+                        break  # Pruning, this root move is no better
+                board.push(row, col, opponent)
+                stats.win_checks += 1
+                if board.has_won_at(row, col, opponent):  # Losing move
+                    board.pop()
+                    return -WIN_SCORE, (row, col)
+                evaluator.place(row, col, opponent)
+                try:
+                    value, _ = self.minimax(board, player, True, alpha, beta, depth - 1)
+                finally:
+                    board.pop()  # Undo move, also on a timeout
+                    evaluator.remove(row, col, opponent)
 
                 if value < best_value:
                     best_value, best_move = value, (row, col)
                 beta = min(beta, best_value)
                 if beta <= alpha:
+                    self.record_cutoff((row, col), opponent, depth)
+                    stats.record_cutoff(index)
                     break  # Pruning
 
             return best_value, best_move
 
     def evaluate_board(self, board, player):
         """
-        Evaluates the board position for the given player.
+        Evaluates the board position for the given player from scratch.
+
+        Every k-window in a row, column or diagonal that holds marks of only
+        one player scores for that player, the more marks the higher; holding
+        the center cell adds a bonus. The search keeps the same evaluation up
+        to date incrementally instead, see Evaluator.WindowEvaluator.
 
         :param board: The game board.
         :param player: The player's number.
         :return: The evaluation score.
         """
-        opponent = 1 if player == 2 else 2
-        score = 0
+        weights = self.board_weights(board.rows, board.cols, board.k)
+        evaluator = WindowEvaluator(board.rows, board.cols, board.k, weights)
+        return evaluator.load(board.grid).score(player)
 
-        # Control of the center
-        center_col = board.cols // 2
-        center_row = board.rows // 2
-        if board.grid[center_row, center_col] == player:
-            score += 50
-        elif board.grid[center_row, center_col] == opponent:
-            score -= 50
-
-        # Winning and blocking moves
-        for row in range(board.rows):
-            for col in range(board.cols):
-                if board.grid[row, col] == player:
-                    score += self.count_potential_wins(board, row, col, player)
-                elif board.grid[row, col] == opponent:
-                    score -= self.count_potential_wins(board, row, col, opponent)
-
-        return score
+    def evaluate_boards(self, grids, k, player):
+        """
+        Evaluates a batch of positions with the same heuristic as
+        evaluate_board, vectorized over the batch (see Evaluator.evaluate_batch).
 
-    def count_potential_wins(self, board, row, col, player):
+        :param grids: Array of shape (N, rows, cols) holding 0, 1 and 2.
+        :param k: Number of consecutive marks needed to win.
+        :param player: The player's number, or an array of shape (N,) of them.
+        :return: Float array of shape (N,) with the evaluation scores.
         """
-        Evaluates how close a player is to winning at a given position.
+        _, rows, cols = np.shape(grids)
+        return evaluate_batch(grids, k, player, self.board_weights(rows, cols, k))
 
-        :param board: The game board.
-        :param row: Row index.
-        :param col: Column index.
-        :param player: The player's number.
-        :return: A score based on potential winning moves.
+    def board_weights(self, rows, cols, k):
         """
-        opponent = 1 if player == 2 else 2
-        score = 0
-        winning_potential = 50  # Reward for nearly winning positions
-
-        # Check horizontal segment
-        if col <= board.cols - board.k:
-            segment = board.grid[row, col : col + board.k]
-            if (
-                np.count_nonzero(segment == player) == board.k - 1
-                and np.count_nonzero(segment == 0) == 1
-            ):
-                score += winning_potential
-            elif (
-                np.count_nonzero(segment == opponent) == board.k - 1
-                and np.count_nonzero(segment == 0) == 1
-            ):
-                score -= winning_potential
-
-        # Check vertical segment
-        if row <= board.rows - board.k:
-            segment = board.grid[row : row + board.k, col]
-            if (
-                np.count_nonzero(segment == player) == board.k - 1
-                and np.count_nonzero(segment == 0) == 1
-            ):
-                score += winning_potential
-            elif (
-                np.count_nonzero(segment == opponent) == board.k - 1
-                and np.count_nonzero(segment == 0) == 1
-            ):
-                score -= winning_potential
+        Picks the evaluation weights for a board configuration.
 
-        return score
+        :param rows: Number of rows in the board.
+        :param cols: Number of columns in the board.
+        :param k: Number of consecutive marks needed to win.
+        :return: The explicit weights, else the configuration's tuned profile,
+                 else None (the evaluator's defaults).
+        """
+        if self.weights is not None:
+            return self.weights
+        return self.weight_profiles.get((rows, cols, k))
@@ -0,0 +1,241 @@
+import sys
+import os
+import argparse
+import functools
+import numpy as np
+from tqdm import tqdm
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI Player)
+
+MAGIC = b"MNKBOOK1"  # First bytes of every book file
+# Header: magic, rows, cols, k, plies, number of entries
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("rows", "<u4"),
+        ("cols", "<u4"),
+        ("k", "<u4"),
+        ("plies", "<u4"),
+        ("count", "<u8"),
+    ]
+)
+
+
+def side_to_move(board):
+    """
+    Determines whose turn it is, assuming player 1 made the first move.
+
+    :param board: The game board.
+    :return: The player number to move.
+    """
+    marks1 = int(np.count_nonzero(board.grid == 1))
+    return 1 if marks1 == board.move_count - marks1 else 2
+
+
+def default_book_path(rows, cols, k):
+    """
+    Location of the book of a configuration inside the repository.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: The file path.
+    """
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "../Books",
+        f"book_{rows}x{cols}x{k}.bin",
+    )
+
+
+class OpeningBook:
+    """
+    Read-only opening book backed by a memory-mapped file.
+
+    The file holds a fixed header, the sorted canonical position hashes as
+    uint64 and, in the same order, the book move of each position as a flat
+    cell index in the canonical orientation. Lookups are a binary search over
+    the mapped keys, so opening a book costs no parsing and all processes
+    that use the same file share its pages.
+    """
+
+    def __init__(self, path):
+        """
+        Maps a book file.
+
+        :param path: Path of a file written by write_book.
+        :raises ValueError: If the file is not an opening book.
+        """
+        header = np.fromfile(path, dtype=HEADER, count=1)
+        if len(header) != 1 or header["magic"][0] != MAGIC:
+            raise ValueError(f"{path} is not an opening book")
+        self.path = path
+        self.rows = int(header["rows"][0])
+        self.cols = int(header["cols"][0])
+        self.k = int(header["k"][0])
+        self.plies = int(header["plies"][0])
+        count = int(header["count"][0])
+        if count:
+            self.keys = np.memmap(
+                path, dtype="<u8", mode="r", offset=HEADER.itemsize, shape=(count,)
+            )
+            self.moves = np.memmap(
+                path,
+                dtype="<u2",
+                mode="r",
+                offset=HEADER.itemsize + 8 * count,
+                shape=(count,),
+            )
+        else:
+            self.keys = np.zeros(0, dtype="<u8")  # Empty files cannot be mapped
+            self.moves = np.zeros(0, dtype="<u2")
+
+    def __len__(self):
+        """
+        :return: The number of positions in the book.
+        """
+        return len(self.keys)
+
+    def lookup(self, board):
+        """
+        Finds the book move of the board's position for the side to move.
+
+        :param board: The game board, of the book's configuration.
+        :return: A tuple (row, col) in the board's orientation, or None if the
+                 position is not in the book.
+        """
+        if (board.rows, board.cols, board.k) != (self.rows, self.cols, self.k):
+            return None
+        key, transform = board.canonical_hash()
+        index = int(np.searchsorted(self.keys, np.uint64(key)))
+        if index == len(self.keys) or int(self.keys[index]) != key:
+            return None
+        move = divmod(int(self.moves[index]), self.cols)
+        move = board.from_canonical(move, transform)
+        if not board.is_valid_move(*move):
+            return None  # Hash collision with a different position
+        return move
+
+
+@functools.lru_cache(maxsize=None)
+def load_book(path):
+    """
+    Opens a book once per process, so bots sharing a file share one mapping.
+
+    :param path: Path of the book file.
+    :return: An OpeningBook.
+    """
+    return OpeningBook(path)
+
+
+def write_book(path, rows, cols, k, plies, entries):
+    """
+    Writes a book file.
+
+    :param path: Path of the file to write.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param plies: Number of plies the book covers.
+    :param entries: Dict mapping canonical position hashes to canonical flat
+                    move indices.
+    """
+    keys = np.array(sorted(entries), dtype="<u8")
+    moves = np.array([entries[int(key)] for key in keys], dtype="<u2")
+    header = np.array([(MAGIC, rows, cols, k, plies, len(keys))], dtype=HEADER)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(header.tobytes())
+        file.write(keys.tobytes())
+        file.write(moves.tobytes())
+
+
+def build_book(rows, cols, k, plies, bot_options=None, progress=True):
+    """
+    Searches every position reachable within the given number of plies and
+    records the move MyBot's mode 3 plays there.
+
+    All replies are expanded at every ply, so the book covers any opponent.
+    Positions are deduplicated by their canonical hash, so each rotation or
+    reflection is searched only once. Won positions are not expanded.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param plies: Positions with fewer marks than this get a book move.
+    :param bot_options: MyBot keyword arguments for the searching bot.
+    :param progress: Whether to show a tqdm progress bar.
+    :return: Dict mapping canonical position hashes to canonical flat move indices.
+    """
+    bot_options = {"time_limit": 1.0} if bot_options is None else bot_options
+    bots = {number: MyBot("Book", number, 3, **bot_options) for number in (1, 2)}
+    entries = {}
+    level = [()]  # Move sequences leading to the positions of the current ply
+
+    with tqdm(disable=not progress, desc="Positions") as bar:
+        for ply in range(plies):
+            next_level = []
+            seen = set()  # Canonical hashes of the next ply
+            for line in level:
+                board = Board(rows, cols, k)
+                for row, col, player in line:
+                    board.push(row, col, player)
+                player = 1 if ply % 2 == 0 else 2
+                if not board.available_moves():
+                    continue  # Full board, nothing to play
+
+                key, transform = board.canonical_hash()
+                move = bots[player].make_move(player, board, 3)
+                row, col = board.to_canonical(move, transform)
+                entries[key] = row * cols + col
+                bar.update()
+
+                if ply + 1 == plies:
+                    continue
+                for row, col in board.available_moves():
+                    board.push(row, col, player)
+                    child_key, _ = board.canonical_hash()
+                    if not board.has_won_at(row, col, player) and child_key not in seen:
+                        seen.add(child_key)
+                        next_level.append(line + ((row, col, player),))
+                    board.pop()
+            level = next_level
+    return entries
+
+
+def main():
+    """
+    Command-line entry point: builds the opening book of a configuration.
+    """
+    parser = argparse.ArgumentParser(description="Build an MNK opening book")
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--plies", type=int, default=2, help="Plies the book covers")
+    parser.add_argument(
+        "--time-limit", type=float, default=1.0, help="Seconds per searched position"
+    )
+    parser.add_argument("--max-depth", type=int, default=None)
+    parser.add_argument("--output", default=None, help="Book file to write")
+    args = parser.parse_args()
+
+    entries = build_book(
+        args.rows,
+        args.cols,
+        args.k,
+        args.plies,
+        {"time_limit": args.time_limit, "max_depth": args.max_depth},
+    )
+    path = args.output or default_book_path(args.rows, args.cols, args.k)
+    write_book(path, args.rows, args.cols, args.k, args.plies, entries)
+    print(f"Wrote {len(entries)} positions to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import sys
+import os
+import argparse
+import time
+import multiprocessing
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot, SearchTimeout, WIN_SCORE  # Import the search
+
+# State of a worker process, set up once by _init_worker
+_worker = {}
+
+
+def _init_worker(bot_options, shared_alpha):
+    """
+    Creates the worker's own bot (with its own transposition table, which is
+    kept for the whole game) and stores the shared alpha bound.
+
+    :param bot_options: MyBot keyword arguments of the searching bot.
+    :param shared_alpha: multiprocessing.Value holding the best root score so far.
+    """
+    _worker["bot"] = MyBot("Worker", 0, 3, **bot_options)
+    _worker["alpha"] = shared_alpha
+    _worker["root"] = None  # Root position of the current search
+
+
+def _search_root_move(task):
+    """
+    Searches one root move in a worker process.
+
+    The search starts with the best root score any worker has found so far as
+    alpha, keeps picking up better scores while it runs, and publishes its
+    own score when it improves on them. With full_window set it searches
+    from alpha = -inf instead and reads nothing from the other workers.
+
+    :param task: Tuple (board_class, grid, k, player, move, depth, deadline,
+                 full_window); deadline is a time.monotonic() value or None.
+    :return: Tuple (move, value, nodes, fail_low). value is None if the
+             deadline passed. fail_low is True if the value is not above the
+             shared alpha, so it is only an upper bound of the move's score.
+    """
+    board_class, grid, k, player, move, depth, deadline, full_window = task
+    if deadline is not None and time.monotonic() >= deadline:
+        return move, None, 0, False  # Queued past the deadline
+    bot = _worker["bot"]
+    shared_alpha = _worker["alpha"]
+    root = (grid.tobytes(), player)
+    if root != _worker["root"]:
+        # First task of a new move: age the table and the move ordering
+        # state, as MyBot.iterative_deepening does
+        _worker["root"] = root
+        bot.begin_search()
+
+    board = board_class(grid.shape[0], grid.shape[1], k)
+    board.grid = grid.copy()
+    row, col = move
+    board.make_move(row, col, player)
+    if board.has_won_at(row, col, player):
+        return move, WIN_SCORE, 1, False
+
+    bot.prepare_search(board)
+    bot.nodes = 0
+    bot.search_depth = depth
+    bot.completed_depth = depth - 1  # The first iteration must not time out
+    bot.deadline = deadline
+    bot.shared_alpha = None if full_window else shared_alpha
+    alpha = -np.inf if full_window else shared_alpha.value
+    try:
+        value, _ = bot.minimax(board, player, False, alpha, np.inf, depth - 1)
+    except SearchTimeout:
+        return move, None, bot.nodes, False
+    finally:
+        bot.shared_alpha = None
+
+    with shared_alpha.get_lock():
+        # The shared alpha only grows, so it bounds every alpha the search used
+        fail_low = not full_window and value <= shared_alpha.value
+        if value > shared_alpha.value:
+            shared_alpha.value = value  # Tighter bound for the other workers
+    return move, value, bot.nodes, fail_low
+
+
+def rank_results(results):
+    """
+    Orders the root moves of an iteration, best first.
+
+    Exact scores come first, by value. Fail-low results follow them: their
+    real score may be lower than the returned one, so they never rank above
+    an exact score, even an equal one. Equal entries keep the move order.
+
+    :param results: List of (move, value, nodes, fail_low) from _search_root_move.
+    :return: List of indices into results.
+    """
+    return sorted(
+        range(len(results)),
+        key=lambda index: (results[index][3], -results[index][1], index),
+    )
+
+
+class ParallelSearcher:
+    """
+    Root-splitting parallel Minimax for mode 3.
+
+    Each iteration of the deepening searches the first (best so far) root move
+    with a full window, then spreads the remaining root moves over a pool of
+    worker processes. The best root score found so far is kept in shared memory
+    and used as alpha by the workers, which also re-read it while they search,
+    so cutoffs found by one worker speed up the others. Moves that fail low
+    against it are only bounded; if one ties the best score it is searched
+    again with a full window. All tasks share one deadline.
+    """
+
+    def __init__(self, workers, bot_options):
+        """
+        Starts the worker pool.
+
+        :param workers: Number of worker processes.
+        :param bot_options: MyBot keyword arguments for the worker bots.
+        """
+        self.workers = workers
+        self.shared_alpha = multiprocessing.Value("d", -np.inf)
+        self.pool = multiprocessing.Pool(
+            workers, _init_worker, (bot_options, self.shared_alpha)
+        )
+        self.nodes = 0  # Nodes visited by all workers in the last search
+        self.completed_depth = 0  # Deepest fully searched iteration
+        self.depth_times = []  # Seconds from the start until each depth completed
+
+    def run_tasks(self, tasks):
+        """
+        Searches root move tasks on the pool and collects their results.
+
+        :param tasks: List of _search_root_move tasks.
+        :return: The results in task order, or None as soon as one task ran
+                 out of time (the tasks still queued then return at once).
+        """
+        results = {}
+        for result in self.pool.imap_unordered(_search_root_move, tasks):
+            self.nodes += result[2]
+            if result[1] is None:
+                return None
+            results[result[0]] = result
+        return [results[task[4]] for task in tasks]
+
+    def search(self, board, player, root_moves, time_limit=None, max_depth=None):
+        """
+        Deepens iteratively over the root moves until the budget runs out, the
+        board is full or a forced result is found.
+
+        :param board: The game board.
+        :param player: The bot's player number.
+        :param root_moves: The root moves to consider.
+        :param time_limit: Seconds the search may take, or None for no limit.
+        :param max_depth: Deepest iteration, or None to search to the end.
+        :return: A tuple (row, col) with the best move of the last completed depth.
+        """
+        start = time.perf_counter()
+        # time.monotonic() is one clock for all processes, unlike perf_counter()
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.nodes = 0
+        self.completed_depth = 0
+        self.depth_times = []
+        grid = np.array(board.grid)
+        moves = list(root_moves)
+        last_depth = len(board.available_moves())
+        if max_depth is not None:
+            last_depth = min(last_depth, max_depth)
+
+        best_move = moves[0]
+        for depth in range(1, last_depth + 1):
+            task_deadline = None  # The first iteration always completes
+            if deadline is not None and depth > 1:
+                if time.monotonic() >= deadline:
+                    break
+                task_deadline = deadline
+
+            def task(move, full_window=False):
+                return (
+                    type(board),
+                    grid,
+                    board.k,
+                    player,
+                    move,
+                    depth,
+                    task_deadline,
+                    full_window,
+                )
+
+            # The first move sets alpha, the rest are searched in parallel
+            self.shared_alpha.value = -np.inf
+            results = self.run_tasks([task(moves[0], True)])
+            if results is not None:
+                rest = self.run_tasks([task(move) for move in moves[1:]])
+                results = None if rest is None else results + rest
+            if results is None:
+                break  # Keep the move of the last completed depth
+
+            # A bound equal to the best score may hide an equal or a worse
+            # move; only a full-window search tells
+            order = rank_results(results)
+            best_value = results[order[0]][1]
+            ties = [
+                index
+                for index in order
+                if results[index][3] and results[index][1] >= best_value
+            ]
+            if ties:
+                exact = self.run_tasks([task(results[i][0], True) for i in ties])
+                if exact is None:
+                    break
+                for index, result in zip(ties, exact):
+                    results[index] = result
+                order = rank_results(results)
+
+            moves = [results[index][0] for index in order]
+            best_move, best_value = moves[0], results[order[0]][1]
+            self.completed_depth = depth
+            self.depth_times.append(time.perf_counter() - start)
+            if abs(best_value) >= WIN_SCORE:
+                break  # Forced win or loss, deeper searches cannot change it
+        return best_move
+
+    def close(self):
+        """
+        Shuts the worker pool down.
+        """
+        self.pool.terminate()
+        self.pool.join()
+
+
+def benchmark_scaling(rows, cols, k, depth, worker_counts, moves=()):
+    """
+    Measures the time to reach each search depth for different worker counts.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param depth: Depth to search to.
+    :param worker_counts: Worker counts to measure, e.g. (1, 2, 4, 8, 16).
+    :param moves: (row, col, player) marks placed before searching.
+    :return: Dict mapping the worker count to its list of per-depth times.
+    """
+    board = Board(rows, cols, k)
+    for row, col, player in moves:
+        board.make_move(row, col, player)
+    timings = {}
+    for workers in worker_counts:
+        searcher = ParallelSearcher(workers, {"time_limit": None})
+        try:
+            searcher.search(board, 1, board.available_moves(), max_depth=depth)
+            timings[workers] = searcher.depth_times
+        finally:
+            searcher.close()
+    return timings
+
+
+def main():
+    """
+    Command-line entry point: prints a time-to-depth scaling table.
+    """
+    parser = argparse.ArgumentParser(description="Parallel search scaling benchmark")
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Pool sizes"
+    )
+    args = parser.parse_args()
+
+    opening = [(args.rows // 2, args.cols // 2, 2)]  # One mark of the opponent
+    timings = benchmark_scaling(
+        args.rows, args.cols, args.k, args.depth, args.workers, opening
+    )
+    print("workers " + " ".join(f"depth {d:>2}" for d in range(1, args.depth + 1)))
+    for workers, depth_times in timings.items():
+        print(f"{workers:>7} " + " ".join(f"{t:7.3f}s" for t in depth_times))
+
+
+if __name__ == "__main__":
+    main()
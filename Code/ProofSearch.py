@@ -0,0 +1,358 @@
+import sys
+import os
+import argparse
+from tqdm import tqdm
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.BitBoard import BitBoard  # Import the bitmask board for the command line
+from Code.Tablebase import LOSS, DRAW, WIN  # Import the game-theoretic values
+
+INFINITY = 10**9  # Proof or disproof number of a solved node
+
+
+class ProofSearchLimit(Exception):
+    """
+    Raised inside the proof-number search when its node or memory budget is used up.
+    """
+
+
+class ProofResult:
+    """
+    Outcome of a proof-number search.
+
+    Attributes:
+        value (int): WIN, DRAW or LOSS for the side to move, or None if the
+                     search ran out of nodes or memory first.
+        move (tuple): (row, col) that achieves the value: a winning move for a
+                      WIN, a move that holds the draw for a DRAW, None otherwise.
+        nodes (int): Number of expanded nodes.
+    """
+
+    def __init__(self, value, move, nodes):
+        """
+        Stores the result.
+
+        :param value: WIN, DRAW, LOSS or None.
+        :param move: The proving (row, col), or None.
+        :param nodes: Number of expanded nodes.
+        """
+        self.value = value
+        self.move = move
+        self.nodes = nodes
+
+    @property
+    def solved(self):
+        """
+        Whether the position was solved within the limits.
+        """
+        return self.value is not None
+
+
+class ProofNumberSearch:
+    """
+    Depth-first proof-number search (df-pn) that solves positions exactly.
+
+    A proof-number search proves or disproves a single goal, "the attacker
+    wins". At attacker nodes (OR) one winning child is enough, at defender
+    nodes (AND) every child has to be won. Each node carries a proof number,
+    the least number of leaves that still have to be proven, and a disproof
+    number; the search always expands along the most-proving path. The
+    depth-first variant keeps only a transposition table of (proof, disproof)
+    numbers instead of an explicit tree, and a child is searched until its
+    numbers exceed thresholds handed down by its parent.
+
+    Since a draw is neither side's win, solve() first tries to prove a win for
+    the side to move and, if that fails, a win for the opponent; if both are
+    disproven the position is a draw.
+
+    Positions are keyed by the board's canonical hash, so rotations and
+    reflections are solved once, and moves are played with board.push/pop and
+    tested with board.would_win (a BitBoard makes both cheap). Each node
+    only considers the moves that matter: an immediate win ends the node, and
+    if the opponent threatens to win only the blocking moves are searched.
+    """
+
+    def __init__(
+        self, node_limit=1000000, max_entries=2000000, epsilon=1.0, progress=False
+    ):
+        """
+        Initializes the solver.
+
+        :param node_limit: Maximum number of expanded nodes per solve() call.
+        :param max_entries: Maximum number of transposition table entries. When
+                            the table is full, unsolved entries are dropped;
+                            proven and disproven ones are kept.
+        :param epsilon: Margin of the child thresholds (see widen).
+        :param progress: Whether to show a tqdm progress bar of expanded nodes.
+        """
+        self.node_limit = node_limit
+        self.max_entries = max_entries
+        self.epsilon = epsilon
+        self.progress = progress
+        self.table = {}  # hash -> (proof number, disproof number)
+        self.nodes = 0
+        self.bar = None
+
+    def solve(self, board, player):
+        """
+        Solves the board's position with the given player to move. The board
+        is left unchanged.
+
+        :param board: The game board (Board or BitBoard), without a winner.
+        :param player: The player number to move.
+        :return: A ProofResult.
+        """
+        opponent = 1 if player == 2 else 2
+        self.nodes = 0
+        with tqdm(
+            total=self.node_limit, disable=not self.progress, desc="Nodes"
+        ) as bar:
+            self.bar = bar
+            try:
+                # Can the side to move force a win?
+                self.table = {}
+                if self.prove(board, player, player):
+                    return ProofResult(
+                        WIN, self.proving_move(board, player), self.nodes
+                    )
+
+                # If not, can the opponent?
+                self.table = {}
+                if self.prove(board, player, opponent):
+                    return ProofResult(LOSS, None, self.nodes)
+                return ProofResult(DRAW, self.proving_move(board, player), self.nodes)
+            except ProofSearchLimit:
+                return ProofResult(None, None, self.nodes)
+            finally:
+                bar.update(self.nodes - bar.n)
+                self.table = {}
+                self.bar = None
+
+    def prove(self, board, to_move, attacker):
+        """
+        Runs df-pn from the root until the attacker's win is proven or disproven.
+
+        :param board: The game board.
+        :param to_move: The player number to move at the root.
+        :param attacker: The player whose win is to be proven.
+        :return: True if proven, False if disproven.
+        :raises ProofSearchLimit: If the node or memory budget is exhausted.
+        """
+        self.attacker = attacker
+        self.search(board, to_move, INFINITY, INFINITY)
+        proof, _ = self.lookup(board.canonical_hash()[0])
+        return proof == 0
+
+    def proving_move(self, board, player):
+        """
+        Picks the root move that the last prove() call established: a child
+        whose win is proven (after a won search for the player) or whose
+        opponent win is disproven (after a drawn one).
+
+        :param board: The game board at the root.
+        :param player: The player number to move at the root.
+        :return: A tuple (row, col).
+        """
+        goal = 0 if self.attacker == player else INFINITY
+        moves, _, _ = self.generate_moves(board, player)
+        for row, col in moves:
+            if board.would_win(row, col, player):
+                return row, col  # Immediate win
+            proof, _ = self.lookup(self.child_key(board, row, col, player))
+            if proof == goal:
+                return row, col
+        return None
+
+    def lookup(self, key):
+        """
+        :param key: A position hash.
+        :return: The stored (proof, disproof) numbers, or (1, 1) for a new node.
+        """
+        entry = self.table.get(key)
+        return (1, 1) if entry is None else entry
+
+    def store(self, key, proof, disproof):
+        """
+        Stores a node's numbers and frees memory once the table is full.
+
+        :param key: The position hash.
+        :param proof: Proof number.
+        :param disproof: Disproof number.
+        :raises ProofSearchLimit: If the table is still full after dropping
+                                  all unsolved entries.
+        """
+        self.table[key] = (proof, disproof)
+        if len(self.table) > self.max_entries:
+            self.table = {
+                k: numbers for k, numbers in self.table.items() if 0 in numbers
+            }
+            self.table[key] = (proof, disproof)  # The caller reads it right away
+            if len(self.table) > self.max_entries * 3 // 4:
+                raise ProofSearchLimit()
+
+    def generate_moves(self, board, player):
+        """
+        Finds the moves worth searching for the player to move.
+
+        :param board: The game board.
+        :param player: The player number to move.
+        :return: A tuple (moves, wins, full) where wins tells whether one of
+                 the moves wins on the spot (moves then holds only it), and
+                 full whether the board has no empty cell left.
+        """
+        opponent = 1 if player == 2 else 2
+        moves = board.available_moves()
+        blocks = []
+        for row, col in moves:
+            if board.would_win(row, col, player):
+                return [(row, col)], True, False
+            if board.would_win(row, col, opponent):
+                blocks.append((row, col))
+        # Against a threat only blocks matter; with two of them any block loses
+        return (blocks or moves), False, not moves
+
+    def child_key(self, board, row, col, player):
+        """
+        Computes the canonical hash the position would have after a move,
+        from the board's symmetric hashes and without making the move.
+
+        :param board: The game board.
+        :param row: Row index of the move.
+        :param col: Column index of the move.
+        :param player: The player number making the move.
+        :return: The canonical hash of the resulting position.
+        """
+        keys = board.symmetry_keys[player][row * board.cols + col]
+        return min(value ^ key for value, key in zip(board.symmetric_hashes, keys))
+
+    def widen(self, second_value):
+        """
+        Threshold for the best child from the second-best child's number. The
+        "1 + epsilon" margin lets the search stay in a subtree a little longer
+        instead of switching back and forth between two close siblings.
+
+        :param second_value: The second-smallest proof (OR node) or disproof
+                             (AND node) number among the children.
+        :return: The threshold.
+        """
+        return min(INFINITY, int(second_value * (1 + self.epsilon)) + 1)
+
+    def search(self, board, player, proof_threshold, disproof_threshold):
+        """
+        Searches a node until its numbers reach a threshold, then stores them.
+
+        :param board: The game board.
+        :param player: The player number to move.
+        :param proof_threshold: Stop once the proof number reaches this.
+        :param disproof_threshold: Stop once the disproof number reaches this.
+        :raises ProofSearchLimit: If the node or memory budget is exhausted.
+        """
+        self.nodes += 1
+        if self.nodes > self.node_limit:
+            raise ProofSearchLimit()
+        if self.bar is not None and self.nodes % 1000 == 0:
+            self.bar.update(1000)
+            self.bar.set_postfix(entries=len(self.table), refresh=False)
+
+        key = board.canonical_hash()[0]
+        is_or = player == self.attacker
+        moves, wins, full = self.generate_moves(board, player)
+        if wins or full:
+            # Terminal: the side to move wins, or nobody can move (a draw,
+            # which the attacker has not achieved)
+            proven = wins and is_or
+            self.store(key, *((0, INFINITY) if proven else (INFINITY, 0)))
+            return
+
+        # Hashes of the children, so the loop below only reads the table
+        children = [
+            (row, col, self.child_key(board, row, col, player)) for row, col in moves
+        ]
+        opponent = 1 if player == 2 else 2
+
+        while True:
+            # At OR nodes the proof number is the smallest child's, the
+            # disproof number the sum; the other way round at AND nodes
+            best = None
+            best_value = second_value = INFINITY
+            total = 0
+            for child in children:
+                proof, disproof = self.lookup(child[2])
+                value, other = (proof, disproof) if is_or else (disproof, proof)
+                total = min(INFINITY, total + other)
+                if value < best_value:
+                    best, second_value, best_value = child, best_value, value
+                elif value < second_value:
+                    second_value = value
+            if is_or:
+                proof, disproof = best_value, total
+            else:
+                proof, disproof = total, best_value
+            if proof >= proof_threshold or disproof >= disproof_threshold:
+                break
+
+            # Search the most-proving child until it is no longer the best
+            # (or second-best plus one) or the parent's threshold is reached
+            row, col, child_key = best
+            child_proof, child_disproof = self.lookup(child_key)
+            if is_or:
+                child_proof_threshold = min(proof_threshold, self.widen(second_value))
+                child_disproof_threshold = (
+                    disproof_threshold - disproof + child_disproof
+                )
+            else:
+                child_proof_threshold = proof_threshold - proof + child_proof
+                child_disproof_threshold = min(
+                    disproof_threshold, self.widen(second_value)
+                )
+            board.push(row, col, player)
+            try:
+                self.search(
+                    board, opponent, child_proof_threshold, child_disproof_threshold
+                )
+            finally:
+                board.pop()
+        self.store(key, proof, disproof)
+
+
+def main():
+    """
+    Command-line entry point: solves the position reached by a move sequence.
+    """
+    parser = argparse.ArgumentParser(description="Solve an MNK position exactly")
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--cols", type=int, default=4)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument(
+        "--moves",
+        nargs="*",
+        default=[],
+        help="Moves played so far as row,col, starting with player 1",
+    )
+    parser.add_argument("--nodes", type=int, default=1000000, help="Node limit")
+    parser.add_argument(
+        "--entries", type=int, default=2000000, help="Transposition table limit"
+    )
+    args = parser.parse_args()
+
+    board = BitBoard(args.rows, args.cols, args.k)
+    player = 1
+    for move in args.moves:
+        row, col = (int(part) for part in move.split(","))
+        board.push(row, col, player)
+        player = 1 if player == 2 else 2
+    board.display()
+
+    result = ProofNumberSearch(args.nodes, args.entries, progress=True).solve(
+        board, player
+    )
+    names = {WIN: "win", DRAW: "draw", LOSS: "loss", None: "unknown"}
+    print(f"Player {player} to move: {names[result.value]}", end="")
+    print(f", play {result.move}" if result.move else "", end="")
+    print(f" ({result.nodes} nodes)")
+
+
+if __name__ == "__main__":
+    main()
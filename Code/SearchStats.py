@@ -0,0 +1,161 @@
+import json
+
+# Counters that add up when the statistics of several moves are aggregated
+COUNTERS = ("nodes", "evaluations", "win_checks", "tt_lookups", "tt_hits")
+
+
+class SearchStats:
+    """
+    Statistics of the search behind one bot move.
+
+    Attributes:
+        player (int): The player number that moved.
+        mode (int): The bot's difficulty mode.
+        source (str): Where the move came from: "random", "rule" (mode 2 win
+                      or block), "tablebase", "book", "threat", "search"
+                      (Minimax) or "mcts".
+        move (tuple): The chosen (row, col).
+        nodes (int): Minimax nodes visited.
+        evaluations (int): Leaf positions scored by the evaluation.
+        win_checks (int): has_won_at calls made to test moves for a win.
+        cutoffs (list): cutoffs[i] is the number of alpha-beta cutoffs caused
+                        by the i-th move searched at a node, so good move
+                        ordering shows up as most cutoffs at index 0.
+        depth (int): Deepest completed iteration of the search.
+        tt_lookups (int): Transposition table lookups.
+        tt_hits (int): Lookups that found their position.
+        elapsed (float): Seconds the move took.
+
+    With a parallel search (MyBot workers > 1) only nodes and depth are
+    filled in; the other counters stay in the worker processes.
+    """
+
+    def __init__(self, player=None, mode=None):
+        """
+        Starts an empty record.
+
+        :param player: The player number that moves.
+        :param mode: The bot's difficulty mode.
+        """
+        self.player = player
+        self.mode = mode
+        self.source = None
+        self.move = None
+        self.nodes = 0
+        self.evaluations = 0
+        self.win_checks = 0
+        self.cutoffs = []
+        self.depth = 0
+        self.tt_lookups = 0
+        self.tt_hits = 0
+        self.elapsed = 0.0
+
+    def record_cutoff(self, index):
+        """
+        Counts an alpha-beta cutoff.
+
+        :param index: Position of the cutting move in the node's move order.
+        """
+        cutoffs = self.cutoffs
+        while len(cutoffs) <= index:
+            cutoffs.append(0)
+        cutoffs[index] += 1
+
+    def as_dict(self):
+        """
+        :return: The statistics as a JSON-serializable dict.
+        """
+        return {
+            "player": self.player,
+            "mode": self.mode,
+            "source": self.source,
+            "move": None if self.move is None else list(self.move),
+            "nodes": self.nodes,
+            "evaluations": self.evaluations,
+            "win_checks": self.win_checks,
+            "cutoffs": list(self.cutoffs),
+            "depth": self.depth,
+            "tt_lookups": self.tt_lookups,
+            "tt_hits": self.tt_hits,
+            "elapsed": self.elapsed,
+        }
+
+
+def aggregate(records):
+    """
+    Sums the statistics of several moves, e.g. all moves of a game.
+
+    :param records: Iterable of dicts from SearchStats.as_dict; None entries
+                    (moves without statistics, e.g. by humans) are skipped.
+    :return: Dict with the move count, the summed counters and cutoffs, the
+             total and largest time per move, the deepest search and the
+             number of moves per source.
+    """
+    total = {counter: 0 for counter in COUNTERS}
+    total.update(
+        {"moves": 0, "cutoffs": [], "depth": 0, "elapsed": 0.0, "max_elapsed": 0.0}
+    )
+    total["sources"] = {}
+    for record in records:
+        if record is None:
+            continue
+        total["moves"] += 1
+        for counter in COUNTERS:
+            total[counter] += record[counter]
+        for index, count in enumerate(record["cutoffs"]):
+            if index == len(total["cutoffs"]):
+                total["cutoffs"].append(0)
+            total["cutoffs"][index] += count
+        total["depth"] = max(total["depth"], record["depth"])
+        total["elapsed"] += record["elapsed"]
+        total["max_elapsed"] = max(total["max_elapsed"], record["elapsed"])
+        source = record["source"]
+        total["sources"][source] = total["sources"].get(source, 0) + 1
+    return total
+
+
+class TraceWriter:
+    """
+    Streams move statistics to a JSON-lines file, one line per move.
+
+    Lines are written and flushed once per move, never during the search, so
+    tracing costs nothing inside the search itself.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the file for appending.
+
+        :param path: Path of the JSON-lines file.
+        """
+        self.path = path
+        self.file = open(path, "a")
+
+    def write(self, stats, **extra):
+        """
+        Appends one move's statistics.
+
+        :param stats: A SearchStats.
+        :param extra: Further fields for the line, e.g. the bot's name.
+        """
+        record = stats.as_dict()
+        record.update(extra)
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        self.file.close()
+
+
+def read_trace(path):
+    """
+    Reads a trace written by TraceWriter.
+
+    :param path: Path of the JSON-lines file.
+    :return: List of dicts, one per move.
+    """
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,176 @@
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import batch_has_won  # Import the vectorized win check
+from Code.Evaluator import window_layout  # Import the k-window enumeration
+
+
+def random_moves(grids, rng):
+    """
+    Picks a uniformly random empty cell on each board (mode 1).
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param rng: A numpy.random.Generator.
+    :return: Array of shape (N,) with the chosen flat cell index per board.
+    """
+    keys = rng.random(grids.shape)
+    keys[grids != 0] = -1.0  # Occupied cells are never chosen
+    return keys.argmax(axis=1)
+
+
+def completing_cells(grids, mark, windows):
+    """
+    Finds the empty cells that would complete a line of k for a player.
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param mark: The player's number.
+    :param windows: Array of shape (W, k) with the flat cells of every k-window.
+    :return: Boolean array of shape (N, rows * cols).
+    """
+    count, cells = grids.shape
+    k = windows.shape[1]
+    values = grids[:, windows]  # (N, W, k)
+    is_empty = values == 0
+    # A window completes when all cells but one empty cell hold the mark
+    completes = ((values == mark).sum(axis=2) == k - 1) & (is_empty.sum(axis=2) == 1)
+    targets = completes[:, :, None] & is_empty  # The empty cell of such windows
+    game, window, position = np.nonzero(targets)
+    flat = game * cells + windows[window, position]
+    return np.bincount(flat, minlength=count * cells).reshape(count, cells) > 0
+
+
+def tactical_moves(grids, mark, windows, rng):
+    """
+    Mode 2 policy for many boards: win immediately if possible, else block the
+    opponent's immediate win, else play randomly. Like MyBot, the first such
+    cell in row-major order is chosen.
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param mark: The moving player's number.
+    :param windows: Array of shape (W, k) with the flat cells of every k-window.
+    :param rng: A numpy.random.Generator.
+    :return: Array of shape (N,) with the chosen flat cell index per board.
+    """
+    moves = random_moves(grids, rng)
+    opponent = 1 if mark == 2 else 2
+    blocks = completing_cells(grids, opponent, windows)
+    can_block = blocks.any(axis=1)
+    moves[can_block] = blocks[can_block].argmax(axis=1)
+    wins = completing_cells(grids, mark, windows)
+    can_win = wins.any(axis=1)
+    moves[can_win] = wins[can_win].argmax(axis=1)  # Winning beats blocking
+    return moves
+
+
+class SelfPlayResult:
+    """
+    Outcome of a batch of self-play games.
+
+    Attributes:
+        winners (np.ndarray): Per game 0 for a draw, else the winning player.
+        lengths (np.ndarray): Per game the number of moves played.
+        grids (np.ndarray): Final boards, shape (N, rows, cols).
+    """
+
+    def __init__(self, winners, lengths, grids):
+        """
+        Stores the per-game results.
+
+        :param winners: Array of shape (N,) with 0, 1 or 2.
+        :param lengths: Array of shape (N,) with the number of moves.
+        :param grids: Array of shape (N, rows, cols) with the final boards.
+        """
+        self.winners = winners
+        self.lengths = lengths
+        self.grids = grids
+
+    def summary(self):
+        """
+        Summarizes the games from player 1's point of view.
+
+        :return: A dict with the number of games, wins, draws and losses of
+                 player 1 and the mean, minimum and maximum game length.
+        """
+        return {
+            "games": int(len(self.winners)),
+            "wins": int(np.sum(self.winners == 1)),
+            "draws": int(np.sum(self.winners == 0)),
+            "losses": int(np.sum(self.winners == 2)),
+            "mean_length": float(self.lengths.mean()) if len(self.lengths) else 0.0,
+            "min_length": int(self.lengths.min()) if len(self.lengths) else 0,
+            "max_length": int(self.lengths.max()) if len(self.lengths) else 0,
+        }
+
+
+def play_out(grids, rows, cols, k, to_move, modes, rng):
+    """
+    Continues many games from the given positions until each is won or full,
+    advancing all boards in lockstep. Finished games are masked out of later
+    turns. The grids are modified in place.
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param to_move: The player number that moves next on every board.
+    :param modes: Dict mapping each player number to its mode (1 or 2).
+    :param rng: A numpy.random.Generator.
+    :return: A tuple (winners, moves): per game 0 for a draw or the winning
+             player, and the number of moves played from the start position.
+    """
+    windows = np.array(window_layout(rows, cols, k)[0], dtype=np.intp).reshape(-1, k)
+    games = len(grids)
+    winners = np.zeros(games, dtype=np.int8)
+    moves_played = np.count_nonzero(grids == 0, axis=1).astype(np.int32)
+    active = np.flatnonzero(moves_played > 0)  # Games that are still running
+    mark = to_move
+
+    for turn in range(rows * cols):
+        if not active.size:
+            break
+        boards = grids[active]
+        if modes[mark] == 1:
+            moves = random_moves(boards, rng)
+        else:
+            moves = tactical_moves(boards, mark, windows, rng)
+        boards[np.arange(len(active)), moves] = mark
+        grids[active] = boards
+
+        won = batch_has_won(boards.reshape(-1, rows, cols), mark, k)
+        winners[active[won]] = mark
+        moves_played[active[won]] = turn + 1
+        full = ~won & ~(boards == 0).any(axis=1)  # Draws end on a full board
+        active = active[~won & ~full]
+        mark = 1 if mark == 2 else 2
+
+    return winners, moves_played
+
+
+def self_play(rows, cols, k, games, mode1=1, mode2=1, seed=None):
+    """
+    Plays many games at once from the empty board, see play_out.
+
+    Only the policies that vectorize are supported: mode 1 (random) and
+    mode 2 (win, else block, else random).
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param games: Number of games to play.
+    :param mode1: Bot mode of player 1 (1 or 2).
+    :param mode2: Bot mode of player 2 (1 or 2).
+    :param seed: Seed for the random number generator.
+    :return: A SelfPlayResult.
+    :raises ValueError: If a mode other than 1 or 2 is requested.
+    """
+    for mode in (mode1, mode2):
+        if mode not in (1, 2):
+            raise ValueError(f"Self-play supports modes 1 and 2, not {mode}")
+    rng = np.random.default_rng(seed)
+    grids = np.zeros((games, rows * cols), dtype=np.int8)
+    winners, lengths = play_out(grids, rows, cols, k, 1, {1: mode1, 2: mode2}, rng)
+    return SelfPlayResult(winners, lengths, grids.reshape(games, rows, cols))
@@ -0,0 +1,378 @@
+import sys
+import os
+import argparse
+import functools
+import numpy as np
+from tqdm import tqdm
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import batch_has_won, symmetries  # Import the board helpers
+
+# Game-theoretic values, from the point of view of the side to move
+LOSS = 0
+DRAW = 1
+WIN = 2
+
+MAGIC = b"MNKTB001"  # First bytes of every tablebase file
+# Header: magic, rows, cols, k, bytes per key, number of positions
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("rows", "<u4"),
+        ("cols", "<u4"),
+        ("k", "<u4"),
+        ("key_bytes", "<u4"),
+        ("count", "<u8"),
+    ]
+)
+
+
+def encode(grids, powers):
+    """
+    Encodes flat grids as base-3 numbers sum(mark * 3**cell).
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param powers: Array of 3**cell for every cell.
+    :return: Array of shape (N,) with the codes as int64.
+    """
+    return grids.astype(np.int64) @ powers
+
+
+def decode(codes, cells):
+    """
+    Decodes base-3 position codes back into flat grids.
+
+    :param codes: Array of shape (N,) with position codes.
+    :param cells: Number of cells of the board.
+    :return: Array of shape (N, cells) holding 0, 1 and 2 as int8.
+    """
+    grids = np.empty((len(codes), cells), dtype=np.int8)
+    rest = np.array(codes, dtype=np.int64)
+    for cell in range(cells):
+        rest, grids[:, cell] = np.divmod(rest, 3)
+    return grids
+
+
+def canonical_codes(grids, rows, cols, powers):
+    """
+    Encodes every grid by the smallest code among its rotations and reflections.
+
+    :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param powers: Array of 3**cell for every cell.
+    :return: Array of shape (N,) with the canonical codes.
+    """
+    _, inverses = symmetries(rows, cols)
+    codes = None
+    for inverse in inverses:
+        image = encode(grids[:, list(inverse)], powers)  # image[j] = grid[inverse[j]]
+        codes = image if codes is None else np.minimum(codes, image)
+    return codes
+
+
+def generate(rows, cols, k, progress=True):
+    """
+    Solves a configuration completely by retrograde analysis.
+
+    The positions reachable with player 1 moving first are generated level by
+    level (one level per number of marks), each level as one sorted NumPy
+    array of canonical codes, so rotations and reflections are stored once.
+    The values are then propagated backwards from the last level: a position
+    is won if some move reaches a position lost for the opponent, drawn if
+    none does but some move reaches a draw, and lost otherwise. The distance
+    counts the plies to the end of the game when the winner wins as fast and
+    the loser loses as slowly as possible.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param progress: Whether to show tqdm progress bars.
+    :return: A tuple (codes, values, distances) of arrays sorted by code.
+    """
+    cells = rows * cols
+    powers = 3 ** np.arange(cells, dtype=np.int64)
+
+    # Forward pass: all reachable positions, per number of marks
+    levels = [np.zeros(1, dtype=np.int64)]
+    for marks in tqdm(range(cells), disable=not progress, desc="Generating"):
+        codes = levels[marks]
+        grids = decode(codes, cells)
+        if marks:
+            last = 1 if marks % 2 == 1 else 2  # The player who made the last move
+            grids = grids[~batch_has_won(grids.reshape(-1, rows, cols), last, k)]
+        mover = 1 if marks % 2 == 0 else 2
+        children = []
+        for cell in range(cells):
+            parents = grids[grids[:, cell] == 0]
+            parents[:, cell] = mover
+            children.append(canonical_codes(parents, rows, cols, powers))
+        levels.append(np.unique(np.concatenate(children)))
+
+    # Backward pass: values and distances from the side to move's point of view
+    values = [None] * (cells + 1)
+    distances = [None] * (cells + 1)
+    for marks in tqdm(range(cells, -1, -1), disable=not progress, desc="Solving"):
+        codes = levels[marks]
+        grids = decode(codes, cells)
+        count = len(codes)
+        won = np.zeros(count, dtype=bool)  # The last mover completed a line
+        if marks:
+            last = 1 if marks % 2 == 1 else 2
+            won = batch_has_won(grids.reshape(-1, rows, cols), last, k)
+
+        level_values = np.full(count, LOSS, dtype=np.uint8)
+        level_distances = np.zeros(count, dtype=np.uint8)
+        if marks == cells:
+            level_values[~won] = DRAW  # Full board without a line
+        else:
+            mover = 1 if marks % 2 == 0 else 2
+            unreached = cells + 1  # Larger than any distance
+            win_distance = np.full(count, unreached, dtype=np.int16)
+            draw_distance = np.full(count, unreached, dtype=np.int16)
+            loss_distance = np.zeros(count, dtype=np.int16)
+            for cell in range(cells):
+                parents = np.flatnonzero(~won & (grids[:, cell] == 0))
+                children = grids[parents]
+                children[:, cell] = mover
+                index = np.searchsorted(
+                    levels[marks + 1], canonical_codes(children, rows, cols, powers)
+                )
+                child_values = values[marks + 1][index]
+                child_distances = distances[marks + 1][index].astype(np.int16) + 1
+                # A lost position for the opponent is a win for the mover
+                win_distance[parents] = np.where(
+                    child_values == LOSS,
+                    np.minimum(win_distance[parents], child_distances),
+                    win_distance[parents],
+                )
+                draw_distance[parents] = np.where(
+                    child_values == DRAW,
+                    np.minimum(draw_distance[parents], child_distances),
+                    draw_distance[parents],
+                )
+                loss_distance[parents] = np.maximum(
+                    loss_distance[parents], child_distances
+                )
+            is_win = ~won & (win_distance < unreached)
+            is_draw = ~won & ~is_win & (draw_distance < unreached)
+            is_loss = ~won & ~is_win & ~is_draw
+            level_values[is_win] = WIN
+            level_distances[is_win] = win_distance[is_win]
+            level_values[is_draw] = DRAW
+            level_distances[is_draw] = draw_distance[is_draw]
+            level_distances[is_loss] = loss_distance[is_loss]
+        values[marks] = level_values
+        distances[marks] = level_distances
+
+    # Levels do not overlap (they differ in the number of marks), so merging
+    # them only needs one sort
+    codes = np.concatenate(levels)
+    order = np.argsort(codes, kind="stable")
+    return (
+        codes[order],
+        np.concatenate(values)[order],
+        np.concatenate(distances)[order],
+    )
+
+
+def default_tablebase_path(rows, cols, k):
+    """
+    Location of the tablebase of a configuration inside the repository.
+
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :return: The file path.
+    """
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "../Tablebases",
+        f"tablebase_{rows}x{cols}x{k}.bin",
+    )
+
+
+def write_tablebase(path, rows, cols, k, codes, values, distances):
+    """
+    Writes a tablebase file: a fixed header, the sorted position codes (as
+    uint32 when they fit, else uint64), the values packed 2 bits per position
+    and one distance byte per position.
+
+    :param path: Path of the file to write.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param codes: Sorted canonical position codes, see generate.
+    :param values: LOSS, DRAW or WIN per position.
+    :param distances: Plies to the end of the game per position.
+    """
+    key_bytes = 4 if 3 ** (rows * cols) <= 2**32 else 8
+    count = len(codes)
+    padded = np.zeros(-(-count // 4) * 4, dtype=np.uint8)
+    padded[:count] = values
+    packed = (
+        padded[0::4] | padded[1::4] << 2 | padded[2::4] << 4 | padded[3::4] << 6
+    ).astype(np.uint8)
+    header = np.array([(MAGIC, rows, cols, k, key_bytes, count)], dtype=HEADER)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(header.tobytes())
+        file.write(codes.astype(f"<u{key_bytes}").tobytes())
+        file.write(packed.tobytes())
+        file.write(distances.astype(np.uint8).tobytes())
+
+
+class Tablebase:
+    """
+    Read-only tablebase backed by a memory-mapped file, see write_tablebase.
+
+    Positions are looked up by a binary search over the mapped codes. Only
+    positions reachable with player 1 moving first are stored.
+    """
+
+    def __init__(self, path):
+        """
+        Maps a tablebase file.
+
+        :param path: Path of a file written by write_tablebase.
+        :raises ValueError: If the file is not a tablebase.
+        """
+        header = np.fromfile(path, dtype=HEADER, count=1)
+        if len(header) != 1 or header["magic"][0] != MAGIC:
+            raise ValueError(f"{path} is not a tablebase")
+        self.path = path
+        self.rows = int(header["rows"][0])
+        self.cols = int(header["cols"][0])
+        self.k = int(header["k"][0])
+        key_bytes = int(header["key_bytes"][0])
+        count = int(header["count"][0])
+        offset = HEADER.itemsize
+        self.codes = np.memmap(
+            path, dtype=f"<u{key_bytes}", mode="r", offset=offset, shape=(count,)
+        )
+        offset += key_bytes * count
+        self.packed = np.memmap(
+            path, dtype=np.uint8, mode="r", offset=offset, shape=(-(-count // 4),)
+        )
+        offset += len(self.packed)
+        self.distances = np.memmap(
+            path, dtype=np.uint8, mode="r", offset=offset, shape=(count,)
+        )
+        self.powers = 3 ** np.arange(self.rows * self.cols, dtype=np.int64)
+
+    def __len__(self):
+        """
+        :return: The number of positions in the tablebase.
+        """
+        return len(self.codes)
+
+    def probe_grids(self, grids):
+        """
+        Looks up many positions at once.
+
+        :param grids: Array of shape (N, rows * cols) holding 0, 1 and 2.
+        :return: A tuple (found, values, distances) of arrays of shape (N,);
+                 values and distances are only meaningful where found is True.
+        """
+        codes = canonical_codes(grids, self.rows, self.cols, self.powers)
+        index = np.searchsorted(self.codes, codes)
+        index = np.minimum(index, len(self.codes) - 1)
+        found = self.codes[index] == codes
+        values = self.packed[index // 4] >> (2 * (index % 4)) & 3
+        return found, values, np.asarray(self.distances[index])
+
+    def probe(self, board):
+        """
+        Looks up the board's position for the side to move.
+
+        :param board: The game board, of the tablebase's configuration.
+        :return: A tuple (value, distance), or None if the position is not stored.
+        """
+        if (board.rows, board.cols, board.k) != (self.rows, self.cols, self.k):
+            return None
+        found, values, distances = self.probe_grids(
+            np.asarray(board.grid).reshape(1, -1)
+        )
+        if not found[0]:
+            return None
+        return int(values[0]), int(distances[0])
+
+    def best_move(self, board, player):
+        """
+        Picks a perfect move: the fastest win, else a draw, else the slowest loss.
+
+        :param board: The game board, of the tablebase's configuration.
+        :param player: The player number to move.
+        :return: A tuple (row, col), or None if the position is not stored or
+                 it is not the player's turn.
+        """
+        grid = np.asarray(board.grid).reshape(-1)
+        marks1 = int(np.count_nonzero(grid == 1))
+        marks2 = int(np.count_nonzero(grid == 2))
+        if player != (1 if marks1 == marks2 else 2) or self.probe(board) is None:
+            return None  # Not a stored position with this player to move
+
+        moves = board.available_moves()
+        children = np.repeat(grid.reshape(1, -1), len(moves), axis=0)
+        for index, (row, col) in enumerate(moves):
+            children[index, row * self.cols + col] = player
+        found, values, distances = self.probe_grids(children)
+
+        best_move, best_rank = None, None
+        for index, move in enumerate(moves):
+            if board.make_move(*move, player):
+                won = board.has_won_at(*move, player)
+                board.undo_move(*move)
+                if won:
+                    return move  # Winning at once is always fastest
+            if not found[index]:
+                continue
+            # Values are the opponent's: LOSS for them is best, WIN worst
+            distance = int(distances[index])
+            rank = (
+                -int(values[index]),
+                -distance if values[index] == LOSS else distance,
+            )
+            if best_rank is None or rank > best_rank:
+                best_move, best_rank = move, rank
+        return best_move
+
+
+@functools.lru_cache(maxsize=None)
+def load_tablebase(path):
+    """
+    Opens a tablebase once per process, so bots sharing a file share one mapping.
+
+    :param path: Path of the tablebase file.
+    :return: A Tablebase.
+    """
+    return Tablebase(path)
+
+
+def main():
+    """
+    Command-line entry point: solves a configuration and writes its tablebase.
+    """
+    parser = argparse.ArgumentParser(description="Build an MNK tablebase")
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Tablebase file to write")
+    args = parser.parse_args()
+
+    codes, values, distances = generate(args.rows, args.cols, args.k)
+    path = args.output or default_tablebase_path(args.rows, args.cols, args.k)
+    write_tablebase(path, args.rows, args.cols, args.k, codes, values, distances)
+    names = {LOSS: "loss", DRAW: "draw", WIN: "win"}
+    print(
+        f"Wrote {len(codes)} positions to {path}; "
+        f"the empty board is a {names[int(values[0])]} in {int(distances[0])} plies"
+    )
+
+
+if __name__ == "__main__":
+    main()
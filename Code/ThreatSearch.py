@@ -0,0 +1,313 @@
+import sys
+import os
+import time
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import zobrist_keys  # Import the position hash keys
+from Code.Evaluator import window_layout  # Import the k-window enumeration
+
+
+class ThreatSearchLimit(Exception):
+    """
+    Raised inside the threat-space search when its node budget is used up.
+    """
+
+
+class ThreatSearch:
+    """
+    Threat-space search: looks for a forced win that only uses forcing moves.
+
+    A "four" is a move after which the attacker has a k-window with k - 1 of
+    its marks and no opponent mark, so it wins next move unless the defender
+    blocks the last empty cell. A "three" is a move after which the attacker
+    has an empty cell that would create two fours at once, so the defender has
+    to act now.
+
+    VCF (victory by continuous fours) only plays fours; every defence is
+    forced, so a found VCF is a proven win. VCT (victory by continuous
+    threats) also plays threes. Against a three the defender may occupy any
+    empty cell of the attacker's windows that are two marks short, or counter
+    with fours of its own. As in classic threat-space search, quieter
+    defences are not considered.
+
+    The search keeps per-window mark counts up to date on each move and
+    undo, like the evaluation, and caches failed positions under their
+    Zobrist hash.
+    """
+
+    def __init__(self, board, node_limit=20000, deadline=None):
+        """
+        Sets the search up for the board's position; the board itself is
+        not modified.
+
+        :param board: The game board.
+        :param node_limit: Maximum number of search nodes per call.
+        :param deadline: time.monotonic() value at which searching stops, or None.
+        """
+        self.rows = board.rows
+        self.cols = board.cols
+        self.k = board.k
+        self.node_limit = node_limit
+        self.deadline = deadline
+        self.nodes = 0
+        self.zobrist = zobrist_keys(board.rows, board.cols)
+        self.windows, windows_by_cell = window_layout(board.rows, board.cols, board.k)
+        self.windows_by_cell = [
+            [window for window, _ in pairs] for pairs in windows_by_cell
+        ]
+        self.cells = [int(mark) for mark in board.grid.reshape(-1)]
+        self.hash = board.hash
+        self.failed = set()  # (hash, attacker, depth, vct) known to fail
+
+        # counts[player][window] and, for the interesting counts, the windows
+        # with that many of the player's marks and none of the opponent's
+        self.counts = {1: [0] * len(self.windows), 2: [0] * len(self.windows)}
+        self.lines = {
+            player: {count: set() for count in (self.k - 2, self.k - 1, self.k)}
+            for player in (1, 2)
+        }
+        for cell, mark in enumerate(self.cells):
+            if mark:
+                self.cells[cell] = 0
+                self.place(cell, mark)
+
+    def place(self, cell, mark):
+        """
+        Puts a mark on a cell and updates the window bookkeeping.
+
+        :param cell: Flat index (row * cols + col) of the cell.
+        :param mark: The player number of the mark.
+        """
+        self.update(cell, mark, 1)
+        self.cells[cell] = mark
+        self.hash ^= self.zobrist[mark][cell]
+
+    def remove(self, cell):
+        """
+        Takes a mark back from a cell and updates the window bookkeeping.
+
+        :param cell: Flat index (row * cols + col) of the cell.
+        """
+        mark = self.cells[cell]
+        self.cells[cell] = 0
+        self.hash ^= self.zobrist[mark][cell]
+        self.update(cell, mark, -1)
+
+    def update(self, cell, mark, step):
+        """
+        Adjusts the counts of the windows through a cell and moves them
+        between the line sets.
+
+        :param cell: Flat index of the cell.
+        :param mark: The player number of the mark placed or removed.
+        :param step: 1 when placing, -1 when removing.
+        """
+        opponent = 1 if mark == 2 else 2
+        own_counts = self.counts[mark]
+        other_counts = self.counts[opponent]
+        own_lines = self.lines[mark]
+        other_lines = self.lines[opponent]
+        for window in self.windows_by_cell[cell]:
+            before = own_counts[window]
+            own_counts[window] = before + step
+            if other_counts[window] == 0:
+                # Only the mark's player can still use the window
+                if before in own_lines:
+                    own_lines[before].discard(window)
+                if before + step in own_lines:
+                    own_lines[before + step].add(window)
+            other = other_counts[window]
+            if other in other_lines:
+                if step == 1 and before == 0:
+                    other_lines[other].discard(window)  # Now blocked
+                elif step == -1 and before == 1:
+                    other_lines[other].add(window)  # Open again
+
+    def empty_cells(self, window):
+        """
+        :param window: Index of a window.
+        :return: The flat indices of the window's empty cells.
+        """
+        return [cell for cell in self.windows[window] if not self.cells[cell]]
+
+    def winning_cells(self, player):
+        """
+        :param player: The player's number.
+        :return: The set of empty cells that would complete a line for the player.
+        """
+        return {
+            cell
+            for window in self.lines[player][self.k - 1]
+            for cell in self.empty_cells(window)
+        }
+
+    def four_moves(self, player):
+        """
+        :param player: The player's number.
+        :return: The empty cells that would give the player a four, best first
+                 (cells that are part of more windows two marks short).
+        """
+        counts = {}
+        for window in self.lines[player][self.k - 2]:
+            for cell in self.empty_cells(window):
+                counts[cell] = counts.get(cell, 0) + 1
+        return sorted(counts, key=lambda cell: (-counts[cell], cell))
+
+    def double_four_cells(self, player):
+        """
+        :param player: The player's number.
+        :return: The empty cells that would give the player two fours with
+                 different winning cells at once.
+        """
+        partners = {}
+        for window in self.lines[player][self.k - 2]:
+            first, second = self.empty_cells(window)
+            partners.setdefault(first, set()).add(second)
+            partners.setdefault(second, set()).add(first)
+        return [cell for cell, others in partners.items() if len(others) >= 2]
+
+    def three_moves(self, player):
+        """
+        :param player: The player's number.
+        :return: The empty cells after which the player threatens a double
+                 four, excluding moves that already make a four; the ones
+                 that leave the most double-four cells come first.
+        """
+        candidates = set()
+        for window in range(len(self.windows)):
+            if (
+                self.counts[player][window] == self.k - 3
+                and not self.counts[3 - player][window]
+            ):
+                candidates.update(self.empty_cells(window))
+        fours = set(self.four_moves(player))
+        strength = {}
+        for cell in candidates - fours:
+            self.place(cell, player)
+            count = len(self.double_four_cells(player))
+            if count:
+                strength[cell] = count
+            self.remove(cell)
+        return sorted(strength, key=lambda cell: (-strength[cell], cell))
+
+    def count_node(self):
+        """
+        Counts a search node and stops the search once the budget is used up.
+
+        :raises ThreatSearchLimit: If the node or time budget is exhausted.
+        """
+        self.nodes += 1
+        if self.nodes > self.node_limit:
+            raise ThreatSearchLimit()
+        if (
+            self.deadline is not None
+            and self.nodes % 64 == 0
+            and time.monotonic() >= self.deadline
+        ):
+            raise ThreatSearchLimit()
+
+    def attack(self, attacker, depth, vct):
+        """
+        OR node: the attacker is to move and looks for a forcing win.
+
+        :param attacker: The attacking player's number.
+        :param depth: Remaining number of attacking moves.
+        :param vct: Whether threes may be played, not only fours.
+        :return: The winning cell, or None if no forced win was found.
+        """
+        self.count_node()
+        defender = 3 - attacker
+        wins = self.winning_cells(attacker)
+        if wins:
+            return min(wins)  # Immediate win
+        if depth == 0:
+            return None
+        key = (self.hash, attacker, depth, vct)
+        if key in self.failed:
+            return None
+
+        threats = self.winning_cells(defender)
+        if len(threats) > 1:
+            self.failed.add(key)
+            return None  # Two defender fours cannot both be blocked
+        candidates = self.four_moves(attacker)
+        if vct:
+            candidates += self.three_moves(attacker)
+        if threats:
+            # The defender's four has to be blocked first; the attack goes on
+            # if the attacker still has a threat afterwards
+            candidates = list(threats)
+
+        for cell in candidates:
+            self.place(cell, attacker)
+            try:
+                if self.defend(attacker, depth - 1, vct):
+                    return cell
+            finally:
+                self.remove(cell)
+        self.failed.add(key)
+        return None
+
+    def defend(self, attacker, depth, vct):
+        """
+        AND node: the defender is to move after an attacking move.
+
+        :param attacker: The attacking player's number.
+        :param depth: Remaining number of attacking moves.
+        :param vct: Whether threes may be played, not only fours.
+        :return: True if the attacker wins against every considered defence.
+        """
+        self.count_node()
+        defender = 3 - attacker
+        if self.winning_cells(defender):
+            return False  # The defender wins first
+        wins = self.winning_cells(attacker)
+        if len(wins) > 1:
+            return True  # Two fours, only one can be blocked
+        if wins:
+            defences = list(wins)  # A four must be blocked
+        elif not vct or not self.double_four_cells(attacker):
+            return False  # No threat the defender has to answer
+        else:
+            # Against a three: break up the attacker's windows or counter
+            # with a four of the defender's own
+            defences = {
+                cell
+                for window in self.lines[attacker][self.k - 2]
+                for cell in self.empty_cells(window)
+            }
+            defences.update(self.four_moves(defender))
+            defences = sorted(defences)
+
+        for cell in defences:
+            self.place(cell, defender)
+            try:
+                if not self.attack(attacker, depth, vct):
+                    return False
+            finally:
+                self.remove(cell)
+        return True
+
+    def find_win(self, player, max_depth=10, vct=True):
+        """
+        Searches for a forced win of the player, who is to move.
+
+        :param player: The attacking player's number.
+        :param max_depth: Maximum number of attacking moves.
+        :param vct: Whether threes may be played (VCT), else only fours (VCF).
+        :return: A tuple (row, col) starting the forced win, or None if none
+                 was found within the depth and node limits.
+        """
+        self.nodes = 0
+        try:
+            # Deepen step by step, so short wins are found before long lines
+            # of threats are explored
+            for depth in range(1, max_depth + 1):
+                cell = self.attack(player, depth, vct)
+                if cell is not None:
+                    return divmod(cell, self.cols)
+        except ThreatSearchLimit:
+            pass
+        return None
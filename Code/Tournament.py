@@ -0,0 +1,205 @@
+import sys
+import os
+import argparse
+import itertools
+import random
+import multiprocessing
+import numpy as np
+from tqdm import tqdm
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Game import Game, BOARD_BACKENDS  # Import the headless game
+from Code.MyBot import MyBot  # Import MyBot class (AI Player)
+
+
+def create_bot(config, number):
+    """
+    Builds a bot from a configuration dict.
+
+    :param config: Dict with "name", "mode" and optionally further MyBot
+                   keyword arguments such as "time_limit" or "neighbourhood".
+    :param number: The player number the bot plays with (1 or 2).
+    :return: A MyBot instance.
+    """
+    options = {key: value for key, value in config.items() if key != "name"}
+    mode = options.pop("mode")
+    return MyBot(config["name"], number, mode, **options)
+
+
+def play_game(task):
+    """
+    Plays one bot-vs-bot game without any output. Runs inside a worker process.
+
+    :param task: Tuple (pairing, game_index, config_a, config_b, rows, cols, k,
+                 backend, seed). Bot A moves first in even games, bot B in odd
+                 games, so both get each colour equally often.
+    :return: Tuple (pairing, a_first, winner, moves) where winner is "a", "b"
+             or None for a draw.
+    """
+    pairing, game_index, config_a, config_b, rows, cols, k, backend, seed = task
+    random.seed(seed)  # Mode 1 and the mode 2 fallback use `random`
+    np.random.seed(seed % 2**32)
+
+    a_first = game_index % 2 == 0
+    bot_a = create_bot(config_a, 1 if a_first else 2)
+    try:
+        bot_b = create_bot(config_b, 2 if a_first else 1)
+        try:
+            first, second = (bot_a, bot_b) if a_first else (bot_b, bot_a)
+            result = Game(rows, cols, k, first, second, backend).play()
+        finally:
+            bot_b.close()  # Stops worker pools and trace files of the bots
+    finally:
+        bot_a.close()
+    winner = None
+    if result.winner is not None:
+        winner = "a" if result.winner is bot_a else "b"
+    return pairing, a_first, winner, len(result.moves)
+
+
+def run_tournament(
+    configs,
+    rows,
+    cols,
+    k,
+    games_per_pairing,
+    pairings=None,
+    processes=None,
+    seed=0,
+    backend="numpy",
+    progress=True,
+):
+    """
+    Plays bot-vs-bot matches for every pairing across a process pool.
+
+    Every game gets its own seed derived from `seed` and its position in the
+    schedule, so results do not depend on which worker plays which game.
+
+    :param configs: List of bot configuration dicts, see create_bot.
+    :param rows: Number of rows in the board.
+    :param cols: Number of columns in the board.
+    :param k: Number of consecutive marks needed to win.
+    :param games_per_pairing: Games played by each pairing, colours alternate.
+    :param pairings: List of (index_a, index_b) into configs, or None for a
+                     round robin of all configurations.
+    :param processes: Worker processes, None for one per core, 1 to play in
+                      the current process.
+    :param seed: Base seed of the tournament.
+    :param backend: Board implementation, a key of Game.BOARD_BACKENDS.
+    :param progress: Whether to show a tqdm progress bar.
+    :return: A list with one result dict per pairing.
+    """
+    if pairings is None:
+        pairings = list(itertools.combinations(range(len(configs)), 2))
+
+    tasks = []
+    for pairing, (index_a, index_b) in enumerate(pairings):
+        for game_index in range(games_per_pairing):
+            game_seed = seed * 1_000_003 + len(tasks)
+            tasks.append(
+                (
+                    pairing,
+                    game_index,
+                    configs[index_a],
+                    configs[index_b],
+                    rows,
+                    cols,
+                    k,
+                    backend,
+                    game_seed,
+                )
+            )
+
+    results = [
+        {
+            "a": configs[index_a]["name"],
+            "b": configs[index_b]["name"],
+            "games": 0,
+            "a_wins": 0,
+            "b_wins": 0,
+            "draws": 0,
+            "a_wins_as_first": 0,
+            "b_wins_as_first": 0,
+            "total_moves": 0,
+        }
+        for index_a, index_b in pairings
+    ]
+
+    def record(outcome):
+        pairing, a_first, winner, moves = outcome
+        result = results[pairing]
+        result["games"] += 1
+        result["total_moves"] += moves
+        if winner is None:
+            result["draws"] += 1
+        else:
+            result[f"{winner}_wins"] += 1
+            if a_first == (winner == "a"):
+                result[f"{winner}_wins_as_first"] += 1
+
+    with tqdm(total=len(tasks), disable=not progress, desc="Games") as bar:
+        if processes == 1:
+            for task in tasks:
+                record(play_game(task))
+                bar.update()
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                for outcome in pool.imap_unordered(play_game, tasks, chunksize=4):
+                    record(outcome)
+                    bar.update()
+
+    for result in results:
+        result["mean_length"] = result.pop("total_moves") / max(result["games"], 1)
+        result["a_score"] = (result["a_wins"] + 0.5 * result["draws"]) / max(
+            result["games"], 1
+        )
+    return results
+
+
+def main():
+    """
+    Command-line entry point: plays a round robin between bot modes.
+    """
+    parser = argparse.ArgumentParser(description="Bot-vs-bot MNK tournament")
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--games", type=int, default=100, help="Games per pairing")
+    parser.add_argument(
+        "--modes", type=int, nargs="+", default=[1, 2, 3], help="Bot modes to pair"
+    )
+    parser.add_argument(
+        "--time-limit", type=float, default=0.1, help="Seconds per mode 3 move"
+    )
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=sorted(BOARD_BACKENDS), default="numpy")
+    args = parser.parse_args()
+
+    configs = [
+        {"name": f"Bot Level {mode}", "mode": mode, "time_limit": args.time_limit}
+        for mode in args.modes
+    ]
+    results = run_tournament(
+        configs,
+        args.rows,
+        args.cols,
+        args.k,
+        args.games,
+        processes=args.processes,
+        seed=args.seed,
+        backend=args.backend,
+    )
+    for result in results:
+        print(
+            f"{result['a']} vs {result['b']}: "
+            f"{result['a_wins']}-{result['draws']}-{result['b_wins']} "
+            f"(score {result['a_score']:.3f}, "
+            f"mean length {result['mean_length']:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Bound types of a stored search result
+EXACT = 0  # The value is the exact minimax value of the position
+LOWER_BOUND = 1  # The search failed high, the real value is at least this
+UPPER_BOUND = 2  # The search failed low, the real value is at most this
+
+
+class TranspositionTable:
+    """
+    Fixed-size cache of search results, indexed by a position hash.
+
+    Each slot holds one entry (key, depth, bound, value, best_move, generation).
+    When two positions map to the same slot, the entry from the current search
+    or with the deeper search wins, so memory stays bounded no matter how long
+    the game or how big the board.
+    """
+
+    def __init__(self, max_entries=1 << 18):
+        """
+        Initializes an empty table.
+
+        :param max_entries: Number of slots, i.e. the maximum number of stored positions.
+        """
+        self.max_entries = max_entries
+        self.slots = [None] * max_entries
+        self.generation = 0  # Incremented for every new search to age old entries
+        self.hits = 0  # Lookups that found their position
+        self.misses = 0  # Lookups that found nothing usable
+        self.collisions = 0  # Lookups or stores that met a different position
+        self.stores = 0  # Entries written
+        self.rejected = 0  # Stores refused by the replacement policy
+
+    def new_search(self):
+        """
+        Marks the start of a new search. Entries of earlier searches stay
+        usable but are replaced first.
+        """
+        self.generation += 1
+
+    def lookup(self, key):
+        """
+        Looks up a position.
+
+        :param key: The position hash.
+        :return: A tuple (depth, bound, value, best_move), or None if not stored.
+        """
+        entry = self.slots[key % self.max_entries]
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] != key:
+            self.collisions += 1  # Slot is taken by another position
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1:5]
+
+    def store(self, key, depth, bound, value, best_move):
+        """
+        Stores a search result, subject to the replacement policy:
+        an occupied slot is only overwritten by the same position, by an entry
+        of a newer search or by a search that is at least as deep.
+
+        :param key: The position hash.
+        :param depth: Remaining search depth the value was computed with.
+        :param bound: EXACT, LOWER_BOUND or UPPER_BOUND.
+        :param value: The search value.
+        :param best_move: The best move found, or None.
+        """
+        index = key % self.max_entries
+        entry = self.slots[index]
+        if entry is not None and entry[0] != key:
+            self.collisions += 1
+            if entry[5] == self.generation and entry[1] > depth:
+                self.rejected += 1  # Keep the deeper result of this search
+                return
+        self.slots[index] = (key, depth, bound, value, best_move, self.generation)
+        self.stores += 1
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        self.__init__(self.max_entries)
+
+    def __len__(self):
+        """
+        :return: Number of occupied slots.
+        """
+        return sum(entry is not None for entry in self.slots)
+
+    def stats(self):
+        """
+        Collects the counters, e.g. to size the table.
+
+        :return: A dict with size, fill, hits, misses, collisions, stores and rejected.
+        """
+        return {
+            "size": self.max_entries,
+            "fill": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,202 @@
+import sys
+import os
+import argparse
+import numpy as np
+
+# Add the parent directory to the system path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Dataset import load_dataset  # Import the position datasets
+from Code.Evaluator import (
+    default_weights,
+    default_profile_path,
+    save_weight_profile,
+    window_features,
+)  # Import the evaluation
+
+
+def sigmoid(values):
+    """
+    :param values: Array of values.
+    :return: The logistic function of each value.
+    """
+    return 0.5 * (1 + np.tanh(0.5 * values))  # Stable for large magnitudes
+
+
+def texel_loss(scores, targets, scale):
+    """
+    Mean squared error between the results and the win probabilities the
+    scores predict, the objective of Texel tuning.
+
+    :param scores: Evaluations from the side to move's point of view.
+    :param targets: Results for the side to move: 1 win, 0.5 draw, 0 loss.
+    :param scale: Factor turning a score into logistic units.
+    :return: The loss.
+    """
+    return float(np.mean((sigmoid(scale * scores) - targets) ** 2))
+
+
+def fit_scale(scores, targets, scales=None):
+    """
+    Finds the scale that makes the given scores predict the results best. It
+    is fitted once for the starting weights and then held fixed, so the tuned
+    weights keep the evaluation's scale relative to WIN_SCORE.
+
+    :param scores: Evaluations from the side to move's point of view.
+    :param targets: Results for the side to move: 1 win, 0.5 draw, 0 loss.
+    :param scales: Candidate scales, by default log-spaced from 1e-5 to 1.
+    :return: The candidate with the lowest loss.
+    """
+    if scales is None:
+        scales = np.geomspace(1e-5, 1, 301)
+    losses = [texel_loss(scores, targets, scale) for scale in scales]
+    return float(scales[int(np.argmin(losses))])
+
+
+def tune_weights(
+    features, targets, weights, scale, iterations=100, damping=1e-3, tolerance=1e-10
+):
+    """
+    Minimizes the Texel loss over the weights with damped Gauss-Newton
+    (Levenberg-Marquardt) steps. The evaluation is linear in the weights, so
+    every step is a few products with the whole feature matrix and a solve
+    of a k x k system.
+
+    :param features: Array of shape (N, k), the evaluation's weight terms
+                     from the side to move's point of view (see window_features).
+    :param targets: Results for the side to move: 1 win, 0.5 draw, 0 loss.
+    :param weights: Starting weights.
+    :param scale: Factor turning a score into logistic units, see fit_scale.
+    :param iterations: Maximum number of steps.
+    :param damping: Initial damping; it shrinks after a step that lowers the
+                    loss and grows after one that does not.
+    :param tolerance: Stop once a step lowers the loss by less than this.
+    :return: A tuple (weights, losses) with the tuned weights as a tuple and
+             the loss after every accepted step, starting with the initial one.
+    """
+    weights = np.array(weights, dtype=float)
+    loss = texel_loss(features @ weights, targets, scale)
+    losses = [loss]
+    for _ in range(iterations):
+        predictions = sigmoid(scale * (features @ weights))
+        residuals = predictions - targets
+        jacobian = (scale * predictions * (1 - predictions))[:, None] * features
+        gradient = jacobian.T @ residuals / len(targets)
+        hessian = jacobian.T @ jacobian / len(targets)
+
+        # Raise the damping until a step improves the loss
+        while damping < 1e12:
+            diagonal = np.diag(np.diag(hessian)) + 1e-12 * np.eye(len(weights))
+            step = np.linalg.solve(hessian + damping * diagonal, -gradient)
+            new_loss = texel_loss(features @ (weights + step), targets, scale)
+            if new_loss < loss:
+                break
+            damping *= 10
+        else:
+            break  # No step helps any more
+        weights += step
+        damping = max(damping / 10, 1e-9)
+        improvement, loss = loss - new_loss, new_loss
+        losses.append(loss)
+        if improvement < tolerance:
+            break
+    return tuple(weights.tolist()), losses
+
+
+def side_to_move_data(arrays, k):
+    """
+    Turns dataset arrays into tuning data.
+
+    Positions already holding a full window are left out, since their score
+    does not depend on the weights.
+
+    :param arrays: Arrays of a dataset, see Dataset.load_dataset.
+    :param k: Number of consecutive marks needed to win.
+    :return: A tuple (features, targets): features of shape (N, k) from the
+             side to move's point of view and results mapped to 1, 0.5 and 0.
+    """
+    features = window_features(arrays["positions"], k)
+    sign = np.where(np.asarray(arrays["to_move"]) == 1, 1.0, -1.0)
+    undecided = features[:, k] == 0
+    targets = (np.asarray(arrays["results"], dtype=float) + 1) / 2
+    return (sign[:, None] * features[:, :k])[undecided], targets[undecided]
+
+
+def tune_dataset(directory, weights=None, validation=0.1, seed=0, iterations=100):
+    """
+    Tunes the evaluation weights of one configuration on a position dataset.
+
+    :param directory: A dataset directory written by Dataset.PositionDataset.
+    :param weights: Starting weights, or None for Evaluator.default_weights(k).
+    :param validation: Fraction of the positions held out to check the fit.
+    :param seed: Seed of the split.
+    :param iterations: Maximum number of optimization steps.
+    :return: Dict with rows, cols, k, the tuned weights, the scale, the
+             training and validation losses before and after, and the number
+             of positions used.
+    """
+    meta, arrays = load_dataset(directory)
+    k = meta["k"]
+    weights = default_weights(k) if weights is None else tuple(weights)
+    features, targets = side_to_move_data(arrays, k)
+    order = np.random.default_rng(seed).permutation(len(targets))
+    held_out = order[: int(len(order) * validation)]
+    train = order[len(held_out) :]
+
+    scale = fit_scale(features[train] @ np.array(weights), targets[train])
+    tuned, losses = tune_weights(
+        features[train], targets[train], weights, scale, iterations
+    )
+    result = {
+        "rows": meta["rows"],
+        "cols": meta["cols"],
+        "k": k,
+        "weights": tuned,
+        "scale": scale,
+        "positions": len(train),
+        "train_loss": (losses[0], losses[-1]),
+        "validation_loss": None,
+    }
+    if len(held_out):
+        result["validation_loss"] = tuple(
+            texel_loss(features[held_out] @ np.array(w), targets[held_out], scale)
+            for w in (weights, tuned)
+        )
+    return result
+
+
+def main():
+    """
+    Command-line entry point: tunes the weights on a dataset and writes the
+    configuration's profile.
+    """
+    parser = argparse.ArgumentParser(description="Tune MNK evaluation weights")
+    parser.add_argument("--dataset", required=True, help="Dataset directory")
+    parser.add_argument("--validation", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--output", default=None, help="Profile file to write")
+    args = parser.parse_args()
+
+    result = tune_dataset(
+        args.dataset,
+        validation=args.validation,
+        seed=args.seed,
+        iterations=args.iterations,
+    )
+    rows, cols, k = result["rows"], result["cols"], result["k"]
+    print(f"{result['positions']} positions, scale {result['scale']:.3g}")
+    print(f"Default weights: {default_weights(k)}")
+    print(f"Tuned weights:   {tuple(round(w, 4) for w in result['weights'])}")
+    print("Training loss:   {:.5f} -> {:.5f}".format(*result["train_loss"]))
+    if result["validation_loss"] is not None:
+        print("Validation loss: {:.5f} -> {:.5f}".format(*result["validation_loss"]))
+
+    path = args.output or default_profile_path(rows, cols, k)
+    info = {key: result[key] for key in ("scale", "positions", "validation_loss")}
+    save_weight_profile(path, rows, cols, k, result["weights"], **info)
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
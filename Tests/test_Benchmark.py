@@ -0,0 +1,96 @@
+import sys
+import os
+import copy
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Benchmark import (
+    benchmark_config,
+    compare,
+    run_benchmarks,
+    seeded_positions,
+)  # Import the benchmark suite
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Unit tests for the benchmark suite.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Run a very short benchmark once for all tests.
+        """
+        cls.report = run_benchmarks([(3, 3, 3), (5, 5, 4)], 2, 0, 2, 0.01)
+
+    def test_report_layout(self):
+        """
+        Test that every configuration reports all metrics as positive numbers.
+        """
+        self.assertEqual(list(self.report["results"]), ["3x3x3", "5x5x4"])
+        for metrics in self.report["results"].values():
+            self.assertEqual(
+                set(metrics),
+                {
+                    "has_won_per_sec",
+                    "make_move_per_sec",
+                    "evaluate_board_per_sec",
+                    "evaluate_boards_per_sec",
+                    "mode2_move_seconds",
+                    "mode3_move_seconds",
+                    "mode3_nodes_per_sec",
+                },
+            )
+            self.assertTrue(all(value > 0 for value in metrics.values()))
+
+    def test_rates_survive_zero_timings(self):
+        """
+        Test that runs too quick for the clock still give finite rates instead
+        of dividing by zero.
+        """
+        with patch("Code.Benchmark.time.perf_counter", return_value=1.0):
+            results = benchmark_config(3, 3, 3, 2, 0, 1, 0, "numpy")
+        for metric, value in results.items():
+            if metric.endswith("_per_sec"):
+                self.assertTrue(np.isfinite(value), metric)
+                self.assertGreater(value, 0, metric)
+
+    def test_seeded_positions_are_reproducible(self):
+        """
+        Test that the same seed gives the same undecided positions.
+        """
+        first = seeded_positions(5, 5, 4, 3, 7)
+        second = seeded_positions(5, 5, 4, 3, 7, backend="bitboard")
+        for (board, player), (other, other_player) in zip(first, second):
+            self.assertTrue(np.array_equal(board.grid, other.grid))
+            self.assertEqual(player, other_player)
+            self.assertFalse(board.has_won(1) or board.has_won(2))
+
+    def test_compare_flags_regressions(self):
+        """
+        Test the comparison:
+        - Lower throughput or longer moves beyond the tolerance are regressions.
+        - Improvements and changes within the tolerance are not.
+        """
+        current = copy.deepcopy(self.report)
+        metrics = current["results"]["3x3x3"]
+        metrics["has_won_per_sec"] /= 2  # Slower
+        metrics["mode3_move_seconds"] *= 2  # Slower
+        metrics["make_move_per_sec"] *= 2  # Faster
+        metrics["mode2_move_seconds"] *= 1.05  # Noise
+        rows, regressions = compare(self.report, current, tolerance=0.1)
+        self.assertEqual(len(rows), 14)  # 7 metrics for 2 configurations
+        self.assertEqual(
+            {(config, metric) for config, metric, *_ in regressions},
+            {("3x3x3", "has_won_per_sec"), ("3x3x3", "mode3_move_seconds")},
+        )
+        self.assertEqual(compare(self.report, self.report)[1], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import the NumPy board as reference
+from Code.BitBoard import BitBoard  # Import the BitBoard class for testing
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+
+
+class TestBitBoard(unittest.TestCase):
+    """
+    Unit tests for the BitBoard class.
+    """
+
+    def setUp(self):
+        """
+        Set up a default 3x3 bitboard with a win condition of 3 in a row.
+        """
+        self.board = BitBoard(3, 3, 3)
+
+    def test_initialization(self):
+        """
+        Test if the bitboard starts empty with the correct grid shape.
+        """
+        self.assertEqual(self.board.grid.shape, (3, 3))
+        self.assertTrue(np.all(self.board.grid == 0))
+        self.assertEqual(len(self.board.available_moves()), 9)
+
+    def test_make_and_undo_move(self):
+        """
+        Test placing, rejecting and undoing moves.
+        """
+        self.assertTrue(self.board.make_move(0, 0, 1))
+        self.assertFalse(self.board.make_move(0, 0, 2))  # Occupied
+        self.assertFalse(self.board.make_move(3, 0, 2))  # Out of bounds
+        self.assertEqual(self.board.grid[0, 0], 1)
+        self.board.undo_move(0, 0)
+        self.assertTrue(self.board.is_valid_move(0, 0))
+
+    def test_has_won(self):
+        """
+        Test that an anti-diagonal win is detected by both win checks.
+        """
+        self.board.make_move(0, 2, 2)
+        self.board.make_move(1, 1, 2)
+        self.board.make_move(2, 0, 2)
+        self.assertTrue(self.board.has_won(2))
+        self.assertTrue(self.board.has_won_at(2, 0, 2))
+        self.assertFalse(self.board.has_won(1))
+
+    def test_matches_numpy_board(self):
+        """
+        Test that the bitboard agrees with the NumPy board on random games
+        of different shapes.
+        """
+        rng = np.random.default_rng(1)
+        for rows, cols, k in [(3, 3, 3), (4, 7, 4), (7, 4, 3), (6, 6, 5)]:
+            board = Board(rows, cols, k)
+            bitboard = BitBoard(rows, cols, k)
+            for turn, cell in enumerate(rng.permutation(rows * cols)):
+                row, col = divmod(int(cell), cols)
+                player = turn % 2 + 1
+                for player_number in (1, 2):
+                    self.assertEqual(
+                        bitboard.would_win(row, col, player_number),
+                        board.would_win(row, col, player_number),
+                    )
+                board.make_move(row, col, player)
+                bitboard.make_move(row, col, player)
+                self.assertEqual(
+                    bitboard.has_won_at(row, col, player),
+                    board.has_won_at(row, col, player),
+                )
+                for player_number in (1, 2):
+                    self.assertEqual(
+                        bitboard.has_won(player_number), board.has_won(player_number)
+                    )
+                self.assertEqual(bitboard.available_moves(), board.available_moves())
+            self.assertTrue(np.array_equal(bitboard.grid, board.grid))
+
+    def test_nearby_moves_match_numpy_board(self):
+        """
+        Test that the bitmask neighbourhood filter keeps the same moves as the
+        NumPy board's, including next to the edges of the board.
+        """
+        rng = np.random.default_rng(2)
+        for rows, cols, k in [(3, 3, 3), (4, 7, 4), (7, 4, 3), (9, 9, 5)]:
+            board = Board(rows, cols, k)
+            bitboard = BitBoard(rows, cols, k)
+            for turn, cell in enumerate(rng.permutation(rows * cols)[:5]):
+                for distance in (1, 2, 3):
+                    self.assertEqual(
+                        bitboard.nearby_moves(bitboard.available_moves(), distance),
+                        board.nearby_moves(board.available_moves(), distance),
+                    )
+                row, col = divmod(int(cell), cols)
+                board.make_move(row, col, turn % 2 + 1)
+                bitboard.make_move(row, col, turn % 2 + 1)
+
+    def test_push_and_pop(self):
+        """
+        Test the move stack and empty-cell index on the bitboard.
+        """
+        self.board.push(0, 0, 1)
+        self.board.push(2, 2, 2)
+        self.assertEqual(self.board.move_count, 2)
+        self.assertEqual(len(self.board.available_moves()), 7)
+        self.assertEqual(self.board.pop(), (2, 2, 2))
+        self.assertEqual(self.board.grid[0, 0], 1)
+        self.board.grid = np.array([[1, 2, 0], [0, 1, 0], [2, 0, 0]])
+        self.assertEqual(self.board.move_count, 4)
+        self.assertEqual(self.board.move_stack, [])  # Cleared by the grid setter
+        self.assertEqual(
+            self.board.available_moves(), [(0, 2), (1, 0), (1, 2), (2, 1), (2, 2)]
+        )
+
+    def test_bot_plays_on_bitboard(self):
+        """
+        Test that the bot finds the same blocking move on a bitboard.
+        """
+        self.board.make_move(0, 0, 2)
+        self.board.make_move(0, 1, 2)
+        bot = MyBot("Bot", 1, 3)
+        self.assertEqual(bot.make_move(1, self.board, 3), (0, 2))
+        self.assertEqual(len(self.board.available_moves()), 7)  # Board unchanged
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,11 @@ import numpy as np
 # Add the parent directory to sys.path to allow module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
-from Code.Board import Board  # Import the Board class for testing
+from Code.Board import (
+    Board,
+    batch_has_won,
+    batch_winner,
+)  # Import the Board class and batch win checks for testing
 
 
 class TestBoard(unittest.TestCase):
@@ -80,6 +84,210 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(self.board.has_won(2))  # No win for Player 2
         self.assertFalse(np.any(self.board.grid == 0))  # No empty cells (board is full)
 
+    def test_has_won_at(self):
+        """
+        Test the last-move win check:
+        - An anti-diagonal win should be recognized through any of its cells.
+        - A cell that is not part of a winning line should not report a win.
+        """
+        self.board.make_move(0, 2, 1)
+        self.board.make_move(1, 1, 1)
+        self.board.make_move(2, 0, 1)
+        self.board.make_move(0, 0, 2)
+        self.assertTrue(self.board.has_won_at(1, 1, 1))  # Middle of the line
+        self.assertTrue(self.board.has_won_at(2, 0, 1))  # End of the line
+        self.assertFalse(self.board.has_won_at(0, 0, 2))  # Lone mark of player 2
+        self.assertFalse(self.board.has_won_at(0, 0, 1))  # Cell of another player
+
+    def test_would_win(self):
+        """
+        Test that would_win detects winning cells without changing the board.
+        """
+        self.board.make_move(0, 0, 1)
+        self.board.make_move(0, 1, 1)
+        self.board.make_move(1, 1, 2)
+        key = self.board.hash
+        self.assertTrue(self.board.would_win(0, 2, 1))
+        self.assertFalse(self.board.would_win(0, 2, 2))
+        self.assertFalse(self.board.would_win(2, 2, 1))
+        self.assertEqual(self.board.grid[0, 2], 0)
+        self.assertEqual(self.board.hash, key)
+
+    def test_has_won_at_matches_full_scan(self):
+        """
+        Test that the last-move win check agrees with the full scan of `has_won`
+        on randomized boards of different shapes.
+        """
+        rng = np.random.default_rng(0)
+        for rows, cols, k in [(3, 3, 3), (4, 6, 3), (6, 4, 4), (7, 7, 5)]:
+            board = Board(rows, cols, k)
+            for _ in range(50):
+                board.grid = rng.integers(0, 3, size=(rows, cols))
+                for player in (1, 2):
+                    any_cell_wins = any(
+                        board.has_won_at(row, col, player)
+                        for row in range(rows)
+                        for col in range(cols)
+                    )
+                    self.assertEqual(any_cell_wins, board.has_won(player))
+
+    def test_hash_is_incremental(self):
+        """
+        Test that the Zobrist hash follows make_move and undo_move and matches
+        a hash computed from scratch.
+        """
+        empty_hash = self.board.hash
+        self.board.make_move(0, 0, 1)
+        self.board.make_move(2, 1, 2)
+        self.assertNotEqual(self.board.hash, empty_hash)
+        self.assertEqual(self.board.hash, self.board.compute_hash())
+
+        self.board.undo_move(2, 1)
+        self.board.undo_move(0, 0)
+        self.assertEqual(self.board.hash, empty_hash)
+
+        # The same position reached in a different order has the same hash
+        other = Board(3, 3, 3)
+        other.make_move(2, 1, 2)
+        other.make_move(0, 0, 1)
+        self.board.make_move(0, 0, 1)
+        self.board.make_move(2, 1, 2)
+        self.assertEqual(other.hash, self.board.hash)
+
+    def test_push_and_pop(self):
+        """
+        Test that pop takes back pushed moves in reverse order and restores
+        the grid, hash, empty cells and move count.
+        """
+        empty_hash = self.board.hash
+        self.board.push(1, 1, 1)
+        self.board.push(0, 2, 2)
+        self.assertEqual(self.board.move_count, 2)
+        self.assertEqual(self.board.move_stack, [(1, 1, 1), (0, 2, 2)])
+        self.assertNotIn((0, 2), self.board.available_moves())
+
+        self.assertEqual(self.board.pop(), (0, 2, 2))
+        self.assertEqual(self.board.pop(), (1, 1, 1))
+        self.assertEqual(self.board.move_count, 0)
+        self.assertEqual(self.board.hash, empty_hash)
+        self.assertTrue((self.board.grid == 0).all())
+        self.assertEqual(len(self.board.available_moves()), 9)
+
+        with self.assertRaises(IndexError):
+            self.board.pop()  # Nothing left to take back
+        self.board.push(0, 0, 1)
+        with self.assertRaises(ValueError):
+            self.board.push(0, 0, 2)  # Occupied cell
+
+    def test_empty_cell_index(self):
+        """
+        Test that the incrementally kept empty cells match a scan of the grid
+        through random pushes, pops and grid replacements.
+        """
+        rng = np.random.default_rng(5)
+        board = Board(5, 6, 4)
+        for step in range(400):
+            if step % 100 == 99:
+                board.grid = rng.integers(0, 3, size=(5, 6))  # Resynchronizes
+            elif board.move_stack and (
+                not board.available_moves() or rng.random() < 0.4
+            ):
+                board.pop()
+            elif board.available_moves():
+                moves = board.available_moves()
+                row, col = moves[rng.integers(len(moves))]
+                board.push(row, col, int(rng.integers(1, 3)))
+            rows, cols = np.nonzero(board.grid == 0)
+            self.assertEqual(board.available_moves(), list(zip(rows, cols)))
+            self.assertEqual(board.move_count, np.count_nonzero(board.grid))
+
+    def test_canonical_hash(self):
+        """
+        Test that all rotations and reflections of a position share the
+        canonical hash and that moves map to the canonical image and back.
+        """
+        rng = np.random.default_rng(7)
+        for rows, cols, count in [(3, 3, 8), (5, 5, 8), (4, 6, 4)]:
+            board = Board(rows, cols, 3)
+            grid = rng.choice(3, size=(rows, cols), p=[0.5, 0.25, 0.25])
+            images = [grid, grid[:, ::-1], grid[::-1, :], grid[::-1, ::-1]]
+            if rows == cols:
+                images += [grid.T, grid[::-1, ::-1].T, grid[::-1, :].T, grid[:, ::-1].T]
+            self.assertEqual(len(board.permutations), count)
+
+            keys = set()
+            for image in images:
+                board.grid = np.ascontiguousarray(image)
+                key, transform = board.canonical_hash()
+                keys.add(key)
+                for row in range(rows):
+                    for col in range(cols):
+                        canonical = board.to_canonical((row, col), transform)
+                        self.assertEqual(
+                            board.from_canonical(canonical, transform), (row, col)
+                        )
+            self.assertEqual(len(keys), 1)
+
+    def test_symmetric_hashes_are_incremental(self):
+        """
+        Test that the hashes of the symmetric images follow push and pop.
+        """
+        board = Board(4, 4, 3)
+        for row, col, player in [(0, 1, 1), (2, 3, 2), (3, 3, 1)]:
+            board.push(row, col, player)
+            self.assertEqual(
+                board.symmetric_hashes, board.compute_symmetric_hashes(board.grid)
+            )
+            self.assertEqual(board.symmetric_hashes[0], board.hash)
+        for _ in range(3):
+            board.pop()
+        self.assertEqual(board.symmetric_hashes, [0] * 8)
+
+    def test_batch_has_won_matches_has_won(self):
+        """
+        Test that the vectorized batch win check agrees with `has_won` on
+        randomized boards of many shapes, including k longer than a side.
+        """
+        rng = np.random.default_rng(3)
+        for rows, cols, k in [(3, 3, 3), (4, 7, 3), (7, 4, 4), (5, 5, 5), (2, 6, 3)]:
+            # Sparse boards so that wins and non-wins both occur
+            grids = rng.choice(3, size=(300, rows, cols), p=[0.3, 0.35, 0.35])
+            board = Board(rows, cols, k)
+            for player in (1, 2):
+                expected = []
+                for grid in grids:
+                    board.grid = grid
+                    expected.append(board.has_won(player))
+                self.assertEqual(batch_has_won(grids, player, k).tolist(), expected)
+
+    def test_batch_winner(self):
+        """
+        Test the per-board winner codes of the batch API.
+        """
+        grids = np.zeros((4, 3, 3), dtype=int)
+        grids[1, 0, :] = 1  # Row win for player 1
+        grids[2, :, 2] = 2  # Column win for player 2
+        grids[3, 0, :] = 1
+        grids[3, 2, :] = 2  # Both players have a line
+        self.assertEqual(batch_winner(grids, 3).tolist(), [0, 1, 2, 3])
+
+    def test_grid_is_read_only(self):
+        """
+        Test that writing into the grid fails instead of bypassing the hashes
+        and the empty-cell index, and that assigning a grid copies it.
+        """
+        with self.assertRaises(ValueError):
+            self.board.grid[1, 1] = 1
+        self.assertIn((1, 1), self.board.available_moves())
+        self.assertEqual(self.board.hash, 0)
+
+        grid = np.zeros((3, 3), dtype=int)
+        self.board.grid = grid
+        grid[0, 0] = 1  # Does not reach the board
+        self.assertEqual(self.board.grid[0, 0], 0)
+        self.board.make_move(0, 0, 1)
+        self.assertEqual(self.board.grid[0, 0], 1)  # The view follows moves
+
 
 if __name__ == "__main__":
     unittest.main()
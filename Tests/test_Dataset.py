@@ -0,0 +1,105 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Evaluator import WIN_SCORE  # Import the win score
+from Code.Game import Game  # Import the Game class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.Dataset import PositionDataset, load_dataset  # Import the export
+
+
+class TestDataset(unittest.TestCase):
+    """
+    Unit tests for the position dataset export.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary dataset directory and a won 3x3 game.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        # Player 1 wins on the top row
+        self.moves = [(0, 0, 1), (1, 0, 2), (0, 1, 1), (1, 1, 2), (0, 2, 1)]
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        self.directory.cleanup()
+
+    def test_positions_and_labels(self):
+        """
+        Test that every position before a move is stored with its labels.
+        """
+        with PositionDataset(self.path, 3, 3, 3, 100) as dataset:
+            dataset.add_game(self.moves, 1)
+        meta, arrays = load_dataset(self.path)
+        self.assertEqual(meta["count"], 5)
+        self.assertEqual(arrays["positions"].shape, (5, 3, 3))
+        self.assertEqual(arrays["to_move"].tolist(), [1, 2, 1, 2, 1])
+        self.assertEqual(arrays["results"].tolist(), [1, -1, 1, -1, 1])
+        self.assertEqual(arrays["plies"].tolist(), [0, 1, 2, 3, 4])
+        self.assertTrue(np.all(arrays["positions"][0] == 0))
+        self.assertEqual(arrays["positions"][4][1, 1], 2)
+        self.assertTrue(np.isnan(arrays["scores"]).all())
+
+    def test_deduplication(self):
+        """
+        Test that repeated and mirrored games add no new positions.
+        """
+        mirrored = [(row, 2 - col, player) for row, col, player in self.moves]
+        with PositionDataset(self.path, 3, 3, 3, 100) as dataset:
+            dataset.add_game(self.moves, 1)
+            dataset.add_game(self.moves, 1)
+            dataset.add_game(mirrored, 1)
+        self.assertEqual(dataset.count, 5)
+        self.assertEqual(dataset.duplicates, 10)
+
+        with PositionDataset(self.path, 3, 3, 3, 100, dedupe_size=0) as dataset:
+            dataset.add_game(self.moves, 1)
+            dataset.add_game(self.moves, 1)
+        self.assertEqual(dataset.count, 10)
+
+    def test_capacity(self):
+        """
+        Test that positions beyond the capacity are dropped.
+        """
+        with PositionDataset(self.path, 3, 3, 3, 3) as dataset:
+            dataset.add_game(self.moves, 1)
+        self.assertTrue(dataset.full)
+        self.assertEqual(dataset.count, 3)
+        self.assertEqual(dataset.dropped, 2)
+        self.assertEqual(load_dataset(self.path)[0]["count"], 3)
+
+    def test_search_scores(self):
+        """
+        Test that positions get search scores when a depth is set.
+        """
+        with PositionDataset(self.path, 3, 3, 3, 100, score_depth=2) as dataset:
+            dataset.add_game(self.moves, 1)
+        scores = load_dataset(self.path)[1]["scores"]
+        self.assertFalse(np.isnan(scores).any())
+        self.assertEqual(scores[4], WIN_SCORE)  # Player 1 can complete the row
+
+    def test_records_played_games(self):
+        """
+        Test that the dataset works as the recorder of Game.play.
+        """
+        with PositionDataset(self.path, 3, 3, 3, 1000) as dataset:
+            for _ in range(5):
+                game = Game(3, 3, 3, MyBot("A", 1, 1), MyBot("B", 2, 2))
+                game.play(recorder=dataset)
+        meta, arrays = load_dataset(self.path)
+        self.assertEqual(meta["games"], 5)
+        self.assertEqual(len(arrays["plies"]), meta["count"])
+        self.assertTrue(set(arrays["results"].tolist()) <= {-1, 0, 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
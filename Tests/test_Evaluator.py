@@ -0,0 +1,164 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Evaluator import (
+    WindowEvaluator,
+    default_weights,
+    evaluate_batch,
+    load_weight_profiles,
+    pattern_table,
+    save_weight_profile,
+    window_features,
+    WIN_SCORE,
+)  # Import the evaluation under test
+
+
+class TestWindowEvaluator(unittest.TestCase):
+    """
+    Unit tests for the WindowEvaluator class.
+    """
+
+    def setUp(self):
+        """
+        Create an evaluator for a 3x3 board with 3 in a row to win.
+        """
+        self.evaluator = WindowEvaluator(3, 3, 3)
+
+    def test_empty_board(self):
+        """
+        Test that an empty board is scored as even.
+        """
+        self.assertEqual(self.evaluator.score(1), 0)
+        self.assertEqual(self.evaluator.score(2), 0)
+
+    def test_diagonals_are_scored(self):
+        """
+        Test that two marks on a diagonal with the third cell free count as
+        winning potential, just like a row.
+        """
+        center_bonus, _, winning_potential = default_weights(3)
+        self.evaluator.place(0, 0, 1)
+        self.evaluator.place(1, 1, 1)
+        score_with_diagonal = self.evaluator.score(1)
+        self.assertGreaterEqual(score_with_diagonal, center_bonus + winning_potential)
+        self.evaluator.place(2, 2, 2)  # Block the diagonal
+        self.assertLess(self.evaluator.score(1), score_with_diagonal)
+
+    def test_full_window_is_a_win(self):
+        """
+        Test that a completed line scores at least WIN_SCORE.
+        """
+        for col in range(3):
+            self.evaluator.place(0, col, 2)
+        self.assertGreaterEqual(self.evaluator.score(2), WIN_SCORE)
+
+    def test_incremental_matches_rebuild(self):
+        """
+        Test that placing and removing marks one by one gives the same score as
+        rebuilding the evaluator from the grid, and that undoing everything
+        returns to an even score.
+        """
+        rng = np.random.default_rng(2)
+        for rows, cols, k in [(3, 3, 3), (5, 7, 4), (8, 6, 5)]:
+            evaluator = WindowEvaluator(rows, cols, k)
+            grid = np.zeros((rows, cols), dtype=int)
+            placed = []
+            for turn, cell in enumerate(rng.permutation(rows * cols)):
+                row, col = divmod(int(cell), cols)
+                grid[row, col] = turn % 2 + 1
+                evaluator.place(row, col, turn % 2 + 1)
+                placed.append((row, col, turn % 2 + 1))
+                rebuilt = WindowEvaluator(rows, cols, k).load(grid)
+                for player in (1, 2):
+                    self.assertAlmostEqual(
+                        evaluator.score(player), rebuilt.score(player)
+                    )
+                self.assertAlmostEqual(evaluator.score(1), -evaluator.score(2))
+            for row, col, mark in reversed(placed):
+                evaluator.remove(row, col, mark)
+            self.assertAlmostEqual(evaluator.score(1), 0)
+
+    def test_pattern_table(self):
+        """
+        Test the precomputed window scores and that the table is shared.
+        """
+        weights = default_weights(3)
+        table = pattern_table(3, weights)
+        self.assertEqual(len(table), 27)  # 3**k patterns
+        self.assertEqual(table[0], 0)  # Empty window
+        self.assertEqual(table[1 + 1 * 3], weights[2])  # Two marks of player 1
+        self.assertEqual(table[2 * 3 + 2 * 9], -weights[2])  # Two of player 2
+        self.assertEqual(table[1 + 2 * 3], 0)  # Blocked window
+        self.assertEqual(table[2 + 2 * 3 + 2 * 9], -WIN_SCORE)  # Full window
+        self.assertIs(pattern_table(3, weights), table)  # Cached
+        self.assertIs(WindowEvaluator(4, 5, 3).table, table)  # Reused
+
+    def test_evaluate_batch_matches_evaluator(self):
+        """
+        Test that batched scores equal the scalar evaluation for random
+        positions, both players, custom weights and small chunks.
+        """
+        rng = np.random.default_rng(0)
+        for rows, cols, k, weights in [
+            (3, 3, 3, None),
+            (4, 6, 3, (2.0, 0.5, 7.0)),
+            (7, 7, 5, None),
+        ]:
+            grids = rng.integers(0, 3, size=(50, rows, cols))
+            grids *= rng.random((50, rows, cols)) < 0.6  # Leave empty cells
+            players = rng.integers(1, 3, size=50)
+            batch = evaluate_batch(grids, k, players, weights, chunk_size=16)
+            self.assertEqual(batch.shape, (50,))
+            for grid, player, score in zip(grids, players, batch):
+                evaluator = WindowEvaluator(rows, cols, k, weights).load(grid)
+                self.assertAlmostEqual(score, evaluator.score(player))
+            np.testing.assert_allclose(
+                evaluate_batch(grids, k, 2, weights),
+                -evaluate_batch(grids, k, 1, weights),
+            )
+
+    def test_window_features_are_linear_in_weights(self):
+        """
+        Test that features @ weights reproduces the evaluation, including
+        positions with a full window.
+        """
+        rng = np.random.default_rng(1)
+        grids = rng.integers(0, 3, size=(40, 5, 6))
+        grids *= rng.random((40, 5, 6)) < 0.5
+        weights = (3.0, 1.5, -2.0, 9.0)
+        features = window_features(grids, 4, chunk_size=7)
+        self.assertEqual(features.shape, (40, 5))
+        self.assertTrue((features[:, 4] != 0).any())  # Some full windows
+        np.testing.assert_allclose(
+            features[:, :4] @ weights + WIN_SCORE * features[:, 4],
+            evaluate_batch(grids, 4, 1, weights),
+        )
+
+    def test_weight_profiles(self):
+        """
+        Test that saved profiles are loaded by configuration and that a
+        profile with the wrong number of weights is rejected.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(load_weight_profiles(directory), {})
+            save_weight_profile(
+                os.path.join(directory, "a.json"), 3, 3, 3, (1, 2, 3), scale=0.5
+            )
+            save_weight_profile(os.path.join(directory, "b.json"), 7, 7, 5, range(5))
+            self.assertEqual(
+                load_weight_profiles(directory),
+                {(3, 3, 3): (1.0, 2.0, 3.0), (7, 7, 5): (0.0, 1.0, 2.0, 3.0, 4.0)},
+            )
+            with self.assertRaises(ValueError):
+                save_weight_profile(os.path.join(directory, "c.json"), 3, 3, 3, (1, 2))
+        self.assertEqual(load_weight_profiles(os.path.join(directory, "gone")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
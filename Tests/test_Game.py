@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../"
 
 from Code.Game import Game  # Import the Game class
 from Code.Board import Board  # Import the Board class
+from Code.BitBoard import BitBoard  # Import the BitBoard class
 from Code.Player import Player  # Import the Player class
 from Code.MyBot import MyBot  # Import the MyBot class (AI Player)
 
@@ -50,6 +51,16 @@ class TestGame(unittest.TestCase):
             (self.game.board.grid == 0).all()
         )  # Check if board starts empty
 
+    def test_bitboard_backend(self):
+        """
+        Test if the game can be created on the bitboard backend.
+        """
+        game = Game(
+            self.rows, self.cols, self.k, self.player1, self.player2, "bitboard"
+        )
+        self.assertIsInstance(game.board, BitBoard)  # Bitmask board is used
+        self.assertTrue((game.board.grid == 0).all())  # Board starts empty
+
     def test_bot_move(self):
         """
         Test if a bot can successfully make a move.
@@ -111,6 +122,64 @@ class TestGame(unittest.TestCase):
         )  # Check if Player 1 is recognized as the winner
         self.assertFalse(self.game.board.has_won(2))  # Ensure Player 2 has not won
 
+    def test_play_headless(self):
+        """
+        Test that play returns a structured result without printing.
+        """
+        bot1 = MyBot("Bot 1", 1, 2)
+        bot2 = MyBot("Bot 2", 2, 1)
+        game = Game(self.rows, self.cols, self.k, bot1, bot2)
+        with patch("builtins.print") as mock_print:
+            result = game.play()
+        mock_print.assert_not_called()  # Nothing is rendered
+        self.assertEqual(len(result.moves), len(result.think_times))
+        self.assertTrue((result.grid == game.board.grid).all())
+        for index, (row, col, player) in enumerate(result.moves):
+            self.assertEqual(player, 1 if index % 2 == 0 else 2)  # Turns alternate
+            self.assertEqual(result.grid[row, col], player)
+        if result.winner is None:
+            self.assertEqual(len(result.moves), self.rows * self.cols)
+            self.assertEqual(result.winner_number, 0)
+        else:
+            row, col, player = result.moves[-1]
+            self.assertEqual(player, result.winner.number)
+            self.assertTrue(game.board.has_won(result.winner_number))
+
+    def test_play_collects_stats(self):
+        """
+        Test that play records the statistics of bot turns only and that
+        they aggregate per player.
+        """
+        bot = MyBot("Bot", 2, 3, time_limit=None, max_depth=2)
+        game = Game(self.rows, self.cols, self.k, self.player1, bot)
+        with patch.object(
+            self.player1, "make_move", side_effect=[(0, 0), (2, 2), (0, 2), (2, 0)]
+        ):
+            result = game.play()
+        self.assertEqual(len(result.stats), len(result.moves))
+        for (_, _, player), record in zip(result.moves, result.stats):
+            if player == 1:
+                self.assertIsNone(record)  # Human turn
+            else:
+                self.assertEqual(record["player"], 2)
+        profile = result.profile(2)
+        self.assertEqual(profile["moves"], len(result.moves) // 2)
+        self.assertEqual(result.profile(1)["moves"], 0)
+
+    @patch("builtins.input", side_effect=["1", "1", "2", "1", "3", "1"])
+    def test_game_loop_reports_winner(self, mock_input):
+        """
+        Test that the interactive loop announces the winner of the played game.
+        """
+        bot = MyBot("Bot", 2, 1)
+        game = Game(self.rows, self.cols, self.k, self.player1, bot)
+        with patch.object(bot, "make_move", side_effect=[(0, 1), (1, 1)]):
+            with patch("builtins.print") as mock_print:
+                result = game.game_loop()
+        self.assertIs(result.winner, self.player1)  # Alice fills the first column
+        self.assertEqual(len(result.moves), 5)
+        mock_print.assert_any_call("Alice wins!")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,169 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Game import Game  # Import the Game class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.GameRecords import (
+    GameRecordWriter,
+    GameRecords,
+    index_path,
+)  # Import the record format
+
+
+class TestGameRecords(unittest.TestCase):
+    """
+    Unit tests for the binary game records.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary record file path and a few random games.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.mnk")
+        rng = np.random.default_rng(0)
+        self.games = []
+        for _ in range(20):
+            cells = rng.permutation(25)[: rng.integers(0, 20)]
+            first = int(rng.integers(1, 3))
+            self.games.append(
+                [
+                    (
+                        int(cell) // 5,
+                        int(cell) % 5,
+                        first if ply % 2 == 0 else 3 - first,
+                    )
+                    for ply, cell in enumerate(cells)
+                ]
+            )
+        self.players = ({"name": "A", "mode": 2}, {"name": "B", "mode": 3})
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        self.directory.cleanup()
+
+    def write_games(self, games):
+        """
+        Appends games to the record file.
+
+        :param games: Lists of moves.
+        """
+        with GameRecordWriter(self.path) as writer:
+            for index, moves in enumerate(games):
+                writer.append(5, 5, 4, moves, index % 3, self.players)
+
+    def test_round_trip(self):
+        """
+        Test that every game is read back as written, in order and by index.
+        """
+        self.write_games(self.games)
+        records = GameRecords(self.path)
+        self.assertEqual(len(records), len(self.games))
+        for index, (record, moves) in enumerate(zip(records, self.games)):
+            self.assertEqual((record.rows, record.cols, record.k), (5, 5, 4))
+            self.assertEqual(record.result, index % 3)
+            self.assertEqual(record.players, self.players)
+            self.assertEqual(record.moves(), moves)
+        self.assertEqual(records[-1].moves(), self.games[-1])
+        self.assertEqual(
+            records.cells(3).tolist(), [r * 5 + c for r, c, _ in self.games[3]]
+        )
+        self.assertEqual(len(records.configs), 2)  # Each configuration stored once
+
+    def test_append_to_existing_file(self):
+        """
+        Test that reopening a file appends and reuses the stored configurations.
+        """
+        self.write_games(self.games[:10])
+        self.write_games(self.games[10:])
+        records = GameRecords(self.path)
+        self.assertEqual(len(records), len(self.games))
+        self.assertEqual(len(records.configs), 2)
+        self.assertEqual(records[15].moves(), self.games[15])
+
+    def test_index_is_rebuilt(self):
+        """
+        Test that a missing or stale index is rebuilt in memory, leaving the
+        files to the writer, which restores the index when it reopens them.
+        """
+        self.write_games(self.games)
+        os.remove(index_path(self.path))
+        self.assertEqual(GameRecords(self.path)[7].moves(), self.games[7])
+        self.assertFalse(os.path.exists(index_path(self.path)))
+        self.write_games([])
+        with open(index_path(self.path), "r+b") as file:
+            file.truncate(16)  # Only the first two entries are left
+        records = GameRecords(self.path)
+        self.assertEqual(len(records), len(self.games))
+        self.assertEqual(os.path.getsize(index_path(self.path)), 16)
+
+    def test_truncated_tail_is_ignored(self):
+        """
+        Test that a record cut short is left out by the reader, even when
+        the index already lists it, and dropped by the next writer.
+        """
+        self.write_games(self.games[:5])
+        size = os.path.getsize(self.path)
+        with open(self.path, "ab") as file:
+            file.write(bytes([1, 5, 5, 4, 1, 0, 0, 0, 0, 0, 3, 0, 6]))
+        with open(index_path(self.path), "ab") as file:
+            file.write(size.to_bytes(8, "little"))
+        records = GameRecords(self.path)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records.end, size)
+        del records
+        self.write_games(self.games[5:])
+        self.assertEqual(
+            [record.moves() for record in GameRecords(self.path)], self.games
+        )
+
+    def test_rejects_values_too_large(self):
+        """
+        Test that values which do not fit the record format raise a ValueError
+        before anything is written.
+        """
+        with GameRecordWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(256, 5, 4, [], 0, self.players)
+            with self.assertRaises(ValueError):
+                writer.append(5, 5, 4, [(0, 0, 1)] * 65536, 0, self.players)
+            with self.assertRaises(ValueError):
+                writer.append(5, 5, 4, [], 0, ({"name": "x" * 65536}, None))
+        self.assertEqual(len(GameRecords(self.path)), 0)
+
+    def test_game_records_itself(self):
+        """
+        Test that Game.play appends the finished game to a recorder.
+        """
+        bot1 = MyBot("Bot 1", 1, 2)
+        bot2 = MyBot("Bot 2", 2, 1)
+        game = Game(3, 3, 3, bot1, bot2)
+        with GameRecordWriter(self.path) as writer:
+            result = game.play(recorder=writer)
+        record = GameRecords(self.path)[0]
+        self.assertEqual(record.moves(), result.moves)
+        self.assertEqual(record.result, result.winner_number)
+        self.assertEqual(
+            record.players[1], {"type": "MyBot", "name": "Bot 2", "mode": 1}
+        )
+
+    def test_rejects_other_files(self):
+        """
+        Test that a file without the record header is refused.
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a record file")
+        with self.assertRaises(ValueError):
+            GameRecords(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
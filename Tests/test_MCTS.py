@@ -0,0 +1,88 @@
+import sys
+import os
+import unittest
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MCTS import MCTS  # Import the Monte Carlo Tree Search
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+
+
+class TestMCTS(unittest.TestCase):
+    """
+    Unit tests for the Monte Carlo Tree Search.
+    """
+
+    def setUp(self):
+        """
+        Set up a 3x3 board with k=3 for each test.
+        """
+        self.board = Board(3, 3, 3)
+
+    def test_finds_winning_move(self):
+        """
+        Test that the search completes its own line.
+        """
+        for row, col, mark in [(0, 0, 1), (1, 0, 2), (0, 1, 1), (1, 1, 2)]:
+            self.board.make_move(row, col, mark)
+        move = MCTS(seed=0).search(self.board, 1, iterations=300)
+        self.assertEqual(move, (0, 2))
+
+    def test_blocks_opponent(self):
+        """
+        Test that the search blocks the opponent's open line.
+        """
+        for row, col, mark in [(0, 0, 2), (2, 2, 1), (0, 1, 2)]:
+            self.board.make_move(row, col, mark)
+        move = MCTS(seed=0).search(self.board, 1, iterations=300)
+        self.assertEqual(move, (0, 2))
+
+    def test_board_is_restored(self):
+        """
+        Test that the search leaves the board and its hash unchanged.
+        """
+        self.board.make_move(1, 1, 1)
+        grid, board_hash = self.board.grid.copy(), self.board.hash
+        MCTS(seed=0).search(self.board, 2, iterations=50)
+        self.assertTrue((self.board.grid == grid).all())
+        self.assertEqual(self.board.hash, board_hash)
+
+    def test_iteration_limit(self):
+        """
+        Test that the search stops after the requested number of iterations.
+        """
+        search = MCTS(rollout_batch=8, seed=0)
+        search.search(self.board, 1, iterations=40)
+        self.assertEqual(search.iterations, 40)
+        self.assertEqual(search.root.visits, 40 * 8)
+
+    def test_tree_is_reused(self):
+        """
+        Test that the subtree of the position reached is kept for the next move.
+        """
+        search = MCTS(seed=0)
+        move = search.search(self.board, 1, iterations=200)
+        self.board.make_move(*move, 1)
+        reply = next(cell for cell in self.board.available_moves() if cell != move)
+        expected = search.root.children[move].children.get(reply)
+        self.board.make_move(*reply, 2)
+        visits = 0 if expected is None else expected.visits
+        search.search(self.board, 1, iterations=10)
+        if expected is not None:
+            self.assertIs(search.root, expected)
+        self.assertEqual(search.root.visits, visits + 10 * search.rollout_batch)
+
+    def test_bot_mode_4(self):
+        """
+        Test that MyBot plays a legal move in mode 4.
+        """
+        bot = MyBot("Bot", 2, 4, mcts_iterations=50)
+        self.board.make_move(1, 1, 1)
+        row, col = bot.make_move(2, self.board, 4)
+        self.assertTrue(self.board.is_valid_move(row, col))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import sys
 import os
+import tempfile
+import time
 import unittest
 import numpy as np
 
@@ -7,6 +9,7 @@ import numpy as np
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 from Code.Board import Board  # Import Board class
+from Code.Evaluator import save_weight_profile  # Import the profile writer
 from Code.MyBot import MyBot  # Import MyBot class (AI player)
 from Code.Player import Player  # Import Player class
 
@@ -102,6 +105,130 @@ class TestMyBot(unittest.TestCase):
         move = self.bot.make_move(1, self.board, mode=3)  # Minimax mode
         self.assertEqual(move, (2, 2))  # Bot should block at (2,2)
 
+    def test_transposition_table_is_used(self):
+        """
+        Test that the Minimax search fills and reuses the transposition table
+        and leaves the board unchanged.
+        """
+        self.board.make_move(0, 0, 2)
+        board_hash = self.board.hash
+        self.bot.make_move(1, self.board, mode=3)
+        table = self.bot.transposition_table
+        self.assertGreater(len(table), 0)  # Positions were stored
+        self.assertGreater(table.hits, 0)  # Transpositions were found
+        self.assertEqual(self.board.hash, board_hash)  # All moves were undone
+
+    def test_time_budget(self):
+        """
+        Test that iterative deepening answers within its time budget on a board
+        that is far too large to search completely.
+        """
+        board = Board(10, 10, 5)
+        board.make_move(4, 4, 2)
+        bot = MyBot("Bot", 1, 3, time_limit=0.2)
+        start = time.perf_counter()
+        move = bot.make_move(1, board, mode=3)
+        self.assertLess(time.perf_counter() - start, 1.0)  # Generous margin
+        self.assertTrue(board.is_valid_move(*move))
+        self.assertGreaterEqual(bot.completed_depth, 1)
+        self.assertLess(bot.completed_depth, 99)  # The search was cut off
+
+    def test_node_budget(self):
+        """
+        Test that a node budget limits the search and still yields a move.
+        """
+        board = Board(5, 5, 4)
+        bot = MyBot("Bot", 1, 3, time_limit=None, node_limit=500)
+        move = bot.make_move(1, board, mode=3)
+        self.assertTrue(board.is_valid_move(*move))
+        self.assertLessEqual(bot.nodes, 500)
+
+    def test_max_depth(self):
+        """
+        Test that the deepening stops at the configured maximum depth.
+        """
+        bot = MyBot("Bot", 1, 3, time_limit=None, max_depth=2)
+        bot.make_move(1, self.board, mode=3)
+        self.assertEqual(bot.completed_depth, 2)
+
+    def test_move_ordering_saves_nodes(self):
+        """
+        Test that killer/history move ordering does not search more nodes than
+        plain ordering for the same fixed-depth search.
+        """
+        nodes = []
+        for move_ordering in (False, True):
+            board = Board(4, 4, 3)
+            board.make_move(1, 1, 2)
+            bot = MyBot(
+                "Bot", 1, 3, time_limit=None, max_depth=5, move_ordering=move_ordering
+            )
+            bot.make_move(1, board, mode=3)
+            nodes.append(bot.nodes)
+        self.assertLessEqual(nodes[1], nodes[0])
+
+    def test_neighbourhood_filter(self):
+        """
+        Test that with a neighbourhood filter the bot only plays next to
+        existing marks.
+        """
+        board = Board(9, 9, 4)
+        board.make_move(0, 0, 2)
+        bot = MyBot("Bot", 1, 3, time_limit=None, max_depth=2, neighbourhood=1)
+        self.assertEqual(
+            bot.nearby_moves(board, board.available_moves()), [(0, 1), (1, 0), (1, 1)]
+        )
+        row, col = bot.make_move(1, board, mode=3)
+        self.assertLessEqual(max(row, col), 1)  # Within one cell of (0, 0)
+
+    def test_symmetry_shares_search_results(self):
+        """
+        Test that sharing results between symmetric positions searches fewer
+        nodes on the empty board and keeps the value of the chosen move.
+        """
+        results = {}
+        for symmetry in (False, True):
+            board = Board(5, 5, 4)
+            bot = MyBot("Bot", 1, 3, time_limit=None, max_depth=3, symmetry=symmetry)
+            move = bot.make_move(1, board, mode=3)
+            nodes = bot.nodes
+            bot.prepare_search(board)
+            board.make_move(*move, 1)
+            bot.evaluator.place(*move, 1)
+            value, _ = bot.minimax(board, 1, False, -np.inf, np.inf, 2)
+            results[symmetry] = nodes, value
+        self.assertLess(results[True][0], results[False][0] / 2)
+        self.assertEqual(results[True][1], results[False][1])
+
+    def test_evaluate_board_scores_diagonals(self):
+        """
+        Test that the evaluation rewards a diagonal threat of the bot and
+        penalizes the same threat of the opponent.
+        """
+        self.board.make_move(0, 0, 1)
+        self.board.make_move(2, 2, 1)
+        self.assertGreater(self.bot.evaluate_board(self.board, 1), 0)
+        self.assertLess(self.bot.evaluate_board(self.board, 2), 0)
+
+    def test_weight_profiles(self):
+        """
+        Test that the bot evaluates with the profile of the board's
+        configuration, and that explicit weights take precedence.
+        """
+        self.board.make_move(1, 1, 1)  # Only the center bonus counts
+        with tempfile.TemporaryDirectory() as directory:
+            save_weight_profile(
+                os.path.join(directory, "weights_3x3x3.json"), 3, 3, 3, (7, 0, 0)
+            )
+            bot = MyBot("Bot", 1, 3, weight_profiles=directory)
+            explicit = MyBot("Bot", 1, 3, weights=(2, 0, 0), weight_profiles=directory)
+        self.assertEqual(bot.evaluate_board(self.board, 1), 7)
+        self.assertEqual(explicit.evaluate_board(self.board, 1), 2)
+        self.assertEqual(bot.evaluate_boards(self.board.grid[None], 3, 2)[0], -7)
+        self.assertIsNone(bot.board_weights(7, 7, 5))  # No profile: defaults
+        missing = MyBot("Bot", 1, 3, weight_profiles=os.path.join(directory, "gone"))
+        self.assertEqual(missing.weight_profiles, {})  # Missing directory: defaults
+
 
 if __name__ == "__main__":
     unittest.main()
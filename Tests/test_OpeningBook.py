@@ -0,0 +1,101 @@
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.OpeningBook import (
+    OpeningBook,
+    build_book,
+    write_book,
+)  # Import the opening book
+
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    Unit tests for building and reading opening books.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build a small 3x3 book once for all tests.
+        """
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "book.bin")
+        cls.options = {"time_limit": None, "max_depth": 3}
+        cls.entries = build_book(3, 3, 3, 3, cls.options, progress=False)
+        write_book(cls.path, 3, 3, 3, 3, cls.entries)
+        cls.book = OpeningBook(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the book file.
+        """
+        del cls.book  # Release the memory maps before deleting the file
+        cls.directory.cleanup()
+
+    def test_file_is_sorted(self):
+        """
+        Test that the keys on disk are sorted and complete.
+        """
+        self.assertEqual(len(self.book), len(self.entries))
+        self.assertTrue(np.all(np.diff(self.book.keys.astype(np.float64)) > 0))
+        self.assertEqual((self.book.rows, self.book.cols, self.book.k), (3, 3, 3))
+
+    def test_symmetric_positions_deduplicated(self):
+        """
+        Test that the 3x3 book stores one entry per position up to symmetry:
+        the empty board, 3 first moves and 12 replies.
+        """
+        self.assertEqual(len(self.book), 1 + 3 + 12)
+
+    def test_lookup_matches_search(self):
+        """
+        Test that the book move equals the searched move, also in rotated and
+        mirrored positions.
+        """
+        for row, col in [(0, 0), (0, 2), (2, 2), (1, 0), (1, 2)]:
+            board = Board(3, 3, 3)
+            board.push(row, col, 1)
+            move = self.book.lookup(board)
+            self.assertTrue(board.is_valid_move(*move))
+            bot = MyBot("Bot", 2, 3, symmetry=False, **self.options)
+            searched = bot.make_move(2, board, 3)
+            board.push(*move, 2)
+            book_value = bot.evaluate_board(board, 2)
+            board.pop()
+            board.push(*searched, 2)
+            self.assertEqual(bot.evaluate_board(board, 2), book_value)
+
+    def test_unknown_position(self):
+        """
+        Test that positions outside the book are not found.
+        """
+        board = Board(3, 3, 3)
+        for row, col, player in [(0, 0, 1), (1, 1, 2), (2, 2, 1)]:
+            board.push(row, col, player)
+        self.assertIsNone(self.book.lookup(board))  # Deeper than 3 plies
+        self.assertIsNone(self.book.lookup(Board(4, 4, 3)))  # Other configuration
+
+    def test_bot_plays_from_book(self):
+        """
+        Test that mode 3 plays the book move without searching.
+        """
+        bot = MyBot("Bot", 1, 3, opening_book=self.path)
+        board = Board(3, 3, 3)
+        with patch.object(bot, "iterative_deepening") as search:
+            move = bot.make_move(1, board, 3)
+        search.assert_not_called()
+        self.assertEqual(move, self.book.lookup(board))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import os
+import time
+import unittest
+import multiprocessing
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code import ParallelSearch  # Import the worker state
+from Code.ParallelSearch import (
+    _init_worker,
+    _search_root_move,
+    rank_results,
+)  # Import the worker task and the root move ranking
+
+
+class TestParallelSearch(unittest.TestCase):
+    """
+    Unit tests for the root-splitting parallel search.
+    """
+
+    def setUp(self):
+        """
+        Set up a 4x4 board with 3 in a row to win and a few marks placed.
+        """
+        self.board = Board(4, 4, 3)
+        for row, col, player in [(1, 1, 1), (0, 0, 2), (2, 1, 2), (3, 3, 2)]:
+            self.board.make_move(row, col, player)
+
+    def root_values(self, depth):
+        """
+        Scores every root move with the sequential search.
+
+        :param depth: Search depth including the root move.
+        :return: Dict mapping each move to its score for player 1.
+        """
+        bot = MyBot("Sequential", 1, 3, time_limit=None)
+        values = {}
+        for row, col in self.board.available_moves():
+            self.board.make_move(row, col, 1)
+            bot.prepare_search(self.board)
+            values[row, col], _ = bot.minimax(
+                self.board, 1, False, -np.inf, np.inf, depth - 1
+            )
+            self.board.undo_move(row, col)
+        return values
+
+    def test_parallel_move_is_best(self):
+        """
+        Test that the parallel search with two workers picks a move with the
+        best sequential score, and leaves the board unchanged.
+        """
+        bot = MyBot("Parallel", 1, 3, time_limit=None, max_depth=3, workers=2)
+        try:
+            move = bot.make_move(1, self.board, mode=3)
+        finally:
+            bot.close()
+        values = self.root_values(bot.completed_depth)
+        self.assertEqual(values[move], max(values.values()))
+        self.assertEqual(bot.completed_depth, 3)
+        self.assertGreater(bot.nodes, 0)
+        self.assertEqual(len(self.board.available_moves()), 12)
+
+    def test_root_move_bounds(self):
+        """
+        Test the worker task in this process:
+        - A move searched against a higher shared alpha fails low.
+        - A full-window search ignores the shared alpha and is exact.
+        - A task whose deadline has passed returns without searching.
+        """
+        shared_alpha = multiprocessing.Value("d", 1e9)
+        _init_worker({"time_limit": None}, shared_alpha)
+        grid = np.array(self.board.grid)
+        task = [Board, grid, 3, 1, (0, 1), 3, None, False]
+        move, value, nodes, fail_low = _search_root_move(tuple(task))
+        self.assertTrue(fail_low)
+        task[7] = True
+        move, value, nodes, fail_low = _search_root_move(tuple(task))
+        self.assertFalse(fail_low)
+        self.assertEqual(value, self.root_values(3)[0, 1])
+        task[6] = time.monotonic() - 1
+        self.assertEqual(_search_root_move(tuple(task)), ((0, 1), None, 0, False))
+
+    def test_worker_new_search(self):
+        """
+        Test that a worker ages its table, clears its killers and halves its
+        history once per root position, not once per task.
+        """
+        _init_worker({"time_limit": None}, multiprocessing.Value("d", -1e9))
+        bot = ParallelSearch._worker["bot"]
+        grid = np.array(self.board.grid)
+        task = (Board, grid, 3, 1, (0, 1), 2, None, True)
+        _search_root_move(task)
+        generation = bot.transposition_table.generation
+        bot.killers = {0: [(0, 1)]}
+        bot.history = {(1, (0, 1)): 8}
+        _search_root_move(task[:4] + ((0, 2),) + task[5:])
+        self.assertEqual(bot.transposition_table.generation, generation)
+        self.assertEqual(bot.history[1, (0, 1)], 8)
+
+        self.board.make_move(0, 1, 1)
+        self.board.make_move(0, 2, 2)
+        grid = np.array(self.board.grid)
+        bot.killers = {0: [(0, 1)]}
+        bot.history = {(1, (0, 1)): 8}
+        _search_root_move((Board, grid, 3, 1, (3, 0), 1, None, True))
+        self.assertEqual(bot.transposition_table.generation, generation + 1)
+        self.assertNotIn((0, 1), bot.killers.get(0, []))
+        self.assertEqual(bot.history[1, (0, 1)], 4)
+
+    def test_rank_results(self):
+        """
+        Test that a fail-low bound never ranks above an equal or lower exact
+        score, and that equal exact scores keep the move order.
+        """
+        results = [
+            ((0, 0), 5.0, 1, True),
+            ((0, 1), 5.0, 1, False),
+            ((0, 2), 3.0, 1, False),
+            ((0, 3), 5.0, 1, False),
+        ]
+        self.assertEqual(rank_results(results), [1, 3, 2, 0])
+
+    def test_time_limit(self):
+        """
+        Test that a parallel move on a large board stays within its time limit.
+        """
+        board = Board(10, 10, 5)
+        board.make_move(5, 5, 2)
+        bot = MyBot("Parallel", 1, 3, time_limit=0.3, workers=2, threat_nodes=0)
+        try:
+            bot.make_move(1, board, mode=3)  # Starts the pool
+            start = time.perf_counter()
+            bot.make_move(1, board, mode=3)
+            elapsed = time.perf_counter() - start
+        finally:
+            bot.close()
+        self.assertLess(elapsed, 0.3 + 0.1)
+        self.assertGreaterEqual(bot.completed_depth, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
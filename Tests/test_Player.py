@@ -41,7 +41,7 @@ class TestPlayer(unittest.TestCase):
         """
         Test if a valid move is accepted and returned correctly.
         """
-        self.board.grid[1, 1] = 0  # Ensure the position is free
+        self.assertTrue(self.board.is_valid_move(1, 1))  # The position is free
         row, col = self.player.make_move(self.player.number, self.board)
         self.assertEqual(
             (row, col), (1, 1)
@@ -62,7 +62,7 @@ class TestPlayer(unittest.TestCase):
         """
         Test if an occupied position is rejected and a valid move is eventually accepted.
         """
-        self.board.grid[1, 1] = 2  # Position already occupied by another player
+        self.board.make_move(1, 1, 2)  # Position already occupied by another player
         row, col = self.player.make_move(self.player.number, self.board)
         self.assertEqual((row, col), (0, 0))  # Should retry and pick a valid move
 
@@ -0,0 +1,96 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.BitBoard import BitBoard  # Import the bitmask board
+from Code.ProofSearch import ProofNumberSearch  # Import the solver
+from Code.Tablebase import (
+    LOSS,
+    DRAW,
+    WIN,
+    Tablebase,
+    generate,
+    write_tablebase,
+)  # Import the tablebase as reference
+
+
+class TestProofSearch(unittest.TestCase):
+    """
+    Unit tests for the proof-number search solver.
+    """
+
+    def setUp(self):
+        """
+        Set up a solver with the default limits.
+        """
+        self.solver = ProofNumberSearch()
+
+    def test_empty_boards(self):
+        """
+        Test the known values of small empty boards:
+        - 3x3 (k=3) is a draw.
+        - 4x4 (k=3) is a first-player win.
+        """
+        result = self.solver.solve(Board(3, 3, 3), 1)
+        self.assertEqual(result.value, DRAW)
+        self.assertIsNotNone(result.move)
+
+        board = BitBoard(4, 4, 3)
+        result = self.solver.solve(board, 1)
+        self.assertEqual(result.value, WIN)
+        board.push(*result.move, 1)
+        self.assertEqual(self.solver.solve(board, 2).value, LOSS)
+
+    def test_board_is_unchanged(self):
+        """
+        Test that solving leaves the board, its hash and move stack as they were.
+        """
+        board = Board(4, 4, 3)
+        board.push(1, 1, 1)
+        grid, key = board.grid.copy(), board.hash
+        self.assertEqual(self.solver.solve(board, 2).value, LOSS)
+        self.assertTrue(np.array_equal(board.grid, grid))
+        self.assertEqual(board.hash, key)
+        self.assertEqual(board.move_stack, [(1, 1, 1)])
+
+    def test_matches_tablebase(self):
+        """
+        Test that the solver agrees with the 3x4 (k=3) tablebase on random
+        positions, for both board backends.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tb.bin")
+            write_tablebase(path, 3, 4, 3, *generate(3, 4, 3, False))
+            tablebase = Tablebase(path)
+            rng = np.random.default_rng(0)
+            for trial in range(20):
+                board = (Board if trial % 2 else BitBoard)(3, 4, 3)
+                player = 1
+                for cell in rng.permutation(12)[: rng.integers(1, 6)]:
+                    row, col = divmod(int(cell), 4)
+                    if board.would_win(row, col, player):
+                        break
+                    board.push(row, col, player)
+                    player = 3 - player
+                value, _ = tablebase.probe(board)
+                self.assertEqual(self.solver.solve(board, player).value, value)
+            del tablebase  # Release the mapping before the directory is removed
+
+    def test_node_limit(self):
+        """
+        Test that an exhausted node budget gives an unsolved result.
+        """
+        result = ProofNumberSearch(node_limit=50).solve(BitBoard(4, 4, 4), 1)
+        self.assertFalse(result.solved)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.nodes, 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.SearchStats import (
+    SearchStats,
+    aggregate,
+    read_trace,
+)  # Import the instrumentation
+
+
+class TestSearchStats(unittest.TestCase):
+    """
+    Unit tests for the search statistics and the trace file.
+    """
+
+    def test_record_cutoff(self):
+        """
+        Test that cutoffs are counted per move index.
+        """
+        stats = SearchStats(1, 3)
+        stats.record_cutoff(0)
+        stats.record_cutoff(2)
+        stats.record_cutoff(0)
+        self.assertEqual(stats.cutoffs, [2, 0, 1])
+
+    def test_mode3_move_statistics(self):
+        """
+        Test that a mode 3 search fills in every counter consistently.
+        """
+        board = Board(4, 4, 3)
+        board.make_move(1, 1, 2)
+        bot = MyBot("Bot", 1, 3, time_limit=None, max_depth=3)
+        move = bot.make_move(1, board, 3)
+        stats = bot.stats
+        self.assertEqual(stats.source, "search")
+        self.assertEqual(stats.move, move)
+        self.assertEqual(stats.depth, 3)
+        self.assertEqual(stats.nodes, bot.nodes)
+        self.assertGreater(stats.evaluations, 0)
+        self.assertLessEqual(stats.evaluations, stats.nodes)
+        self.assertGreater(stats.win_checks, 0)
+        self.assertGreater(sum(stats.cutoffs), 0)
+        self.assertGreater(stats.tt_lookups, 0)
+        self.assertLessEqual(stats.tt_hits, stats.tt_lookups)
+        self.assertGreater(stats.elapsed, 0)
+
+    def test_sources(self):
+        """
+        Test that moves that need no search are labelled by their source.
+        """
+        board = Board(3, 3, 3)
+        board.make_move(0, 0, 1)
+        board.make_move(0, 1, 1)
+        bot = MyBot("Bot", 2, 3)
+        self.assertEqual(bot.make_move(2, board, 3), (0, 2))
+        self.assertEqual(bot.stats.source, "rule")
+        self.assertEqual(bot.stats.nodes, 0)
+        bot.make_move(2, Board(3, 3, 3), 1)
+        self.assertEqual(bot.stats.source, "random")
+
+    def test_trace_and_aggregate(self):
+        """
+        Test that a traced bot writes one JSON line per move and that the
+        lines aggregate into a profile.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.jsonl")
+            bot = MyBot("Tracer", 1, 3, time_limit=None, max_depth=2, trace=path)
+            board = Board(4, 4, 3)
+            for row, col in [(0, 0), (3, 3)]:
+                board.make_move(row, col, 2)
+                board.make_move(*bot.make_move(1, board, 3), 1)
+            bot.close()
+            records = read_trace(path)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["name"], "Tracer")
+        profile = aggregate(records + [None])
+        self.assertEqual(profile["moves"], 2)
+        self.assertEqual(profile["nodes"], sum(r["nodes"] for r in records))
+        self.assertEqual(sum(profile["sources"].values()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board, batch_winner  # Import the board and batch win check
+from Code.Evaluator import window_layout  # Import the k-window enumeration
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.SelfPlay import self_play, tactical_moves  # Import the batch engine
+
+
+class TestSelfPlay(unittest.TestCase):
+    """
+    Unit tests for the batched self-play engine.
+    """
+
+    def test_results_are_consistent(self):
+        """
+        Test that winners, game lengths and final boards agree with each other.
+        """
+        result = self_play(4, 4, 3, 500, mode1=1, mode2=2, seed=0)
+        self.assertTrue(np.array_equal(result.winners, batch_winner(result.grids, 3)))
+        self.assertTrue(
+            np.array_equal(result.lengths, np.count_nonzero(result.grids, axis=(1, 2)))
+        )
+        marks1 = np.count_nonzero(result.grids == 1, axis=(1, 2))
+        marks2 = np.count_nonzero(result.grids == 2, axis=(1, 2))
+        self.assertTrue(np.all((marks1 - marks2 == 0) | (marks1 - marks2 == 1)))
+        summary = result.summary()
+        self.assertEqual(
+            summary["wins"] + summary["draws"] + summary["losses"], summary["games"]
+        )
+
+    def test_random_tic_tac_toe_statistics(self):
+        """
+        Test that random 3x3 play matches the known outcome rates
+        (about 58.5% first player wins, 12.7% draws, 28.8% losses).
+        """
+        summary = self_play(3, 3, 3, 20000, seed=1).summary()
+        self.assertAlmostEqual(summary["wins"] / 20000, 0.585, delta=0.02)
+        self.assertAlmostEqual(summary["draws"] / 20000, 0.127, delta=0.02)
+
+    def test_tactical_moves_match_bot(self):
+        """
+        Test that the vectorized mode 2 policy wins and blocks like MyBot.
+        """
+        board = Board(3, 3, 3)
+        for row, col, player in [(0, 0, 2), (0, 1, 2), (1, 0, 1), (1, 1, 1)]:
+            board.make_move(row, col, player)
+        windows = np.array(window_layout(3, 3, 3)[0])
+        grids = board.grid.reshape(1, 9).astype(np.int8)
+        rng = np.random.default_rng(0)
+        bot = MyBot("Bot", 1, 2)
+        for mark in (1, 2):
+            move = tactical_moves(grids, mark, windows, rng)[0]
+            self.assertEqual(divmod(int(move), 3), bot.make_move(mark, board, 2))
+
+    def test_unsupported_mode(self):
+        """
+        Test that modes without a vectorized policy are rejected.
+        """
+        with self.assertRaises(ValueError):
+            self_play(3, 3, 3, 10, mode1=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
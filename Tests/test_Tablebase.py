@@ -0,0 +1,141 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.Tablebase import (
+    LOSS,
+    DRAW,
+    WIN,
+    Tablebase,
+    generate,
+    write_tablebase,
+)  # Import the tablebase
+
+
+class TestTablebase(unittest.TestCase):
+    """
+    Unit tests for the retrograde tablebases.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Solve 3x3 (k=3) and 3x4 (k=3) once for all tests.
+        """
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.paths = {}
+        for rows, cols in [(3, 3), (3, 4)]:
+            path = os.path.join(cls.directory.name, f"tb_{rows}x{cols}.bin")
+            write_tablebase(path, rows, cols, 3, *generate(rows, cols, 3, False))
+            cls.paths[rows, cols] = path
+        cls.tablebase = Tablebase(cls.paths[3, 3])
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the tablebase files.
+        """
+        del cls.tablebase  # Release the memory maps before deleting the files
+        cls.directory.cleanup()
+
+    def test_known_results(self):
+        """
+        Test the known results: tic-tac-toe has 765 positions up to symmetry
+        and is a draw, 3x4 with k=3 is a first-player win.
+        """
+        self.assertEqual(len(self.tablebase), 765)
+        self.assertEqual(self.tablebase.probe(Board(3, 3, 3)), (DRAW, 9))
+        value, _ = Tablebase(self.paths[3, 4]).probe(Board(3, 4, 3))
+        self.assertEqual(value, WIN)
+
+    def test_probe_positions(self):
+        """
+        Test single positions with their distances.
+        """
+        board = Board(3, 3, 3)
+        for row, col, player in [(0, 0, 1), (1, 0, 2), (0, 1, 1), (1, 1, 2)]:
+            board.push(row, col, player)
+        self.assertEqual(self.tablebase.probe(board), (WIN, 1))  # (0, 2) wins
+        board.push(2, 2, 1)  # Player 1 misses the win
+        self.assertEqual(self.tablebase.probe(board), (WIN, 1))  # (1, 2) wins
+        board.push(1, 2, 2)
+        self.assertEqual(self.tablebase.probe(board), (LOSS, 0))  # Game over
+
+        board = Board(3, 3, 3)
+        board.push(1, 1, 2)  # Player 2 cannot move first
+        self.assertIsNone(self.tablebase.probe(board))
+
+    def test_agrees_with_exhaustive_search(self):
+        """
+        Test the stored values against a plain Minimax on random positions.
+        """
+
+        def solve(board, player):
+            result = DRAW if not board.available_moves() else LOSS
+            for row, col in board.available_moves():
+                board.push(row, col, player)
+                if board.has_won_at(row, col, player):
+                    value = WIN
+                else:
+                    value = 2 - solve(board, 3 - player)  # Swap WIN and LOSS
+                board.pop()
+                result = max(result, value)
+            return result
+
+        rng = np.random.default_rng(0)
+        for _ in range(30):
+            board = Board(3, 3, 3)
+            player = 1
+            for _ in range(int(rng.integers(2, 6))):
+                moves = board.available_moves()
+                row, col = moves[rng.integers(len(moves))]
+                board.push(row, col, player)
+                if board.has_won_at(row, col, player):
+                    board.pop()
+                    break
+                player = 3 - player
+            value, _ = self.tablebase.probe(board)
+            self.assertEqual(value, solve(board, player))
+
+    def test_bot_plays_perfectly(self):
+        """
+        Test that two tablebase bots draw and that a tablebase bot never loses
+        against random moves.
+        """
+        rng = np.random.default_rng(1)
+        for game in range(10):
+            perfect = {1: game < 5 or game % 2 == 0, 2: game < 5 or game % 2 == 1}
+            bots = {
+                number: MyBot(
+                    "Bot", number, 3, tablebase=self.paths[3, 3], time_limit=0.01
+                )
+                for number in (1, 2)
+            }
+            board = Board(3, 3, 3)
+            winner = 0
+            for turn in range(9):
+                player = turn % 2 + 1
+                if perfect[player]:
+                    move = bots[player].tablebase_move(board, player)
+                else:
+                    moves = board.available_moves()
+                    move = moves[rng.integers(len(moves))]
+                board.push(*move, player)
+                if board.has_won_at(*move, player):
+                    winner = player
+                    break
+            if game < 5:
+                self.assertEqual(winner, 0)  # Perfect play is a draw
+            else:
+                self.assertTrue(winner == 0 or perfect[winner])
+
+
+if __name__ == "__main__":
+    unittest.main()
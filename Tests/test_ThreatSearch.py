@@ -0,0 +1,149 @@
+import sys
+import os
+import time
+import unittest
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Board import Board  # Import Board class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.ThreatSearch import ThreatSearch  # Import the threat-space search
+
+
+class TestThreatSearch(unittest.TestCase):
+    """
+    Unit tests for the threat-space search.
+    """
+
+    def setUp(self):
+        """
+        Empty 15x15 gomoku board (k=5).
+        """
+        self.board = Board(15, 15, 5)
+
+    def place(self, marks):
+        """
+        Puts marks on the board.
+
+        :param marks: Dict mapping player numbers to lists of (row, col).
+        """
+        for player, cells in marks.items():
+            for row, col in cells:
+                self.board.make_move(row, col, player)
+
+    def test_vcf_is_a_forced_win(self):
+        """
+        Test that a VCF is found and wins against the forced blocks.
+        """
+        # Two blocked threes, on row 7 and column 8: neither is an open
+        # threat, but fours on them lead to a double four
+        self.place(
+            {
+                1: [(7, 5), (7, 6), (7, 7), (3, 8), (4, 8), (5, 8)],
+                2: [(7, 4), (2, 8), (0, 0), (14, 14), (0, 14), (14, 0)],
+            }
+        )
+        search = ThreatSearch(self.board)
+        move = search.find_win(1, vct=False)
+        self.assertIsNotNone(move)
+
+        # Play the line out: the defender always blocks the four
+        for _ in range(10):
+            self.board.make_move(*move, 1)
+            if self.board.has_won_at(*move, 1):
+                break
+            search = ThreatSearch(self.board)
+            blocks = sorted(search.winning_cells(1))
+            self.assertTrue(blocks)  # Every attacking move is a four
+            self.board.make_move(*divmod(blocks[0], 15), 2)
+            move = ThreatSearch(self.board).find_win(1, vct=False)
+            self.assertIsNotNone(move)
+        self.assertTrue(self.board.has_won(1))
+
+    def test_vct_finds_double_three(self):
+        """
+        Test that a double three is found by VCT but not by VCF.
+        """
+        self.place(
+            {
+                1: [(7, 5), (7, 6), (5, 7), (6, 7)],
+                2: [(3, 3), (11, 11), (3, 11), (11, 3)],
+            }
+        )
+        search = ThreatSearch(self.board)
+        self.assertIsNone(search.find_win(1, vct=False))
+        self.assertEqual(search.find_win(1, vct=True), (7, 7))
+
+    def test_no_win_on_quiet_board(self):
+        """
+        Test that scattered marks give no forced win and the node budget holds.
+        """
+        self.place({1: [(7, 7), (2, 12)], 2: [(7, 8), (12, 2)]})
+        search = ThreatSearch(self.board, node_limit=500)
+        self.assertIsNone(search.find_win(1, vct=True))
+        self.assertLessEqual(search.nodes, 501)
+
+    def test_bot_plays_proven_threat_win(self):
+        """
+        Test that mode 3 plays a VCF at once, and that a VCT is only searched
+        first by the main search, since it is not a proven win.
+        """
+        self.place(
+            {
+                1: [(7, 5), (7, 6), (7, 7), (3, 8), (4, 8), (5, 8)],
+                2: [(7, 4), (2, 8), (0, 0), (14, 14), (0, 14), (14, 0)],
+            }
+        )
+        bot = MyBot("Bot", 1, 3, time_limit=0.5)
+        start = time.perf_counter()
+        move, proven = bot.threat_move(self.board, 1)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertTrue(proven)
+        self.assertEqual(bot.make_move(1, self.board, 3), move)
+        self.assertEqual(bot.stats.source, "threat")
+        bot = MyBot("Bot", 1, 3, time_limit=0.5, threat_nodes=0)
+        self.assertEqual(bot.threat_move(self.board, 1), (None, False))
+
+    def test_bot_searches_vct_first(self):
+        """
+        Test that a VCT move is returned as unproven and the search tries it
+        before any other root move.
+        """
+        self.place(
+            {
+                1: [(7, 5), (7, 6), (5, 7), (6, 7)],
+                2: [(3, 3), (11, 11), (3, 11), (11, 3)],
+            }
+        )
+        bot = MyBot("Bot", 1, 3, time_limit=None, max_depth=1)
+        self.assertEqual(bot.threat_move(self.board, 1), ((7, 7), False))
+        searched = []
+        minimax = bot.minimax
+
+        def record(board, player, maximizing, alpha, beta, depth):
+            if depth == 0 and not searched:
+                searched.append(board.move_stack[-1][:2])
+            return minimax(board, player, maximizing, alpha, beta, depth)
+
+        bot.minimax = record
+        bot.make_move(1, self.board, 3)
+        self.assertEqual(bot.stats.source, "search")
+        self.assertEqual(searched, [(7, 7)])
+
+    def test_bot_move_respects_time_limit(self):
+        """
+        Test that a mode 3 move running both the threat search and the main
+        search stays within one time limit.
+        """
+        self.place({1: [(7, 7), (6, 7), (9, 9)], 2: [(7, 8), (8, 8), (5, 6)]})
+        bot = MyBot("Bot", 1, 3, time_limit=0.4)
+        start = time.perf_counter()
+        bot.make_move(1, self.board, 3)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(bot.stats.source, "search")  # No forced win here
+        self.assertLess(elapsed, 0.4 + 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
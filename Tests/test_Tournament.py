@@ -0,0 +1,83 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Game import Game  # Import the Game class
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.Tournament import run_tournament, play_game  # Import the runner
+
+
+class TestTournament(unittest.TestCase):
+    """
+    Unit tests for the tournament runner.
+    """
+
+    def setUp(self):
+        """
+        Define a random bot and a blocking bot.
+        """
+        self.configs = [
+            {"name": "Easy", "mode": 1},
+            {"name": "Medium", "mode": 2},
+        ]
+
+    def test_results_add_up(self):
+        """
+        Test that every game is counted exactly once in the pairing results.
+        """
+        results = run_tournament(self.configs, 3, 3, 3, 20, processes=1, progress=False)
+        self.assertEqual(len(results), 1)  # One pairing for two bots
+        result = results[0]
+        self.assertEqual(result["games"], 20)
+        self.assertEqual(result["a_wins"] + result["b_wins"] + result["draws"], 20)
+        self.assertLessEqual(result["a_wins_as_first"], result["a_wins"])
+        self.assertGreaterEqual(result["mean_length"], 5)  # k moves of player 1
+
+    def test_colours_alternate(self):
+        """
+        Test that bot A moves first in even games and second in odd games.
+        """
+        task = (0, 0, self.configs[0], self.configs[1], 3, 3, 3, "numpy", 7)
+        self.assertTrue(play_game(task)[1])
+        task = (0, 1, self.configs[0], self.configs[1], 3, 3, 3, "numpy", 7)
+        self.assertFalse(play_game(task)[1])
+
+    def test_bots_are_closed(self):
+        """
+        Test that both bots of a game are closed once it ends, even when it
+        fails.
+        """
+        closed = []
+        close = MyBot.close
+        with patch.object(
+            MyBot, "close", lambda bot: closed.append(bot.name) or close(bot)
+        ):
+            task = (0, 0, self.configs[0], self.configs[1], 3, 3, 3, "numpy", 7)
+            play_game(task)
+            self.assertEqual(sorted(closed), ["Easy", "Medium"])
+            closed.clear()
+            with patch.object(Game, "play", side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    play_game(task)
+            self.assertEqual(sorted(closed), ["Easy", "Medium"])
+
+    def test_pool_matches_single_process(self):
+        """
+        Test that seeding per game makes a process pool reproduce the results
+        of playing in a single process.
+        """
+        single = run_tournament(
+            self.configs, 4, 4, 3, 12, processes=1, seed=5, progress=False
+        )
+        pooled = run_tournament(
+            self.configs, 4, 4, 3, 12, processes=2, seed=5, progress=False
+        )
+        self.assertEqual(single, pooled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import os
+import unittest
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.TranspositionTable import (
+    TranspositionTable,
+    EXACT,
+    LOWER_BOUND,
+)  # Import the class under test
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Unit tests for the TranspositionTable class.
+    """
+
+    def setUp(self):
+        """
+        Create a tiny table so that slot collisions are easy to provoke.
+        """
+        self.table = TranspositionTable(4)
+
+    def test_store_and_lookup(self):
+        """
+        Test that a stored entry is found again and counted as a hit.
+        """
+        self.table.store(5, 3, EXACT, 42, (0, 1))
+        self.assertEqual(self.table.lookup(5), (3, EXACT, 42, (0, 1)))
+        self.assertIsNone(self.table.lookup(6))  # Never stored
+        self.assertEqual(self.table.hits, 1)
+        self.assertEqual(self.table.misses, 1)
+
+    def test_collision_is_not_a_hit(self):
+        """
+        Test that a different position in the same slot is reported as collision.
+        """
+        self.table.store(1, 2, EXACT, 10, None)
+        self.assertIsNone(self.table.lookup(5))  # 5 % 4 == 1 % 4
+        self.assertEqual(self.table.collisions, 1)
+
+    def test_depth_preferred_replacement(self):
+        """
+        Test that a shallower result does not evict a deeper one of the same
+        search, but does once a new search has started.
+        """
+        self.table.store(1, 5, EXACT, 10, None)
+        self.table.store(5, 2, LOWER_BOUND, 20, None)
+        self.assertEqual(self.table.rejected, 1)
+        self.assertIsNotNone(self.table.lookup(1))
+
+        self.table.new_search()
+        self.table.store(5, 2, LOWER_BOUND, 20, None)
+        self.assertEqual(self.table.lookup(5), (2, LOWER_BOUND, 20, None))
+
+    def test_size_is_bounded(self):
+        """
+        Test that the number of stored entries never exceeds the size cap.
+        """
+        for key in range(100):
+            self.table.store(key, 1, EXACT, key, None)
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table.stats()["stores"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
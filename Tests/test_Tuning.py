@@ -0,0 +1,122 @@
+import sys
+import os
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+import numpy as np
+
+# Add the parent directory to sys.path to allow module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from Code.Dataset import PositionDataset  # Import the dataset export
+from Code.Evaluator import (
+    default_weights,
+    window_features,
+    WindowEvaluator,
+)  # Import the evaluation
+from Code.MyBot import MyBot  # Import MyBot class (AI player)
+from Code.Tuning import (
+    fit_scale,
+    main,
+    sigmoid,
+    texel_loss,
+    tune_dataset,
+    tune_weights,
+)  # Import the tuner under test
+
+
+class TestTuning(unittest.TestCase):
+    """
+    Unit tests for the Texel weight tuner.
+    """
+
+    def test_recovers_weights(self):
+        """
+        Test that tuning finds the weights that generated the results, starting
+        from the defaults.
+        """
+        rng = np.random.default_rng(0)
+        grids = rng.integers(0, 3, size=(3000, 5, 5))
+        grids *= rng.random((3000, 5, 5)) < 0.4
+        features = window_features(grids, 4)
+        features = features[features[:, 4] == 0, :4]
+        true_weights = np.array([20.0, 1.0, 8.0, 60.0])
+        targets = sigmoid(0.01 * features @ true_weights)
+
+        start = default_weights(4)
+        scale = fit_scale(features @ true_weights, targets)
+        self.assertAlmostEqual(scale, 0.01, delta=0.0005)  # Grid resolution
+        weights, losses = tune_weights(features, targets, start, 0.01)
+        self.assertLess(losses[-1], losses[0] / 1000)
+        self.assertEqual(losses, sorted(losses, reverse=True))
+        np.testing.assert_allclose(weights, true_weights, rtol=0.01)
+        self.assertAlmostEqual(
+            texel_loss(features @ np.array(weights), targets, 0.01), losses[-1]
+        )
+
+    def write_dataset(self, directory):
+        """
+        Exports a dataset of won and drawn 3x3 games.
+
+        :param directory: The dataset directory.
+        :return: The closed PositionDataset.
+        """
+        games = [
+            ([(1, 1, 1), (0, 0, 2), (0, 1, 1), (2, 2, 2), (2, 1, 1)], 1),
+            ([(0, 0, 1), (1, 1, 2), (0, 1, 1), (0, 2, 2), (2, 2, 1), (2, 0, 2)], 2),
+            ([(1, 1, 1), (0, 0, 2), (2, 2, 1), (0, 2, 2), (0, 1, 1), (2, 1, 2)], 0),
+        ]
+        with PositionDataset(directory, 3, 3, 3, 100) as dataset:
+            for moves, result in games:
+                dataset.add_game(moves, result)
+        return dataset
+
+    def test_tune_dataset(self):
+        """
+        Test tuning on an exported dataset of won and drawn 3x3 games.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            dataset = self.write_dataset(directory)
+            result = tune_dataset(directory, validation=0)
+        self.assertEqual((result["rows"], result["cols"], result["k"]), (3, 3, 3))
+        self.assertEqual(len(result["weights"]), 3)
+        self.assertEqual(result["positions"], dataset.count)
+        self.assertLessEqual(result["train_loss"][1], result["train_loss"][0])
+        self.assertIsNone(result["validation_loss"])
+
+    def test_bot_loads_tuned_profile(self):
+        """
+        Test that a bot built without arguments evaluates with the profile the
+        tuner wrote to the default location, and that False turns it off.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_dataset(os.path.join(directory, "dataset"))
+            profiles = os.path.join(directory, "Weights")
+            with (
+                patch(
+                    "Code.Evaluator.default_profile_directory", return_value=profiles
+                ),
+                patch("Code.MyBot.default_profile_directory", return_value=profiles),
+            ):
+                argv = ["Tuning.py", "--dataset", os.path.join(directory, "dataset")]
+                with patch("sys.argv", argv), redirect_stdout(io.StringIO()):
+                    main()
+                bot = MyBot("Bot", 1, 3)
+                untuned = MyBot("Bot", 1, 3, weight_profiles=False)
+            with open(os.path.join(profiles, "weights_3x3x3.json")) as file:
+                weights = tuple(json.load(file)["weights"])
+        self.assertNotEqual(weights, default_weights(3))
+        self.assertEqual(bot.board_weights(3, 3, 3), weights)
+        self.assertIsNone(untuned.board_weights(3, 3, 3))
+        grid = np.array([[1, 0, 0], [0, 1, 2], [0, 0, 0]])
+        self.assertAlmostEqual(
+            bot.evaluate_boards(grid[None], 3, 1)[0],
+            WindowEvaluator(3, 3, 3, weights).load(grid).score(1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()